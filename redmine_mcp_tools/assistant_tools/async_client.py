@@ -0,0 +1,120 @@
+"""
+Asyncio execution engine for RedmineIssueTool.
+
+AsyncRedmineClient exposes `_make_request` and every action method of a
+RedmineIssueTool as coroutines. Blocking Redmine round trips run on a
+shared, bounded thread pool over the pooled HTTP session, so a single
+event loop can keep many Redmine calls in flight at once. asyncio itself
+is imported on the first call.
+
+There is deliberately no native async HTTP transport: every call goes
+through the same requests session, HTTP cache, singleflight and rate
+limiter as the sync path. As a result, at most REDMINE_ASYNC_WORKERS
+(default 16) calls per process are in flight, and further coroutines wait
+for a free worker.
+"""
+
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from redmine_mcp_tools.assistant_tools.http_client import env_int
+from redmine_mcp_tools.assistant_tools.tracing import run_profiled
+
+ISSUE_TOOL_ACTIONS = (
+    "list_projects",
+    "list_issues",
+    "get_issue",
+    "create_issue",
+    "update_issue",
+    "search_issues",
+    "search_projects",
+    "add_note_to_issue",
+    "change_issue_status",
+    "assign_issue",
+    "get_issue_categories",
+    "get_issue_priorities",
+    "get_issue_statuses",
+    "issue_lifecycle",
+    "time_report",
+    "batch",
+)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Process-wide pool that caps how many Redmine calls are in flight"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=env_int("REDMINE_ASYNC_WORKERS", 16),
+                    thread_name_prefix="redmine-async",
+                )
+    return _executor
+
+
+async def run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking call on the shared pool.
+
+    The caller's context is copied into the worker thread (like
+    asyncio.to_thread) so frappe.local stays visible for error logging,
+    and an active cpu profile follows the call.
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, run_profiled, func, *args, **kwargs)
+    return await loop.run_in_executor(get_executor(), call)
+
+
+def bind_context(func: Callable) -> Callable:
+    """Bind `func` to the caller's context for use with plain thread pools.
+
+    Each call runs in its own copy of that context, so concurrent calls can
+    share it and still see frappe.local and per-call metrics.
+    """
+    ctx = contextvars.copy_context()
+    return lambda *args, **kwargs: ctx.copy().run(run_profiled, func, *args, **kwargs)
+
+
+class AsyncRedmineClient:
+    """Coroutine mirror of a RedmineIssueTool's request and action methods"""
+
+    def __init__(self, tool):
+        self.tool = tool
+
+    async def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        return await run_blocking(self.tool._make_request, method, endpoint, **kwargs)
+
+    async def call(self, action: str, **kwargs) -> Dict[str, Any]:
+        """Run a tool action by name without blocking the event loop"""
+        return await run_blocking(getattr(self.tool, action), **kwargs)
+
+    async def gather(self, *calls: Dict[str, Any]) -> list:
+        """Run several `{"action": ..., **args}` calls concurrently"""
+        import asyncio
+
+        return await asyncio.gather(*(
+            self.call(c["action"], **{k: v for k, v in c.items() if k != "action"})
+            for c in calls
+        ))
+
+
+def _make_async_action(action: str):
+    async def method(self, **kwargs) -> Dict[str, Any]:
+        return await self.call(action, **kwargs)
+
+    method.__name__ = action
+    method.__doc__ = f"Async mirror of RedmineIssueTool.{action}"
+    return method
+
+
+for _action in ISSUE_TOOL_ACTIONS:
+    setattr(AsyncRedmineClient, _action, _make_async_action(_action))
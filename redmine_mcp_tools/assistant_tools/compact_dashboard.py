@@ -0,0 +1,157 @@
+"""
+Compact render mode for RedmineDashboardTool.
+
+Instead of repeating inline styles on every cell and a full Chart.js
+config per assignee, the compact page carries one JSON blob with per-user
+issue tuples and aggregates, a handful of CSS classes and a single script
+that builds every section, table and chart in the browser. The page looks
+the same as the standard dashboard at a fraction of the size.
+"""
+
+import json
+from collections import defaultdict
+from datetime import date
+from typing import Dict, List
+
+COMPACT_SCRIPT = """
+(function () {
+    var D = JSON.parse(document.getElementById('rd-data').textContent);
+    var root = document.getElementById('rd-root');
+    var PRIORITY_BG = ['#ff4757', '#2ed573', '#1e90ff', '#ffa502', '#9b59b6'];
+    var STATUS_BG = ['#a4b0be', '#ffa502', '#3742fa', '#2ed573', '#9b59b6', '#e67e22', '#7f8c8d'];
+    var GRID = { color: 'rgba(255, 255, 255, 0.1)' };
+    function el(tag, cls, text) {
+        var e = document.createElement(tag);
+        if (cls) e.className = cls;
+        if (text !== undefined) e.textContent = text;
+        return e;
+    }
+    function title(text) {
+        return { display: true, text: text, color: '#ffffff', font: { size: 14 } };
+    }
+    function dataset(label, values, colors) {
+        return [{ label: label, data: values, backgroundColor: colors,
+                  borderColor: 'rgba(255, 255, 255, 0.2)', borderWidth: 1 }];
+    }
+    D.users.forEach(function (u) {
+        var section = el('div', 'user-section');
+        section.appendChild(el('h2', 'user-title', u.name));
+        var charts = el('div', 'chart-container');
+        var canvases = [el('canvas'), el('canvas')];
+        canvases.forEach(function (c) {
+            var box = el('div', 'chart-box');
+            box.appendChild(c);
+            charts.appendChild(box);
+        });
+        section.appendChild(charts);
+        section.appendChild(el('h3', 'table-title', 'Ticket Summary'));
+        var container = el('div', 'table-container');
+        var table = el('table', 'issue-table');
+        var head = el('tr');
+        ['ID', 'Subject', 'Priority', 'Status'].forEach(function (h) { head.appendChild(el('th', null, h)); });
+        table.appendChild(el('thead')).appendChild(head);
+        var body = el('tbody');
+        u.issues.forEach(function (r, i) {
+            var tr = el('tr', 'r' + (i % 2));
+            tr.appendChild(el('td', null, String(r[0])));
+            tr.appendChild(el('td', null, r[1]));
+            tr.appendChild(el('td', 'pp' + r[2], D.priorities[r[2]]));
+            tr.appendChild(el('td', 'ps' + r[3], D.statuses[r[3]] + (r[4] ? ' (Overdue)' : '')));
+            body.appendChild(tr);
+        });
+        table.appendChild(body);
+        container.appendChild(table);
+        section.appendChild(container);
+        root.appendChild(section);
+        new Chart(canvases[0].getContext('2d'), {
+            type: 'bar',
+            data: { labels: u.p[0], datasets: dataset('Priority Count', u.p[1], PRIORITY_BG) },
+            options: {
+                responsive: true, maintainAspectRatio: false,
+                plugins: { legend: { display: false }, title: title('Priority Distribution') },
+                scales: {
+                    x: { grid: GRID, ticks: { color: '#ffffff' } },
+                    y: { grid: GRID, ticks: { color: '#ffffff', precision: 0 }, beginAtZero: true }
+                }
+            }
+        });
+        new Chart(canvases[1].getContext('2d'), {
+            type: 'doughnut',
+            data: { labels: u.s[0], datasets: dataset('Status Distribution', u.s[1], STATUS_BG) },
+            options: {
+                responsive: true, maintainAspectRatio: false,
+                plugins: { legend: { position: 'right', labels: { color: '#ffffff' } },
+                           title: title('Status Distribution') },
+                cutout: '65%'
+            }
+        });
+    });
+})();
+"""
+
+# Reproduces the per-cell inline styles of the standard dashboard
+BASE_STYLES = (
+    ".issue-table tbody td{padding:12px;border-bottom:1px solid rgba(255,255,255,0.1)}"
+    ".issue-table tr.r0{background-color:rgba(255, 255, 255, 0.1)}"
+    ".issue-table tr.r1{background-color:rgba(255, 255, 255, 0.05)}"
+)
+
+
+class _Codes:
+    """Assigns small integer codes to repeated names"""
+
+    def __init__(self):
+        self.index: Dict[str, int] = {}
+        self.names: List[str] = []
+
+    def code(self, name: str) -> int:
+        if name not in self.index:
+            self.index[name] = len(self.names)
+            self.names.append(name)
+        return self.index[name]
+
+
+def render_compact_body(users_issues: Dict[str, List[dict]], priority_colors: Dict[str, str],
+                        status_colors: Dict[str, str], default_priority_color: str,
+                        default_status_color: str) -> str:
+    """Stylesheet, data blob and bootstrap script for all user sections"""
+    today = date.today().isoformat()
+    priorities, statuses = _Codes(), _Codes()
+    users = []
+    for user, user_issues in users_issues.items():
+        priority_count = defaultdict(int)
+        status_count = defaultdict(int)
+        rows = []
+        for issue in user_issues:
+            priority = issue.get("priority", {}).get("name") or "Normal"
+            status = issue.get("status", {}).get("name") or "Open"
+            priority_count[priority] += 1
+            status_count[status] += 1
+            due_date = issue.get("due_date")
+            # ISO dates compare correctly as strings
+            overdue = 1 if due_date and due_date < today else 0
+            rows.append([issue["id"], issue["subject"], priorities.code(priority), statuses.code(status), overdue])
+        users.append({
+            "name": user,
+            "issues": rows,
+            "p": [list(priority_count.keys()), list(priority_count.values())],
+            "s": [list(status_count.keys()), list(status_count.values())],
+        })
+
+    styles = [BASE_STYLES]
+    for i, name in enumerate(priorities.names):
+        styles.append(f".pp{i}{{background-color:{priority_colors.get(name.lower(), default_priority_color)}}}")
+    for i, name in enumerate(statuses.names):
+        styles.append(f".ps{i}{{background-color:{status_colors.get(name, default_status_color)}}}")
+
+    data = json.dumps(
+        {"priorities": priorities.names, "statuses": statuses.names, "users": users},
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).replace("</", "<\\/")
+    return (
+        f"<style>{''.join(styles)}</style>"
+        f'<div id="rd-root"></div>'
+        f'<script type="application/json" id="rd-data">{data}</script>'
+        f"<script>{COMPACT_SCRIPT}</script>"
+    )
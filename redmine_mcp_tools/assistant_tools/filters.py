@@ -0,0 +1,191 @@
+"""
+Structured issue filters compiled to Redmine query parameters.
+
+Lets the dashboard and the list/search actions push filtering down to
+Redmine instead of downloading everything and filtering locally.
+
+Accepted filter keys (object form):
+
+    status       "open" | "closed" | "all" | id | name | [ids/names]
+    assignee     "me" | "none" | id | name | [ids/names]
+    tracker      id | name | [ids/names]
+    priority     id | name | [ids/names]
+    created      {"from": date, "to": date} | {"last_days": N}
+    updated      same as created
+    due          same as created
+    custom_fields {"<custom field id>": value}
+    query_id     id of a saved Redmine query
+
+A string such as "status=closed, priority=high, updated_last_days=10" is
+also accepted.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+# lookup(kind, name) -> id, where kind is "status", "priority", "tracker" or "assignee"
+Lookup = Callable[[str, str], Optional[int]]
+
+DATE_FIELDS = {"created": "created_on", "updated": "updated_on", "due": "due_date"}
+ID_FIELDS = {"tracker": "tracker_id", "priority": "priority_id"}
+_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+
+def _as_list(value: Any) -> List[Any]:
+    if isinstance(value, (list, tuple, set)):
+        return list(value)
+    return [value]
+
+
+def _resolve_ids(kind: str, value: Any, lookup: Optional[Lookup]) -> str:
+    ids = []
+    for item in _as_list(value):
+        if isinstance(item, int) or str(item).isdigit():
+            ids.append(str(int(item)))
+            continue
+        resolved = lookup(kind, str(item)) if lookup else None
+        if resolved is None:
+            raise ValueError(f"Unknown {kind}: {item}")
+        ids.append(str(resolved))
+    return "|".join(ids)
+
+
+def _status_value(value: Any, lookup: Optional[Lookup]) -> str:
+    if isinstance(value, str) and value.lower() in ("open", "o"):
+        return "open"
+    if isinstance(value, str) and value.lower() in ("closed", "c"):
+        return "closed"
+    if isinstance(value, str) and value.lower() in ("all", "any", "*"):
+        return "*"
+    return _resolve_ids("status", value, lookup)
+
+
+def _assignee_value(value: Any, lookup: Optional[Lookup]) -> str:
+    if isinstance(value, str) and value.lower() == "me":
+        return "me"
+    if isinstance(value, str) and value.lower() in ("none", "unassigned"):
+        return "!*"
+    return _resolve_ids("assignee", value, lookup)
+
+
+def _date_value(value: Any) -> str:
+    if isinstance(value, (int, float)) or (isinstance(value, str) and value.isdigit()):
+        return f"><t-{int(value)}"
+    if not isinstance(value, dict):
+        raise ValueError(f"Invalid date range: {value}")
+    if "last_days" in value:
+        return f"><t-{int(value['last_days'])}"
+    start, end = value.get("from"), value.get("to")
+    for date in (start, end):
+        if date and not _DATE.match(str(date)):
+            raise ValueError(f"Dates must be YYYY-MM-DD: {date}")
+    if start and end:
+        return f"><{start}|{end}"
+    if start:
+        return f">={start}"
+    if end:
+        return f"<={end}"
+    raise ValueError(f"Invalid date range: {value}")
+
+
+def parse_filter_string(text: str) -> Dict[str, Any]:
+    """Parse "key=value" pairs separated by commas, semicolons or '&'"""
+    parsed: Dict[str, Any] = {}
+    for part in re.split(r"[,;&]", text or ""):
+        if not part.strip():
+            continue
+        if "=" not in part:
+            raise ValueError(f"Invalid filter term: {part.strip()}")
+        key, value = (p.strip() for p in part.split("=", 1))
+        key = key.lower()
+        for prefix in DATE_FIELDS:
+            if key == f"{prefix}_last_days":
+                parsed[prefix] = {"last_days": int(value)}
+                break
+            if key in (f"{prefix}_from", f"{prefix}_to"):
+                parsed.setdefault(prefix, {})[key.rsplit("_", 1)[1]] = value
+                break
+        else:
+            parsed[key] = value.split("|") if "|" in value else value
+    return parsed
+
+
+def compile_filter(filter_value: Union[str, Dict[str, Any], None],
+                   lookup: Optional[Lookup] = None) -> List[Tuple[str, str]]:
+    """Compile a filter to (parameter, value) pairs for /issues.json"""
+    if not filter_value:
+        return []
+    spec = parse_filter_string(filter_value) if isinstance(filter_value, str) else dict(filter_value)
+
+    params: List[Tuple[str, str]] = []
+    for key, value in spec.items():
+        if value is None or value == "":
+            continue
+        if key == "status":
+            params.append(("status_id", _status_value(value, lookup)))
+        elif key == "assignee":
+            params.append(("assigned_to_id", _assignee_value(value, lookup)))
+        elif key in ID_FIELDS:
+            params.append((ID_FIELDS[key], _resolve_ids(key, value, lookup)))
+        elif key in DATE_FIELDS:
+            params.append((DATE_FIELDS[key], _date_value(value)))
+        elif key == "custom_fields":
+            if not isinstance(value, dict):
+                raise ValueError(f'custom_fields must be an object like {{"<custom field id>": value}}, got: {value!r}')
+            for field_id, field_value in value.items():
+                if not str(field_id).strip().isdigit():
+                    raise ValueError(f"Custom field ids must be numeric: {field_id}")
+                params.append((f"cf_{int(field_id)}", "|".join(str(v) for v in _as_list(field_value))))
+        elif key == "query_id":
+            params.append(("query_id", str(int(value))))
+        else:
+            raise ValueError(f"Unsupported filter: {key}")
+    return params
+
+
+def make_lookup(fetch: Callable[[str], Dict[str, Any]], project_id: Optional[Any] = None,
+                shared: Optional[Dict[str, Dict[str, int]]] = None) -> Lookup:
+    """Name -> id resolver backed by Redmine reference endpoints (memoized per call).
+
+    `shared` lets lookups for several projects reuse the status, priority
+    and tracker tables; assignees are always resolved per project.
+    """
+    shared = {} if shared is None else shared
+    members: Dict[str, Dict[str, int]] = {}
+
+    def load(kind: str) -> Dict[str, int]:
+        if kind == "status":
+            items = fetch("/issue_statuses.json").get("issue_statuses", [])
+        elif kind == "priority":
+            items = fetch("/enumerations/issue_priorities.json").get("issue_priorities", [])
+        elif kind == "tracker":
+            items = fetch("/trackers.json").get("trackers", [])
+        elif project_id:
+            items, offset = [], 0
+            while True:
+                data = fetch(f"/projects/{project_id}/memberships.json?limit=100&offset={offset}")
+                memberships = data.get("memberships", [])
+                items += [m.get("user") or m.get("group") for m in memberships if m.get("user") or m.get("group")]
+                if not memberships or offset + 100 >= data.get("total_count", 0):
+                    break
+                offset += 100
+        else:
+            items = []
+        return {item["name"].casefold(): item["id"] for item in items}
+
+    def lookup(kind: str, name: str) -> Optional[int]:
+        tables = members if kind == "assignee" else shared
+        if kind not in tables:
+            tables[kind] = load(kind)
+        return tables[kind].get(name.casefold())
+
+    return lookup
+
+
+def to_query(params: List[Tuple[str, str]]) -> str:
+    return urlencode(params)
+
+
+def without(params: List[Tuple[str, str]], *names: str) -> List[Tuple[str, str]]:
+    return [(k, v) for k, v in params if k not in names]
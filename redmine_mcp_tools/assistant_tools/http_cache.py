@@ -0,0 +1,178 @@
+"""
+Persistent HTTP cache for Redmine reference-data GETs.
+
+Response bodies are stored in a small SQLite file together with their
+ETag / Last-Modified validators. Within an endpoint's freshness window the
+cached body is served without touching Redmine; after that the request is
+revalidated with If-None-Match / If-Modified-Since, so unchanged data only
+costs a 304. The file survives worker restarts and is shared by every
+worker on the bench; total size is bounded with LRU eviction. Hits refresh
+an entry's access time at most once per TOUCH_INTERVAL, so the hot read
+path rarely takes SQLite's write lock.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Dict, NamedTuple, Optional
+
+import frappe
+
+from redmine_mcp_tools.assistant_tools.http_client import env_flag, env_int
+
+# (endpoint pattern, freshness in seconds). Only matching GETs are cached.
+FRESHNESS_RULES = (
+    (re.compile(r"^/issue_statuses\.json"), 3600),
+    (re.compile(r"^/enumerations/issue_priorities\.json"), 3600),
+    (re.compile(r"^/trackers\.json"), 3600),
+    (re.compile(r"^/projects/[^/]+/issue_categories\.json"), 600),
+    (re.compile(r"^/projects\.json"), 300),
+)
+
+# Seconds between access-time updates of one entry; LRU order is this coarse
+TOUCH_INTERVAL = 60
+
+
+class CacheEntry(NamedTuple):
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+    max_age: int
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() - self.stored_at < self.max_age
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def freshness_for(endpoint: str) -> Optional[int]:
+    """Return the freshness window for an endpoint, or None if it is not cacheable"""
+    for pattern, max_age in FRESHNESS_RULES:
+        if pattern.match(endpoint):
+            return max_age
+    return None
+
+
+class HttpCache:
+    """Size-bounded LRU store of response bodies and their validators"""
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = None
+        self._conn_pid = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS http_cache (
+                    key TEXT PRIMARY KEY,
+                    body BLOB NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )"""
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS http_cache_lru ON http_cache (accessed_at)")
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    @staticmethod
+    def make_key(url: str, api_key: str) -> str:
+        # Responses differ per credential, so the key is part of the cache key
+        credential = hashlib.sha256((api_key or "").encode()).hexdigest()[:16]
+        return f"{credential}:{url}"
+
+    def get(self, key: str, max_age: int) -> Optional[CacheEntry]:
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT body, etag, last_modified, stored_at, accessed_at FROM http_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if not row:
+                return None
+            now = time.time()
+            if now - row[4] >= TOUCH_INTERVAL:
+                conn.execute("UPDATE http_cache SET accessed_at = ? WHERE key = ?", (now, key))
+                conn.commit()
+        return CacheEntry(row[0], row[1], row[2], row[3], max_age)
+
+    def put(self, key: str, body: bytes, etag: Optional[str], last_modified: Optional[str]) -> None:
+        if len(body) > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO http_cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, body, etag, last_modified, now, now, len(body)),
+            )
+            self._evict(conn)
+            conn.commit()
+
+    def revalidated(self, key: str) -> None:
+        """Mark an entry fresh again after a 304"""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute("UPDATE http_cache SET stored_at = ?, accessed_at = ? WHERE key = ?", (now, now, key))
+            conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM http_cache")
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in conn.execute("SELECT key, size FROM http_cache ORDER BY accessed_at").fetchall():
+            conn.execute("DELETE FROM http_cache WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def _default_path() -> str:
+    path = os.getenv("REDMINE_HTTP_CACHE_PATH")
+    if path:
+        return path
+    if getattr(frappe.local, "site", None):
+        return frappe.get_site_path("private", "redmine_http_cache.sqlite3")
+    return os.path.join(tempfile.gettempdir(), "redmine_http_cache.sqlite3")
+
+
+def get_http_cache() -> Optional[HttpCache]:
+    """Return the shared cache, or None when disabled via REDMINE_HTTP_CACHE=0"""
+    global _cache
+    if not env_flag("REDMINE_HTTP_CACHE", True):
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = HttpCache(_default_path(), env_int("REDMINE_HTTP_CACHE_MAX_BYTES", 50 * 1024 * 1024))
+    return _cache
@@ -0,0 +1,167 @@
+"""
+Shared HTTP transport for the Redmine tools.
+
+Every Redmine call made by RedmineIssueTool and RedmineDashboardTool goes
+through one pooled, keep-alive requests.Session per process, so repeated
+actions reuse open TCP/TLS connections instead of handshaking each time.
+Requests are admitted by the adaptive limiter in rate_limiter.py.
+
+requests/urllib3 are imported when the first session is built, and `.env`
+is read on the first setting lookup, so importing the tools stays cheap.
+"""
+
+import os
+import threading
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    import requests
+    from urllib3.util.retry import Retry
+
+# Status codes that are worth retrying with backoff
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+# Methods replayed after a read error or a retryable status. PUT is left out:
+# Redmine appends a journal on every PUT, so a replayed note is posted twice.
+RETRY_METHODS = frozenset({"GET", "HEAD"})
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+_env_loaded = False
+_env_lock = threading.Lock()
+
+
+def load_env() -> None:
+    """Load the app's .env into the environment once per process"""
+    global _env_loaded
+    if _env_loaded:
+        return
+    with _env_lock:
+        if not _env_loaded:
+            from dotenv import load_dotenv
+
+            load_dotenv()
+            _env_loaded = True
+
+
+class EnvSetting:
+    """Class attribute read from the environment on access (after .env is loaded).
+
+    Assigning it on an instance overrides the value for that instance only.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __set_name__(self, owner, attr: str) -> None:
+        self.attr = attr
+
+    def __get__(self, instance, owner) -> Optional[str]:
+        if instance is not None and self.attr in instance.__dict__:
+            return instance.__dict__[self.attr]
+        load_env()
+        return os.getenv(self.name)
+
+    def __set__(self, instance, value: Any) -> None:
+        instance.__dict__[self.attr] = value
+
+
+def env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment"""
+    load_env()
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def env_flag(name: str, default: bool) -> bool:
+    """Read an on/off setting; only "0"/"false" turn off a default-on flag and "1"/"true" turn on a default-off one"""
+    load_env()
+    value = os.getenv(name)
+    if value is None:
+        return default
+    if default:
+        return value not in ("0", "false", "False")
+    return value in ("1", "true", "True")
+
+
+def env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment"""
+    load_env()
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _build_retry() -> "Retry":
+    """Bounded retry with jittered exponential backoff on transient errors"""
+    # Imported here: rate_limiter reads its settings through env_int/env_float
+    from redmine_mcp_tools.assistant_tools.rate_limiter import LimitedRetry
+
+    max_retries = env_int("REDMINE_MAX_RETRIES", 3)
+    return LimitedRetry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=max_retries,
+        backoff_factor=env_float("REDMINE_BACKOFF_FACTOR", 0.5),
+        backoff_jitter=env_float("REDMINE_BACKOFF_JITTER", 0.5),
+        backoff_max=env_float("REDMINE_BACKOFF_MAX", 10),
+        status_forcelist=RETRY_STATUS_CODES,
+        # Writes are only retried on connection errors, i.e. before anything was sent
+        allowed_methods=RETRY_METHODS,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+def _build_session() -> "requests.Session":
+    import requests
+
+    from redmine_mcp_tools.assistant_tools.rate_limiter import LimitedAdapter
+
+    pool_size = env_int("REDMINE_POOL_SIZE", 10)
+    adapter = LimitedAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=_build_retry(),
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        "Content-Type": "application/json",
+        "Accept": "application/json",
+        "Connection": "keep-alive",
+    })
+    return session
+
+
+def get_session() -> "requests.Session":
+    """Return the process-wide pooled session, creating it on first use.
+
+    The session is rebuilt after a fork so worker processes never share
+    sockets with their parent.
+    """
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session is not None and _session_pid == pid:
+        return _session
+    with _session_lock:
+        if _session is None or _session_pid != pid:
+            _session = _build_session()
+            _session_pid = pid
+    return _session
+
+
+def reset_session() -> None:
+    """Close and drop the shared session (e.g. after config changes)"""
+    global _session, _session_pid
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+        _session_pid = None
@@ -0,0 +1,265 @@
+"""
+Issue lifecycle analytics from Redmine journals.
+
+Each issue's status history is read from the `status_id` details of its
+journals (`/issues/:id.json?include=journals`) and replayed from
+created_on to now:
+
+* dwell time   - time spent in each status, ongoing visits counted up to now
+* lead time    - created_on to the final close
+* cycle time   - first status change to the final close
+* reopens      - transitions from a closed status to an open one
+
+Figures are grouped for the whole project and per current assignee.
+
+Journals are append-only, so the extracted history is kept in a SQLite
+file keyed by issue and `updated_on`. A repeat run only fetches journals
+for issues whose updated_on moved since they were stored; unchanged
+issues cost nothing beyond the issue listing. Set REDMINE_JOURNAL_CACHE=0
+to fetch every time.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import frappe
+
+from redmine_mcp_tools.assistant_tools.http_client import env_flag
+
+# [created_on, old status id, new status id] per status change, oldest first
+History = List[list]
+
+DAY = 86400.0
+
+
+def status_history(journals: Iterable[dict]) -> History:
+    """Status changes recorded in an issue's journals"""
+    history = []
+    for journal in journals:
+        for detail in journal.get("details") or []:
+            if detail.get("property") == "attr" and detail.get("name") == "status_id":
+                history.append([journal.get("created_on"), _status_id(detail.get("old_value")),
+                                _status_id(detail.get("new_value"))])
+    history.sort(key=lambda change: change[0] or "")
+    return history
+
+
+def _status_id(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class JournalCache:
+    """Status histories by (credentials, issue id), valid while updated_on is unchanged"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = None
+        self._conn_pid = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS status_history (
+                    scope TEXT NOT NULL,
+                    issue_id INTEGER NOT NULL,
+                    updated_on TEXT,
+                    history TEXT NOT NULL,
+                    PRIMARY KEY (scope, issue_id)
+                )"""
+            )
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def lookup(self, scope: str, issues: Dict[int, Optional[str]]) -> Dict[int, History]:
+        """Stored histories for the issues (id -> updated_on) that have not changed since"""
+        found = {}
+        ids = list(issues)
+        with self._lock:
+            conn = self._connection()
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT issue_id, updated_on, history FROM status_history "
+                    f"WHERE scope = ? AND issue_id IN ({','.join('?' * len(chunk))})",
+                    [scope, *chunk]
+                ).fetchall()
+                for issue_id, updated_on, history in rows:
+                    if updated_on == issues[issue_id]:
+                        found[issue_id] = json.loads(history)
+        return found
+
+    def store(self, scope: str, rows: List[tuple]) -> None:
+        """Save (issue id, updated_on, history) rows"""
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO status_history VALUES (?, ?, ?, ?)",
+                [(scope, issue_id, updated_on, json.dumps(history)) for issue_id, updated_on, history in rows]
+            )
+            conn.commit()
+
+
+def cache_scope(api_url: str, api_key: str) -> str:
+    """Journal visibility depends on the API user, so histories are kept per credential"""
+    return hashlib.sha256(f"{api_url}|{api_key or ''}".encode("utf-8")).hexdigest()[:16]
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def _default_path() -> str:
+    path = os.getenv("REDMINE_JOURNAL_CACHE_PATH")
+    if path:
+        return path
+    if getattr(frappe.local, "site", None):
+        return frappe.get_site_path("private", "redmine_journal_cache.sqlite3")
+    return os.path.join(tempfile.gettempdir(), "redmine_journal_cache.sqlite3")
+
+
+def get_journal_cache() -> Optional[JournalCache]:
+    """Return the shared journal cache, or None when disabled via REDMINE_JOURNAL_CACHE=0"""
+    global _cache
+    if not env_flag("REDMINE_JOURNAL_CACHE", True):
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = JournalCache(_default_path())
+    return _cache
+
+
+class _Durations:
+    __slots__ = ("values",)
+
+    def __init__(self):
+        self.values: List[float] = []
+
+    def add(self, seconds: float) -> None:
+        self.values.append(max(0.0, seconds) / DAY)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        if not self.values:
+            return None
+        ordered = sorted(self.values)
+        return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 2)
+
+    def total(self) -> float:
+        return round(sum(self.values), 2)
+
+    def mean(self) -> Optional[float]:
+        return round(sum(self.values) / len(self.values), 2) if self.values else None
+
+
+class _Group:
+    __slots__ = ("issues", "closed", "reopened", "reopens", "lead", "cycle", "dwell")
+
+    def __init__(self):
+        self.issues = 0
+        self.closed = 0
+        self.reopened = 0
+        self.reopens = 0
+        self.lead = _Durations()
+        self.cycle = _Durations()
+        self.dwell: Dict[int, _Durations] = defaultdict(_Durations)
+
+
+def analyze(issues: Iterable[dict], histories: Dict[int, History], statuses: List[dict],
+            now: Optional[datetime] = None) -> Dict[str, Any]:
+    """Dwell, flow and reopen tables for issues with a known status history.
+
+    `statuses` is Redmine's /issue_statuses.json list; it supplies names,
+    closed flags and the row order of the dwell table.
+    """
+    now = now or datetime.now(timezone.utc)
+    names = {s["id"]: s["name"] for s in statuses}
+    closed: Set[int] = {s["id"] for s in statuses if s.get("is_closed")}
+    order = {s["id"]: i for i, s in enumerate(statuses)}
+    groups: Dict[tuple, _Group] = defaultdict(_Group)
+
+    for issue in issues:
+        history = histories.get(issue["id"])
+        created = _parse_time(issue.get("created_on"))
+        if history is None or created is None:
+            continue
+        current = (issue.get("status") or {}).get("id")
+        names.setdefault(current, (issue.get("status") or {}).get("name"))
+        targets = [
+            groups[("project", (issue.get("project") or {}).get("name") or "")],
+            groups[("assignee", (issue.get("assigned_to") or {}).get("name") or "Unassigned")],
+        ]
+
+        status = history[0][1] if history and history[0][1] is not None else current
+        started = created
+        reopens = 0
+        for changed_on, old, new in history:
+            at = _parse_time(changed_on) or started
+            for group in targets:
+                group.dwell[status].add((at - started).total_seconds())
+            if status in closed and new not in closed:
+                reopens += 1
+            status, started = new, at
+
+        is_closed = status in closed
+        if not is_closed:
+            for group in targets:
+                group.dwell[status].add((now - started).total_seconds())
+        closed_at = (started if history else _parse_time(issue.get("closed_on"))) if is_closed else None
+        for group in targets:
+            group.issues += 1
+            group.reopens += reopens
+            group.reopened += bool(reopens)
+            if closed_at is not None:
+                group.closed += 1
+                group.lead.add((closed_at - created).total_seconds())
+                if history:
+                    group.cycle.add((closed_at - (_parse_time(history[0][0]) or created)).total_seconds())
+
+    ordered = sorted(groups.items(), key=lambda item: (item[0][0] != "project", item[0][1]))
+    dwell_rows, flow_rows = [], []
+    for (scope, name), group in ordered:
+        for status_id in sorted(group.dwell, key=lambda s: (order.get(s, len(order)), s or 0)):
+            durations = group.dwell[status_id]
+            dwell_rows.append([
+                scope, name, names.get(status_id) or f"#{status_id}", len(durations.values),
+                durations.total(), durations.mean(), durations.percentile(0.5), durations.percentile(0.9),
+            ])
+        flow_rows.append([
+            scope, name, group.issues, group.closed, group.reopened, group.reopens,
+            group.lead.percentile(0.5), group.lead.percentile(0.9),
+            group.cycle.percentile(0.5), group.cycle.percentile(0.9),
+        ])
+    return {
+        "dwell": {
+            "columns": ["scope", "name", "status", "visits", "total_days", "mean_days", "median_days", "p90_days"],
+            "rows": dwell_rows,
+        },
+        "flow": {
+            "columns": ["scope", "name", "issues", "closed", "reopened_issues", "reopens",
+                        "lead_median_days", "lead_p90_days", "cycle_median_days", "cycle_p90_days"],
+            "rows": flow_rows,
+        },
+    }
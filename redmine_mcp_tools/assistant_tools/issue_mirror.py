@@ -0,0 +1,293 @@
+"""
+Optional local SQLite mirror of Redmine issues.
+
+The first sync of a project bulk-loads every issue (open and closed) on a
+background thread; reads keep going to Redmine until it has finished. Its
+watermark is the newest `updated_on` Redmine reported just before the load,
+so edits made while pages were being read are pulled by the next sync.
+Later syncs only pull issues with `updated_on` at or after the watermark.
+Whenever Redmine's total_count and the local row count disagree (after the
+first load, then periodically) the project's issues are re-listed: rows
+Redmine no longer has are dropped and issues the load missed are stored. While a project's
+mirror is fresh, the dashboard and `list_issues` are served locally instead
+of re-downloading every page.
+
+Rows are kept per Redmine credential (what an API user may see differs), and
+a write through the tools marks that credential's projects stale so the next
+read syncs first.
+
+Enable with REDMINE_MIRROR=1.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+import frappe
+
+from redmine_mcp_tools.assistant_tools.async_client import bind_context
+from redmine_mcp_tools.assistant_tools.http_client import env_flag, env_int
+from redmine_mcp_tools.assistant_tools.issue_scan import scan_updated_since
+
+PAGE_SIZE = 100
+
+# Bumped when the tables change; older files are rebuilt from Redmine
+SCHEMA_VERSION = 2
+
+# fetch(endpoint) -> parsed JSON; raises on HTTP/transport errors
+Fetch = Callable[[str], Dict[str, Any]]
+
+
+class IssueMirror:
+    """Per-credential, per-project issue store with updated_on watermarks"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.max_age = env_int("REDMINE_MIRROR_MAX_AGE", 60)
+        self.reconcile_interval = env_int("REDMINE_MIRROR_RECONCILE_INTERVAL", 3600)
+        self.concurrency = env_int("REDMINE_FETCH_CONCURRENCY", 4)
+        self._lock = threading.RLock()
+        self._sync_locks: Dict[tuple, threading.Lock] = {}
+        self._loading: Set[tuple] = set()
+        self._conn = None
+        self._conn_pid = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                # Unscoped rows from an older file cannot be attributed to a credential
+                conn.execute("DROP TABLE IF EXISTS issues")
+                conn.execute("DROP TABLE IF EXISTS sync_state")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS issues (
+                    scope TEXT NOT NULL,
+                    project_id INTEGER NOT NULL,
+                    id INTEGER NOT NULL,
+                    updated_on TEXT,
+                    is_closed INTEGER NOT NULL DEFAULT 0,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (scope, project_id, id)
+                )"""
+            )
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS sync_state (
+                    scope TEXT NOT NULL,
+                    project_id INTEGER NOT NULL,
+                    watermark TEXT,
+                    synced_at REAL NOT NULL,
+                    reconciled_at REAL NOT NULL,
+                    PRIMARY KEY (scope, project_id)
+                )"""
+            )
+            conn.commit()
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    # -------------------------
+    # State
+    # -------------------------
+    def _state(self, scope: str, project_id: int) -> Optional[tuple]:
+        with self._lock:
+            return self._connection().execute(
+                "SELECT watermark, synced_at, reconciled_at FROM sync_state WHERE scope = ? AND project_id = ?",
+                (scope, project_id)
+            ).fetchone()
+
+    def is_loaded(self, scope: str, project_id: int) -> bool:
+        """True once the project's first bulk load has finished"""
+        return self._state(scope, int(project_id)) is not None
+
+    def is_fresh(self, scope: str, project_id: int, max_age: Optional[int] = None) -> bool:
+        state = self._state(scope, int(project_id))
+        if not state:
+            return False
+        return time.time() - state[1] < (self.max_age if max_age is None else max_age)
+
+    def invalidate(self, scope: str) -> None:
+        """Make the next read of each of the credential's projects sync with Redmine first"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("UPDATE sync_state SET synced_at = 0 WHERE scope = ?", (scope,))
+            conn.commit()
+
+    # -------------------------
+    # Sync
+    # -------------------------
+    def _fetch_pages(self, fetch: Fetch, base: str) -> Iterable[List[dict]]:
+        """Yield issue pages for `base`, pulling pages after the first in parallel"""
+        first = fetch(f"{base}&limit={PAGE_SIZE}&offset=0")
+        yield first.get("issues", [])
+        offsets = list(range(PAGE_SIZE, first.get("total_count", 0), PAGE_SIZE))
+        if not offsets:
+            return
+        with ThreadPoolExecutor(max_workers=max(1, min(self.concurrency, len(offsets)))) as pool:
+            for page in pool.map(lambda o: fetch(f"{base}&limit={PAGE_SIZE}&offset={o}"), offsets):
+                yield page.get("issues", [])
+
+    def _newest_update(self, fetch: Fetch, project_id: int) -> Optional[str]:
+        """Redmine's newest updated_on for the project (None when it has no issues)"""
+        probe = fetch(f"/issues.json?project_id={project_id}&status_id=*&sort=updated_on:desc&limit=1")
+        issues = probe.get("issues") or []
+        return issues[0].get("updated_on") if issues else None
+
+    def _store(self, scope: str, project_id: int, issues: List[dict], closed_ids: Set[int]) -> Optional[str]:
+        watermark = None
+        rows = []
+        for issue in issues:
+            status = issue.get("status", {})
+            is_closed = bool(status.get("is_closed") or status.get("id") in closed_ids)
+            updated_on = issue.get("updated_on")
+            if updated_on and (watermark is None or updated_on > watermark):
+                watermark = updated_on
+            rows.append((scope, project_id, issue["id"], updated_on, int(is_closed), json.dumps(issue)))
+        with self._lock:
+            conn = self._connection()
+            conn.executemany("INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?)", rows)
+            conn.commit()
+        return watermark
+
+    def sync(self, scope: str, project_id: int, fetch: Fetch, closed_ids: Set[int], force: bool = False) -> None:
+        """Bring a project's mirror up to date (no-op while still fresh)"""
+        project_id = int(project_id)
+        with self._lock:
+            sync_lock = self._sync_locks.setdefault((scope, project_id), threading.Lock())
+        with sync_lock:
+            state = self._state(scope, project_id)
+            if state and not force and time.time() - state[1] < self.max_age:
+                return
+
+            watermark = state[0] if state else None
+            if watermark:
+                # Pages come oldest first from a cursor, so their newest updated_on is safe to keep
+                new_watermark = watermark
+                for issues in scan_updated_since(fetch, f"project_id={project_id}&status_id=*", watermark):
+                    page_mark = self._store(scope, project_id, issues, closed_ids)
+                    if page_mark and page_mark > new_watermark:
+                        new_watermark = page_mark
+            else:
+                # Pages are read in parallel while issues keep changing: an edit to an issue
+                # on a page already read can be older than the newest one seen on a later
+                # page, so the watermark is taken from Redmine before the load instead
+                new_watermark = self._newest_update(fetch, project_id)
+                for issues in self._fetch_pages(fetch, f"/issues.json?project_id={project_id}&status_id=*&sort=id:desc"):
+                    self._store(scope, project_id, issues, closed_ids)
+
+            now = time.time()
+            reconciled_at = state[2] if state else 0.0
+            if now - reconciled_at >= self.reconcile_interval:
+                # Also right after the first load, which can miss issues when pages shift
+                self._reconcile(scope, project_id, fetch, closed_ids)
+                reconciled_at = now
+
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?, ?)",
+                    (scope, project_id, new_watermark, now, reconciled_at)
+                )
+                conn.commit()
+
+    def load_in_background(self, scope: str, project_id: int, fetch: Fetch, closed_ids: Set[int]) -> None:
+        """Start a project's first bulk load on a daemon thread, unless one is already running"""
+        key = (scope, int(project_id))
+        with self._lock:
+            if key in self._loading:
+                return
+            self._loading.add(key)
+
+        def load():
+            try:
+                self.sync(scope, project_id, fetch, closed_ids)
+            except Exception:
+                # Nowhere reliable to log once the request has finished; the next read retries
+                pass
+            finally:
+                with self._lock:
+                    self._loading.discard(key)
+
+        threading.Thread(target=bind_context(load), name="redmine-mirror-load", daemon=True).start()
+
+    def _reconcile(self, scope: str, project_id: int, fetch: Fetch, closed_ids: Set[int]) -> None:
+        """Drop issues deleted in Redmine and store ones missing locally; only re-lists when the counts disagree"""
+        probe = fetch(f"/issues.json?project_id={project_id}&status_id=*&limit=1")
+        with self._lock:
+            local_count = self._connection().execute(
+                "SELECT COUNT(*) FROM issues WHERE scope = ? AND project_id = ?", (scope, project_id)
+            ).fetchone()[0]
+        if probe.get("total_count", 0) == local_count:
+            return
+        remote: Dict[int, dict] = {}
+        for issues in self._fetch_pages(fetch, f"/issues.json?project_id={project_id}&status_id=*&sort=id:desc"):
+            remote.update((issue["id"], issue) for issue in issues)
+        with self._lock:
+            conn = self._connection()
+            local_ids = {row[0] for row in conn.execute(
+                "SELECT id FROM issues WHERE scope = ? AND project_id = ?", (scope, project_id)
+            )}
+            conn.executemany(
+                "DELETE FROM issues WHERE scope = ? AND project_id = ? AND id = ?",
+                [(scope, project_id, issue_id) for issue_id in local_ids - remote.keys()]
+            )
+            conn.commit()
+            missing = [remote[issue_id] for issue_id in remote.keys() - local_ids]
+            if missing:
+                self._store(scope, project_id, missing, closed_ids)
+
+    # -------------------------
+    # Reads
+    # -------------------------
+    def issues(self, scope: str, project_id: int, open_only: bool = True, limit: Optional[int] = None,
+               offset: int = 0) -> List[dict]:
+        """Mirrored issues, newest id first (Redmine's default order)"""
+        sql = "SELECT data FROM issues WHERE scope = ? AND project_id = ?"
+        if open_only:
+            sql += " AND is_closed = 0"
+        sql += " ORDER BY id DESC"
+        params: list = [scope, int(project_id)]
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [int(limit), int(offset)]
+        with self._lock:
+            rows = self._connection().execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self, scope: str, project_id: int, open_only: bool = True) -> int:
+        sql = "SELECT COUNT(*) FROM issues WHERE scope = ? AND project_id = ?"
+        if open_only:
+            sql += " AND is_closed = 0"
+        with self._lock:
+            return self._connection().execute(sql, (scope, int(project_id))).fetchone()[0]
+
+
+_mirror = None
+_mirror_lock = threading.Lock()
+
+
+def _default_path() -> str:
+    path = os.getenv("REDMINE_MIRROR_PATH")
+    if path:
+        return path
+    if getattr(frappe.local, "site", None):
+        return frappe.get_site_path("private", "redmine_issue_mirror.sqlite3")
+    return os.path.join(tempfile.gettempdir(), "redmine_issue_mirror.sqlite3")
+
+
+def get_issue_mirror() -> Optional[IssueMirror]:
+    """Return the shared mirror, or None unless enabled with REDMINE_MIRROR=1"""
+    global _mirror
+    if not env_flag("REDMINE_MIRROR", False):
+        return None
+    if _mirror is None:
+        with _mirror_lock:
+            if _mirror is None:
+                _mirror = IssueMirror(_default_path())
+    return _mirror
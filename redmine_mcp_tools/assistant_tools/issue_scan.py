@@ -0,0 +1,48 @@
+"""
+Incremental /issues.json scans ordered by `updated_on`.
+
+Paging an `updated_on:asc` listing by offset loses issues: one edited while
+the scan runs jumps to the end and everything behind it moves up a slot,
+so the issue at the page boundary is never returned - and once the
+watermark passes its timestamp it is never seen again. Each request here
+starts at the last `updated_on` returned instead (`updated_on>=` that
+timestamp, offset 0) and issues already yielded are dropped unless their
+`updated_on` changed meanwhile. Offsets are only used inside a single
+timestamp shared by more than a page of issues.
+"""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+PAGE_SIZE = 100
+
+# fetch(endpoint) -> parsed JSON; raises on HTTP/transport errors
+Fetch = Callable[[str], Dict[str, Any]]
+
+
+def scan_updated_since(fetch: Fetch, query: str, since: Optional[str] = None,
+                       page_size: int = PAGE_SIZE) -> Iterator[List[dict]]:
+    """Yield pages of issues matching `query` updated at or after `since`, oldest first.
+
+    Each issue is yielded once per version: again only if it was edited
+    while the scan ran.
+    """
+    seen: Dict[Any, Optional[str]] = {}
+    cursor, offset = since, 0
+    while True:
+        endpoint = f"/issues.json?{query}&sort=updated_on:asc,id:asc&limit={page_size}&offset={offset}"
+        if cursor:
+            endpoint += f"&updated_on=%3E%3D{cursor}"
+        data = fetch(endpoint)
+        issues = data.get("issues", [])
+        fresh = [issue for issue in issues
+                 if issue["id"] not in seen or seen[issue["id"]] != issue.get("updated_on")]
+        seen.update((issue["id"], issue.get("updated_on")) for issue in fresh)
+        if fresh:
+            yield fresh
+        if not issues or offset + len(issues) >= data.get("total_count", 0):
+            return
+        last = issues[-1].get("updated_on")
+        if last and last != cursor:
+            cursor, offset = last, 0
+        else:
+            offset += len(issues)
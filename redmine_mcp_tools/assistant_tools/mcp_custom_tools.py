@@ -7,27 +7,143 @@ Includes:
 
 import frappe
 from frappe import Optional, _
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, Iterator, List, Tuple
 from datetime import datetime
-import requests
 from frappe_assistant_core.core.base_tool import BaseTool
 import json
-from collections import defaultdict
-import requests
-from datetime import datetime
-import json
-import os
-from dotenv import load_dotenv
+from collections import defaultdict, deque
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import groupby
+from redmine_mcp_tools.assistant_tools.async_client import (
+    ISSUE_TOOL_ACTIONS, bind_context, run_blocking
+)
+from redmine_mcp_tools.assistant_tools.compact_dashboard import render_compact_body
+from redmine_mcp_tools.assistant_tools.filters import compile_filter, make_lookup, to_query, without
+from redmine_mcp_tools.assistant_tools.http_cache import HttpCache, freshness_for, get_http_cache
+from redmine_mcp_tools.assistant_tools.http_client import EnvSetting, env_int, get_session
+from redmine_mcp_tools.assistant_tools.issue_frame import IssueFrame
+from redmine_mcp_tools.assistant_tools.issue_lifecycle import analyze, cache_scope, get_journal_cache, status_history
+from redmine_mcp_tools.assistant_tools.issue_mirror import IssueMirror, get_issue_mirror
+from redmine_mcp_tools.assistant_tools.metrics import (
+    endpoint_template, instrumented, record_cache, record_page, record_render
+)
+from redmine_mcp_tools.assistant_tools.project_catalog import ProjectCatalog, get_project_catalog
+from redmine_mcp_tools.assistant_tools.projection import ISSUE_PRESETS, PROJECT_PRESETS, shape_result
+from redmine_mcp_tools.assistant_tools.report_cache import (
+    ReportCache, get_report_cache, issue_fingerprint, section_signatures
+)
+from redmine_mcp_tools.assistant_tools.report_jobs import (
+    get_report, record_job_page, record_job_sections, submit_report_job
+)
+from redmine_mcp_tools.assistant_tools.report_output import IssueSpool, report_file_name, write_report
+from redmine_mcp_tools.assistant_tools.search_index import get_search_index
+from redmine_mcp_tools.assistant_tools.singleflight import coalesce
+from redmine_mcp_tools.assistant_tools.subject_index import SubjectMatch, get_subject_index, is_confident, rank
+from redmine_mcp_tools.assistant_tools.time_report import aggregate_time_entries, time_entries_query
+from redmine_mcp_tools.assistant_tools.tracing import span, spanned, traced
+
+# Actions allowed inside a `batch` call
+BATCH_ACTIONS = ("update_issue", "change_issue_status", "assign_issue", "add_note_to_issue", "create_issue")
+
+# Read actions whose results can be trimmed with `fields` / `format`
+PROJECTED_ACTIONS = {
+    "list_issues": ("issues", ISSUE_PRESETS),
+    "search_issues": ("issues", ISSUE_PRESETS),
+    "get_issue": ("issue", ISSUE_PRESETS),
+    "list_projects": ("projects", PROJECT_PRESETS),
+}
+
+
+def _issue_action(arguments: Dict[str, Any]) -> str:
+    """Metrics label for an issue-tool call (unknown actions share one label)"""
+    action = arguments.get("action")
+    return action if action in ISSUE_TOOL_ACTIONS else "unknown"
 
-load_dotenv()
+
+def _dashboard_action(arguments: Dict[str, Any]) -> str:
+    """Metrics label for a dashboard call"""
+    if arguments.get("action") == "get_report":
+        return "get_report"
+    if arguments.get("background"):
+        return "background"
+    if arguments.get("projects"):
+        return "portfolio"
+    if arguments.get("mode") == "summary":
+        return "summary"
+    if arguments.get("output") == "file":
+        return "file"
+    return arguments.get("render") or "standard"
 
 # -------------------------
 # Redmine Issue Tool
 # -------------------------
 class RedmineIssueTool(BaseTool):
-    # Credentials / constants
-    REDMINE_API_URL = os.getenv("REDMINE_API_URL")
-    REDMINE_API_KEY = os.getenv("REDMINE_API_KEY")
+    # Credentials / constants, read from the environment (.env) on first use
+    REDMINE_API_URL = EnvSetting("REDMINE_API_URL")
+    REDMINE_API_KEY = EnvSetting("REDMINE_API_KEY")
+    author = EnvSetting("USER_NAME")
+    author_email = EnvSetting("USER_EMAIL")
+
+    # Built once with the class and shared by every instance
+    INPUT_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "enum": list(ISSUE_TOOL_ACTIONS)
+            },
+            "project_id": {"type": "string"},
+            "project_name": {"type": "string"},
+            "issue_id": {"type": "integer"},
+            "issue_subject": {"type": "string"},
+            "subject": {"type": "string"},
+            "description": {"type": "string"},
+            "updates": {"type": "object"},
+            "note": {"type": "string"},
+            "status_id": {"type": "integer"},
+            "assigned_to_id": {"type": "integer"},
+            "priority_id": {"type": "integer"},
+            "category_id": {"type": "integer"},
+            "query": {"type": "string"},
+            "mode": {
+                "type": "string",
+                "enum": ["redmine", "ranked"],
+                "description": "search_issues only: 'ranked' uses the local BM25 full-text index"
+            },
+            "limit": {"type": "integer"},
+            "offset": {"type": "integer"},
+            "from_date": {"type": "string", "description": "time_report: first day (YYYY-MM-DD)"},
+            "to_date": {"type": "string", "description": "time_report: last day (YYYY-MM-DD)"},
+            "user_id": {"type": "integer", "description": "time_report: only this user's time entries"},
+            "operations": {
+                "type": "array",
+                "items": {"type": "object"},
+                "description": "batch only: list of {action, ...arguments} for update_issue, change_issue_status, assign_issue, add_note_to_issue or create_issue"
+            },
+            "concurrency": {"type": "integer", "description": "batch: max operations run at the same time; issue_lifecycle/time_report: max parallel requests"},
+            "fields": {
+                "description": "list_issues/search_issues/get_issue/list_projects: preset ('minimal', 'detail') or list of fields to return",
+                "anyOf": [{"type": "string"}, {"type": "array", "items": {"type": "string"}}]
+            },
+            "format": {
+                "type": "string",
+                "enum": ["full", "records", "columnar"],
+                "description": "'records' flattens {id, name} objects; 'columnar' returns lists as {columns, rows}"
+            },
+            "trace": {"type": "boolean", "description": "Attach a timing waterfall of this call to the result"},
+            "profile": {
+                "type": "string",
+                "enum": ["cpu", "memory"],
+                "description": "Attach the top cProfile (cpu) or tracemalloc (memory) entries to the trace"
+            },
+            "filter": {
+                "description": "list_issues/search_issues/issue_lifecycle: filter applied by Redmine, e.g. {\"status\": \"closed\", \"assignee\": \"me\", \"updated\": {\"last_days\": 10}} or \"status=closed, priority=high\"",
+                "anyOf": [{"type": "object"}, {"type": "string"}]
+            }
+        },
+        "required": ["action"]
+    }
 
     def __init__(self):
         super().__init__()
@@ -35,56 +151,14 @@ class RedmineIssueTool(BaseTool):
         self.display_name = "Redmine Integration Tool"
         self.description = self._get_description()
         self.version = "1.0.0"
-        self.author = os.getenv("USER_NAME")
-        self.author_email = os.getenv("USER_EMAIL")
         self.category = "Integration"
         self.source_app = "byot"
         self.dependencies = ["requests"]
         self.requires_permission = None
         self.default_config = {
-            "api_url": self.REDMINE_API_URL,
-            "api_key": self.REDMINE_API_KEY,
             "timeout": 30
         }
-        self.inputSchema = {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "enum": [
-                        "list_projects", 
-                        "list_issues", 
-                        "get_issue",
-                        "create_issue", 
-                        "update_issue",
-                        "search_issues",
-                        "search_projects",
-                        "add_note_to_issue",
-                        "change_issue_status",
-                        "assign_issue",
-                        "get_issue_categories",
-                        "get_issue_priorities",
-                        "get_issue_statuses"
-                    ]
-                },
-                "project_id": {"type": "string"},
-                "project_name": {"type": "string"},
-                "issue_id": {"type": "integer"},
-                "issue_subject": {"type": "string"},
-                "subject": {"type": "string"},
-                "description": {"type": "string"},
-                "updates": {"type": "object"},
-                "note": {"type": "string"},
-                "status_id": {"type": "integer"},
-                "assigned_to_id": {"type": "integer"},
-                "priority_id": {"type": "integer"},
-                "category_id": {"type": "integer"},
-                "query": {"type": "string"},
-                "limit": {"type": "integer"},
-                "offset": {"type": "integer"}
-            },
-            "required": ["action"]
-        }
+        self.inputSchema = self.INPUT_SCHEMA
 
     def _get_description(self) -> str:
         return """This tool provides a seamless interface to interact with the Redmine project management system. 
@@ -94,7 +168,7 @@ class RedmineIssueTool(BaseTool):
         * Get Issue Details: Fetch detailed information of a single issue by its ID or subject
         * Create Issue: Open a new issue in a selected project
         * Update Issue: Modify existing issues (subject, description, status, custom fields)
-        * Search Issues: Find issues by subject, description, or other criteria
+        * Search Issues: Find issues by subject, description, or other criteria (mode="ranked" for relevance-ranked full-text results)
         * Search Projects: Find projects by name
         * Add Notes: Add comments/notes to existing issues
         * Change Status: Update issue status
@@ -102,31 +176,57 @@ class RedmineIssueTool(BaseTool):
         * Get Categories: Retrieve available issue categories
         * Get Priorities: Retrieve available issue priorities
         * Get Statuses: Retrieve available issue statuses
+        * Issue Lifecycle: Per-status dwell time, lead/cycle time and reopen counts for a project, overall and per assignee
+        * Time Report: Spent hours for a project and date range per user, issue (top `limit`), activity and week
+        * Batch: Run many updates/status changes/assignments/notes/creations in one call
         
         LLM Interaction Tips:
         - Users can search for projects/issues by name when they don't know IDs
         - When creating issues, suggest available categories/priorities from the system
         - For updates, first search for the issue by subject if ID is not provided
         - Always provide clear, human-readable responses with relevant details
+        - For list/search/get calls pass fields="minimal" (and format="columnar" for lists) unless full details are needed
         """
 
     def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Generic request method to handle all API calls"""
+        with span("request", method=method, endpoint=endpoint_template(endpoint)):
+            if method == "GET":
+                # Identical concurrent GETs share one upstream call
+                url = f"{self.REDMINE_API_URL.rstrip('/')}{endpoint}"
+                return coalesce(url, self.REDMINE_API_KEY, lambda: self._send_request(method, endpoint, **kwargs), **kwargs)
+            return self._send_request(method, endpoint, **kwargs)
+
+    def _send_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """Send one request (HTTP cache aware) and normalize the response"""
+        import requests
+
         api_url = self.REDMINE_API_URL.rstrip('/')  # Remove trailing slash
         api_key = self.REDMINE_API_KEY
         timeout = self.default_config.get("timeout", 30)
         
-        # Set proper headers
-        headers = {
-            "X-Redmine-API-Key": api_key,
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        }
+        # Content-Type/Accept live on the shared session; only the key is per call
+        headers = {"X-Redmine-API-Key": api_key}
         
         url = f"{api_url}{endpoint}"
         
+        # Reference-data GETs go through the persistent HTTP cache
+        cache = get_http_cache() if method == "GET" else None
+        max_age = freshness_for(endpoint) if cache else None
+        cache_key = cached = None
+        if max_age is not None:
+            cache_key = HttpCache.make_key(url, api_key)
+            cached = cache.get(cache_key, max_age)
+            if cached and cached.is_fresh:
+                record_cache("http", "hit")
+                return {"success": True, "result": json.loads(cached.body)}
+            if cached:
+                headers.update(cached.conditional_headers())
+            else:
+                record_cache("http", "miss")
+        
         try:
-            response = requests.request(
+            response = get_session().request(
                 method=method,
                 url=url,
                 headers=headers,
@@ -135,7 +235,11 @@ class RedmineIssueTool(BaseTool):
             )
             
             # Handle different response status codes
-            if response.status_code == 204:  # No Content - successful update
+            if response.status_code == 304 and cached:  # Not Modified - reuse cached body
+                record_cache("http", "revalidated")
+                cache.revalidated(cache_key)
+                return {"success": True, "result": json.loads(cached.body)}
+            elif response.status_code == 204:  # No Content - successful update
                 return {"success": True, "result": {"message": "Update successful"}}
             elif response.status_code == 422:  # Unprocessable Entity - validation errors
                 try:
@@ -151,12 +255,21 @@ class RedmineIssueTool(BaseTool):
                 return {"success": True, "result": {"message": "Operation completed successfully"}}
             
             try:
-                return {"success": True, "result": response.json()}
+                with span("json_decode"):
+                    result = response.json()
+                if cache_key and response.status_code == 200:
+                    cache.put(
+                        cache_key,
+                        response.content,
+                        response.headers.get("ETag"),
+                        response.headers.get("Last-Modified")
+                    )
+                return {"success": True, "result": result}
             except ValueError:
                 # Response is not JSON, return raw text
                 return {"success": True, "result": {"response": response.text}}
                 
-        except requests.exceptions.HTTPError as e:
+        except requests.exceptions.HTTPError:
             error_msg = f"HTTP Error {response.status_code}: {response.text}"
             frappe.log_error(title=_("Redmine API HTTP Error"), message=error_msg)
             return {"success": False, "error": error_msg}
@@ -167,12 +280,16 @@ class RedmineIssueTool(BaseTool):
             frappe.log_error(title=_("Redmine Tool Error"), message=str(e))
             return {"success": False, "error": str(e)}
 
+    def _project_catalog(self) -> ProjectCatalog:
+        """Shared, paginated project index for this Redmine instance"""
+        return get_project_catalog(
+            self.REDMINE_API_URL, self.REDMINE_API_KEY, self.default_config.get("timeout", 30)
+        )
+
+    @spanned("resolve_project")
     def _search_projects_by_name(self, project_name: str) -> Optional[Dict[str, Any]]:
-        """Search for projects by name and return the first match"""
-        result = self._make_request("GET", f"/projects.json?name={project_name}")
-        if result["success"] and "projects" in result["result"] and result["result"]["projects"]:
-            return result["result"]["projects"][0]
-        return None
+        """Find a project by id, identifier, exact name or case-insensitive name"""
+        return self._project_catalog().get(project_name)
 
     def _search_issues_by_subject(self, subject: str, project_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Search for issues by subject"""
@@ -197,23 +314,130 @@ class RedmineIssueTool(BaseTool):
             return str(project["id"]) if project else None
         return None
 
-    def _resolve_issue_id(self, issue_id: Optional[int] = None, issue_subject: Optional[str] = None, 
-                         project_id: Optional[str] = None) -> Optional[int]:
-        """Resolve issue identifier from either ID or subject"""
+    @spanned("match_subject")
+    def _match_issue_subject(self, issue_subject: str, project_id: Optional[str] = None,
+                             for_write: bool = False) -> List[SubjectMatch]:
+        """Ranked issue candidates for a subject, best first.
+
+        Answered from the project's local trigram index; the API is only
+        queried when the local match is missing or ambiguous.
+        """
+        matches = []
+        if project_id:
+            index = get_subject_index(
+                self.REDMINE_API_URL, self.REDMINE_API_KEY, str(project_id),
+                lambda endpoint: self._make_request("GET", endpoint)
+            )
+            matches = index.lookup(issue_subject, for_write=for_write)
+            if is_confident(matches, for_write):
+                record_cache("subject_index", "hit")
+                return matches
+            record_cache("subject_index", "miss")
+        api_matches = rank(issue_subject, self._search_issues_by_subject(issue_subject, project_id))
+        # One candidate per issue; the API's copy of a subject is the fresher one
+        merged = {m.issue_id: m for m in matches + api_matches}
+        return sorted(merged.values(), key=lambda m: (-m.score, -m.issue_id))[:5]
+
+    @spanned("resolve_issue")
+    def _resolve_issue(self, issue_id: Optional[int] = None, issue_subject: Optional[str] = None,
+                       project_id: Optional[str] = None,
+                       for_write: bool = False) -> Tuple[Optional[int], Optional[Dict[str, Any]]]:
+        """Return (issue id, None), or (None, error result) listing the closest candidates.
+
+        A subject only resolves when the match is confident; writes use the
+        stricter write threshold so a note never lands on a look-alike issue.
+        """
         if issue_id:
-            return int(issue_id)
-        elif issue_subject:
-            issues = self._search_issues_by_subject(issue_subject, project_id)
-            if issues:
-                return int(issues[0]["id"])
-        return None
+            return int(issue_id), None
+        matches = self._match_issue_subject(issue_subject, project_id, for_write) if issue_subject else []
+        if is_confident(matches, for_write):
+            return matches[0].issue_id, None
+        error = {"success": False, "error": "Could not resolve issue identifier"}
+        if matches:
+            error["error"] += "; no subject matched confidently, pass issue_id of one of the candidates"
+            error["candidates"] = [
+                {"issue_id": m.issue_id, "subject": m.subject, "score": round(m.score, 3)} for m in matches
+            ]
+        return None, error
 
     def list_projects(self, **kwargs) -> Dict[str, Any]:
         """List all Redmine projects"""
         return self._make_request("GET", "/projects.json")
 
+    def _fetch_json(self, endpoint: str) -> Dict[str, Any]:
+        """GET an endpoint and return its JSON, raising on failure (for sync jobs)"""
+        result = self._make_request("GET", endpoint)
+        if not result["success"]:
+            raise RuntimeError(result["error"])
+        return result["result"]
+
+    def _closed_status_ids(self) -> set:
+        result = self.get_issue_statuses()
+        if not result["success"]:
+            return set()
+        return {s["id"] for s in result["result"].get("issue_statuses", []) if s.get("is_closed")}
+
+    def _filter_query(self, filter_value: Any, project_id: Optional[str]) -> str:
+        """Compile a `filter` argument to an /issues.json query string (ValueError if invalid)"""
+        if not filter_value:
+            return ""
+        return to_query(compile_filter(filter_value, make_lookup(self._fetch_json, project_id)))
+
+    def _mirror_scope(self) -> str:
+        return cache_scope(self.REDMINE_API_URL, self.REDMINE_API_KEY)
+
+    def _synced_mirror(self, project_id: Optional[str]) -> Optional[tuple]:
+        """Return (mirror, numeric project id) once the project's local mirror is up to date.
+
+        A project that has never been loaded starts its bulk load in the
+        background and this call is answered by Redmine.
+        """
+        mirror = get_issue_mirror()
+        if not mirror or not project_id:
+            return None
+        project = self._project_catalog().get(project_id)
+        if not project:
+            return None
+        scope = self._mirror_scope()
+        try:
+            if not mirror.is_loaded(scope, project["id"]):
+                mirror.load_in_background(scope, project["id"], bind_context(self._fetch_json), self._closed_status_ids())
+                return None
+            mirror.sync(scope, project["id"], self._fetch_json, self._closed_status_ids())
+        except Exception as e:
+            frappe.log_error(title=_("Redmine Mirror Sync Error"), message=str(e))
+            return None
+        return mirror, project["id"]
+
+    def _invalidate_mirror(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """After a successful write, make the next mirrored read sync with Redmine first"""
+        mirror = get_issue_mirror()
+        if mirror and result.get("success"):
+            mirror.invalidate(self._mirror_scope())
+        return result
+
     def list_issues(self, project_id: Optional[str] = None, limit: int = 25, offset: int = 0, **kwargs) -> Dict[str, Any]:
         """List issues for a project or all issues"""
+        try:
+            filter_query = self._filter_query(kwargs.get("filter"), project_id)
+        except (ValueError, RuntimeError) as e:
+            return {"success": False, "error": str(e)}
+
+        mirrored = None if filter_query else self._synced_mirror(project_id)
+        if mirrored:
+            record_cache("mirror", "hit")
+            mirror, mirrored_project_id = mirrored
+            scope = self._mirror_scope()
+            return {
+                "success": True,
+                "result": {
+                    "issues": mirror.issues(scope, mirrored_project_id, limit=limit or 25, offset=offset or 0),
+                    "total_count": mirror.count(scope, mirrored_project_id),
+                    "offset": offset or 0,
+                    "limit": limit or 25
+                }
+            }
+
         params = []
         if project_id:
             params.append(f"project_id={project_id}")
@@ -221,6 +445,8 @@ class RedmineIssueTool(BaseTool):
             params.append(f"limit={limit}")
         if offset:
             params.append(f"offset={offset}")
+        if filter_query:
+            params.append(filter_query)
             
         endpoint = "/issues.json"
         if params:
@@ -231,9 +457,9 @@ class RedmineIssueTool(BaseTool):
     def get_issue(self, issue_id: Optional[int] = None, issue_subject: Optional[str] = None, 
                  project_id: Optional[str] = None, **kwargs) -> Dict[str, Any]:
         """Get details of a single issue by ID or subject"""
-        resolved_issue_id = self._resolve_issue_id(issue_id, issue_subject, project_id)
+        resolved_issue_id, error = self._resolve_issue(issue_id, issue_subject, project_id)
         if not resolved_issue_id:
-            return {"success": False, "error": "Could not resolve issue identifier"}
+            return error
         
         return self._make_request("GET", f"/issues/{resolved_issue_id}.json")
 
@@ -266,14 +492,14 @@ class RedmineIssueTool(BaseTool):
         if status_id:
             payload["issue"]["status_id"] = int(status_id)
             
-        return self._make_request("POST", "/issues.json", json=payload)
+        return self._invalidate_mirror(self._make_request("POST", "/issues.json", json=payload))
 
     def update_issue(self, issue_id: Optional[int] = None, issue_subject: Optional[str] = None,
                     project_id: Optional[str] = None, updates: Dict[str, Any] = None, **kwargs) -> Dict[str, Any]:
         """Update an existing Redmine issue"""
-        resolved_issue_id = self._resolve_issue_id(issue_id, issue_subject, project_id)
+        resolved_issue_id, error = self._resolve_issue(issue_id, issue_subject, project_id, for_write=True)
         if not resolved_issue_id:
-            return {"success": False, "error": "Could not resolve issue identifier"}
+            return error
         if not updates:
             return {"success": False, "error": "No fields to update provided"}
         
@@ -287,14 +513,15 @@ class RedmineIssueTool(BaseTool):
                     cleaned_updates[key] = value
             
         payload = {"issue": cleaned_updates}
-        return self._make_request("PUT", f"/issues/{resolved_issue_id}.json", json=payload)
+        result = self._make_request("PUT", f"/issues/{resolved_issue_id}.json", json=payload)
+        return self._invalidate_mirror(result)
 
     def add_note_to_issue(self, issue_id: Optional[int] = None, issue_subject: Optional[str] = None,
                          project_id: Optional[str] = None, note: str = "", **kwargs) -> Dict[str, Any]:
         """Add a note/comment to an existing issue using Redmine's notes field"""
-        resolved_issue_id = self._resolve_issue_id(issue_id, issue_subject, project_id)
+        resolved_issue_id, error = self._resolve_issue(issue_id, issue_subject, project_id, for_write=True)
         if not resolved_issue_id:
-            return {"success": False, "error": "Could not resolve issue identifier"}
+            return error
         if not note:
             return {"success": False, "error": "Note content is required"}
         
@@ -304,7 +531,8 @@ class RedmineIssueTool(BaseTool):
             }
         }
         
-        return self._make_request("PUT", f"/issues/{resolved_issue_id}.json", json=payload)
+        result = self._make_request("PUT", f"/issues/{resolved_issue_id}.json", json=payload)
+        return self._invalidate_mirror(result)
 
     def change_issue_status(self, issue_id: Optional[int] = None, issue_subject: Optional[str] = None,
                            project_id: Optional[str] = None, status_id: int = None, **kwargs) -> Dict[str, Any]:
@@ -333,8 +561,32 @@ class RedmineIssueTool(BaseTool):
         )
 
     def search_issues(self, query: str, project_id: Optional[str] = None, 
-                     limit: int = 25, offset: int = 0, **kwargs) -> Dict[str, Any]:
-        """Search issues by query string"""
+                     limit: int = 25, offset: int = 0, mode: str = "redmine", **kwargs) -> Dict[str, Any]:
+        """Search issues by query string.
+
+        mode="ranked" answers from a local BM25 index over subject, description
+        and notes instead of Redmine's unranked subject filter. The index
+        cannot apply Redmine filters, so combining it with `filter` or
+        `status_id` is an error rather than a silently unfiltered result.
+        """
+        if mode == "ranked":
+            unsupported = [name for name in ("filter", "status_id") if kwargs.get(name)]
+            if unsupported:
+                return {"success": False, "error": f"mode 'ranked' does not support {', '.join(unsupported)}; "
+                                                   "use mode 'redmine' to filter"}
+            index = get_search_index(self.REDMINE_API_URL, self.REDMINE_API_KEY, project_id)
+            try:
+                index.refresh(self._fetch_json)
+            except Exception as e:
+                frappe.log_error(title=_("Redmine Search Index Error"), message=str(e))
+                return {"success": False, "error": str(e)}
+            return {"success": True, "result": index.search(query, limit or 25, offset or 0)}
+
+        try:
+            filter_query = self._filter_query(kwargs.get("filter"), project_id)
+        except (ValueError, RuntimeError) as e:
+            return {"success": False, "error": str(e)}
+
         import urllib.parse
         encoded_query = urllib.parse.quote(query)
         
@@ -345,16 +597,30 @@ class RedmineIssueTool(BaseTool):
         
         if project_id:
             params.append(f"project_id={project_id}")
+        if filter_query:
+            params.append(filter_query)
             
         endpoint = "/issues.json?" + "&".join(params)
         return self._make_request("GET", endpoint)
 
     def search_projects(self, query: str, limit: int = 25, offset: int = 0, **kwargs) -> Dict[str, Any]:
-        """Search projects by name"""
-        import urllib.parse
-        encoded_query = urllib.parse.quote(query)
-        endpoint = f"/projects.json?name=~{encoded_query}&limit={limit}&offset={offset}"
-        return self._make_request("GET", endpoint)
+        """Search projects by name (prefix matches first, then substring matches)"""
+        import requests
+
+        try:
+            matches = self._project_catalog().search(query)
+        except requests.exceptions.RequestException as e:
+            frappe.log_error(title=_("Redmine API Request Error"), message=str(e))
+            return {"success": False, "error": str(e)}
+        return {
+            "success": True,
+            "result": {
+                "projects": matches[offset:offset + limit],
+                "total_count": len(matches),
+                "offset": offset,
+                "limit": limit
+            }
+        }
 
     def get_issue_categories(self, project_id: Optional[str] = None, project_name: Optional[str] = None, **kwargs) -> Dict[str, Any]:
         """Get issue categories for a project"""
@@ -372,8 +638,212 @@ class RedmineIssueTool(BaseTool):
         """Get all available issue statuses"""
         return self._make_request("GET", "/issue_statuses.json")
 
+    def _lifecycle_issues(self, project_id: str, filter_query: str, concurrency: int) -> Tuple[List[dict], bool]:
+        """Every issue in scope (closed ones too, unless the filter sets a status), pages fetched in parallel.
+
+        Returns (issues, complete). Offset pages shift when issues are created
+        or deleted meanwhile, so a listing whose total_count moved (or that
+        returned fewer issues than it promised) is read once more for the
+        issues it missed; complete is False if it still did not settle.
+        """
+        base = f"/issues.json?project_id={project_id}&sort=id:desc"
+        if "status_id=" not in filter_query:
+            base += "&status_id=*"
+        if filter_query:
+            base += f"&{filter_query}"
+        fetch = bind_context(self._fetch_json)
+        issues, seen_ids, complete = [], set(), False
+        for _attempt in range(2):
+            first = self._fetch_json(f"{base}&limit=100&offset=0")
+            offsets = range(100, first.get("total_count", 0), 100)
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                pages = [first] + list(pool.map(lambda offset: fetch(f"{base}&limit=100&offset={offset}"), offsets))
+            for page in pages:
+                for issue in page.get("issues", []):
+                    if issue["id"] not in seen_ids:
+                        seen_ids.add(issue["id"])
+                        issues.append(issue)
+            total_counts = {page.get("total_count", 0) for page in pages}
+            complete = len(total_counts) == 1 and len(seen_ids) >= first.get("total_count", 0)
+            if complete:
+                break
+        return issues, complete
+
+    @spanned("status_histories")
+    def _status_histories(self, issues: List[dict], concurrency: int) -> tuple:
+        """(histories by issue id, journals fetched, served from cache, failed ids)"""
+        cache = get_journal_cache()
+        scope = cache_scope(self.REDMINE_API_URL, self.REDMINE_API_KEY)
+        updated = {issue["id"]: issue.get("updated_on") for issue in issues}
+        histories = cache.lookup(scope, updated) if cache else {}
+        record_cache("journal", "hit", len(histories))
+        missing = [issue_id for issue_id in updated if issue_id not in histories]
+        record_cache("journal", "miss", len(missing))
+
+        fetch = bind_context(self._fetch_json)
+
+        def journals(issue_id):
+            try:
+                issue = fetch(f"/issues/{issue_id}.json?include=journals").get("issue", {})
+            except Exception:
+                return issue_id, None, None
+            # Keep the updated_on of the listing: the issue may have moved since
+            return issue_id, updated[issue_id], status_history(issue.get("journals") or [])
+
+        fetched, failed = [], []
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(missing))) as pool:
+                for issue_id, updated_on, history in pool.map(journals, missing):
+                    if history is None:
+                        failed.append(issue_id)
+                        continue
+                    histories[issue_id] = history
+                    fetched.append((issue_id, updated_on, history))
+        if cache:
+            cache.store(scope, fetched)
+        return histories, len(fetched), len(updated) - len(missing), failed
+
+    def issue_lifecycle(self, project_id: Optional[str] = None, project_name: Optional[str] = None,
+                        concurrency: Optional[int] = None, **kwargs) -> Dict[str, Any]:
+        """Per-status dwell time, lead/cycle time and reopen counts from issue journals"""
+        resolved_project_id = self._resolve_project_id(project_id, project_name)
+        if not resolved_project_id:
+            return {"success": False, "error": "Could not resolve project identifier"}
+        try:
+            filter_query = self._filter_query(kwargs.get("filter"), resolved_project_id)
+        except (ValueError, RuntimeError) as e:
+            return {"success": False, "error": str(e)}
+        concurrency = max(1, int(concurrency or env_int("REDMINE_FETCH_CONCURRENCY", 4)))
+
+        issues, complete = self._lifecycle_issues(resolved_project_id, filter_query, concurrency)
+        statuses = self._fetch_json("/issue_statuses.json").get("issue_statuses", [])
+        histories, fetched, cached, failed = self._status_histories(issues, concurrency)
+        with span("lifecycle_analyze", issues=len(issues)):
+            result = analyze(issues, histories, statuses)
+        return {
+            "success": True,
+            "result": {
+                "issues": len(issues),
+                "journals_fetched": fetched,
+                "journals_cached": cached,
+                "failed_issue_ids": failed,
+                "complete": complete,
+                **result
+            }
+        }
+
+    def time_report(self, project_id: Optional[str] = None, project_name: Optional[str] = None,
+                    from_date: Optional[str] = None, to_date: Optional[str] = None, user_id: Optional[int] = None,
+                    limit: int = 25, concurrency: Optional[int] = None, **kwargs) -> Dict[str, Any]:
+        """Spent-hours rollups per user, issue, activity and week, folded page by page"""
+        resolved_project_id = self._resolve_project_id(project_id, project_name)
+        if not resolved_project_id:
+            return {"success": False, "error": "Could not resolve project identifier"}
+        concurrency = max(1, int(concurrency or env_int("REDMINE_FETCH_CONCURRENCY", 4)))
+        query = time_entries_query(resolved_project_id, from_date, to_date, user_id)
+        with span("time_entries"):
+            totals = aggregate_time_entries(bind_context(self._fetch_json), query, concurrency)
+        return {"success": True, "result": totals.tables(limit or 25)}
+
+    def batch(self, operations: List[Dict[str, Any]] = None, concurrency: Optional[int] = None,
+              **kwargs) -> Dict[str, Any]:
+        """Run many write operations concurrently with per-operation results"""
+        if not operations:
+            return {"success": False, "error": "operations are required"}
+        if not isinstance(operations, list):
+            return {"success": False, "error": "operations must be a list of objects"}
+        concurrency = max(1, int(concurrency or env_int("REDMINE_BATCH_CONCURRENCY", 8)))
+        started = time.perf_counter()
+
+        # Resolve every distinct (issue subject, project) pair once, up front. Project
+        # names are not pre-resolved: the shared project catalog answers those from memory
+        subject_keys = {self._batch_subject_key(op) for op in operations} - {None}
+        with ThreadPoolExecutor(max_workers=min(concurrency, max(1, len(subject_keys)))) as pool:
+            resolve = bind_context(self._resolve_issue)
+            resolved = dict(zip(subject_keys, pool.map(lambda key: resolve(None, key[0], key[1], True), subject_keys)))
+        resolve_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        def run(index_op):
+            index, op = index_op
+            op_started = time.perf_counter()
+            if not isinstance(op, dict):
+                error = {"success": False, "error": f"Operation must be an object, got {type(op).__name__}"}
+                return self._batch_result(index, None, error, op_started)
+            action = op.get("action")
+            args = {k: v for k, v in op.items() if k != "action"}
+            if action not in BATCH_ACTIONS:
+                result = {"success": False, "error": f"Unsupported batch action: {action}"}
+            else:
+                key = self._batch_subject_key(op)
+                if key is not None:
+                    resolved_issue_id, error = resolved[key]
+                    if resolved_issue_id is None:
+                        return self._batch_result(index, action, error, op_started)
+                    args["issue_id"] = resolved_issue_id
+                try:
+                    result = getattr(self, action)(**args)
+                except Exception as e:
+                    result = {"success": False, "error": f"Error executing {action}: {str(e)}"}
+            return self._batch_result(index, action, result, op_started)
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(operations))) as pool:
+            # Each task runs in a copy of the caller's context (frappe.local, metrics)
+            results = list(pool.map(bind_context(run), enumerate(operations)))
+
+        succeeded = sum(1 for r in results if r["success"])
+        return {
+            "success": succeeded == len(results),
+            "result": {
+                "total": len(results),
+                "succeeded": succeeded,
+                "failed": len(results) - succeeded,
+                "resolve_ms": resolve_ms,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                "operations": results
+            }
+        }
+
+    @staticmethod
+    def _batch_subject_key(op: Any) -> Optional[Tuple[str, Any]]:
+        """(issue_subject, project_id) when the operation targets an issue by subject"""
+        if not isinstance(op, dict) or op.get("action") == "create_issue" or op.get("issue_id"):
+            return None
+        subject, project_id = op.get("issue_subject"), op.get("project_id")
+        if not subject or not isinstance(subject, str) or not isinstance(project_id, (str, int, type(None))):
+            return None
+        return subject, project_id
+
+    @staticmethod
+    def _batch_result(index: int, action: Optional[str], result: Dict[str, Any], started: float) -> Dict[str, Any]:
+        entry = {
+            "index": index,
+            "action": action,
+            "success": bool(result.get("success")),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)
+        }
+        if entry["success"]:
+            entry["result"] = result.get("result")
+        else:
+            entry["error"] = result.get("error")
+            if result.get("candidates"):
+                entry["candidates"] = result["candidates"]
+        return entry
+
+    @traced("redmine_issue_tool")
+    @instrumented("redmine_issue_tool", _issue_action)
     def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute the requested action with proper error handling"""
+        """Execute the requested action on the calling thread"""
+        return self._execute_action(arguments)
+
+    async def execute_async(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute the requested action without blocking the event loop.
+
+        The whole of execute() - tracing, profiling and metrics included -
+        runs on the worker thread that does the work.
+        """
+        return await run_blocking(self.execute, arguments)
+
+    def _execute_action(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         if not self.REDMINE_API_URL or not self.REDMINE_API_KEY:
             return {"success": False, "error": "Redmine API URL or API Key not configured"}
             
@@ -381,24 +851,7 @@ class RedmineIssueTool(BaseTool):
         if not action:
             return {"success": False, "error": "Action is required"}
         
-        # Map actions to methods
-        action_methods = {
-            "list_projects": self.list_projects,
-            "list_issues": self.list_issues,
-            "get_issue": self.get_issue,
-            "create_issue": self.create_issue,
-            "update_issue": self.update_issue,
-            "search_issues": self.search_issues,
-            "search_projects": self.search_projects,
-            "add_note_to_issue": self.add_note_to_issue,
-            "change_issue_status": self.change_issue_status,
-            "assign_issue": self.assign_issue,
-            "get_issue_categories": self.get_issue_categories,
-            "get_issue_priorities": self.get_issue_priorities,
-            "get_issue_statuses": self.get_issue_statuses
-        }
-        
-        if action not in action_methods:
+        if action not in ISSUE_TOOL_ACTIONS:
             return {"success": False, "error": f"Unknown action: {action}"}
         
         # Remove action from arguments before passing to method
@@ -406,7 +859,14 @@ class RedmineIssueTool(BaseTool):
         del method_args["action"]
         
         try:
-            return action_methods[action](**method_args)
+            result = getattr(self, action)(**method_args)
+            if action in PROJECTED_ACTIONS:
+                collection_key, presets = PROJECTED_ACTIONS[action]
+                with span("shape_result"):
+                    result = shape_result(
+                        result, collection_key, method_args.get("fields"), method_args.get("format"), presets
+                    )
+            return result
         except Exception as e:
             frappe.log_error(title=f"Redmine Tool Action Error - {action}", message=str(e))
             return {"success": False, "error": f"Error executing {action}: {str(e)}"}
@@ -415,9 +875,85 @@ class RedmineIssueTool(BaseTool):
 # Redmine Dashboard Tool
 # -------------------------
 class RedmineDashboardTool(BaseTool):
-    # Hardcoded credentials
-    REDMINE_API_URL = os.getenv("REDMINE_API_URL")
-    REDMINE_API_KEY = os.getenv("REDMINE_API_KEY")
+    # Credentials, read from the environment (.env) on first use
+    REDMINE_API_URL = EnvSetting("REDMINE_API_URL")
+    REDMINE_API_KEY = EnvSetting("REDMINE_API_KEY")
+
+    # Priority and status colors
+    PRIORITY_COLORS = {
+        "high": "#ff4757",
+        "normal": "#2ed573",
+        "low": "#1e90ff"
+    }
+    STATUS_COLORS = {
+        "New": "#a4b0be",
+        "In Progress": "#ffa502",
+        "Deployed to UAT": "#3742fa",
+        "Deployed to Production": "#2ed573",
+        "Awaiting For Customer Demo": "#9b59b6",
+        "On Hold": "#e67e22",
+        "default": "#7f8c8d"
+    }
+
+    # default_config keys read from the environment on first use
+    ENV_CONFIG = {
+        "fetch_concurrency": ("REDMINE_FETCH_CONCURRENCY", 4),
+        "portfolio_concurrency": ("REDMINE_PORTFOLIO_CONCURRENCY", 8),
+    }
+
+    INPUT_SCHEMA = {
+        "type": "object",
+        "properties": {
+            "project_name": {"type": "string", "description": "Redmine Project Name"},
+            "projects": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Portfolio mode: project names/identifiers fetched together into one roll-up report (instead of project_name)"
+            },
+            "include_subprojects": {"type": "boolean", "description": "Portfolio mode: also include all nested subprojects"},
+            "filter": {
+                "description": "Optional filter applied by Redmine: status, assignee, tracker, priority, created/updated/due ranges, custom_fields, query_id. E.g. {\"updated\": {\"last_days\": 10}} or \"status=closed, priority=high\" (summary mode always counts open issues)",
+                "anyOf": [{"type": "object"}, {"type": "string"}]
+            },
+            "concurrency": {"type": "integer", "description": "Optional cap on parallel page requests (1 = sequential); in portfolio mode the budget shared by all projects"},
+            "mode": {
+                "type": "string",
+                "enum": ["full", "summary"],
+                "description": "'summary' builds per-assignee charts from count probes without downloading issues"
+            },
+            "drilldown_user": {"type": "string", "description": "summary mode: assignee whose ticket rows are included"},
+            "render": {
+                "type": "string",
+                "enum": ["standard", "compact"],
+                "description": "'compact' emits one data blob plus one chart script (much smaller, same look)"
+            },
+            "trace": {"type": "boolean", "description": "Attach a timing waterfall of this call to the result"},
+            "profile": {
+                "type": "string",
+                "enum": ["cpu", "memory"],
+                "description": "Attach the top cProfile (cpu) or tracemalloc (memory) entries to the trace"
+            },
+            "output": {
+                "type": "string",
+                "enum": ["inline", "file"],
+                "description": "'inline' returns the HTML; 'file' streams it to a private File and returns its URL with summary stats"
+            },
+            "background": {
+                "type": "boolean",
+                "description": "Generate in a background job and return a job_id at once; identical requests share one job"
+            },
+            "action": {
+                "type": "string",
+                "enum": ["generate", "get_report"],
+                "description": "'get_report' returns the status and progress of job_id, and the report once finished"
+            },
+            "job_id": {"type": "string", "description": "get_report: id returned by a background call"},
+            "time_report": {
+                "description": "Add a spent-time section (weekly and per-activity charts, hours per user and top issues): true for all time entries or {\"from_date\": \"YYYY-MM-DD\", \"to_date\": \"YYYY-MM-DD\"}; not used in portfolio mode",
+                "anyOf": [{"type": "boolean"}, {"type": "object"}]
+            },
+        }
+    }
 
     def __init__(self):
         super().__init__()
@@ -428,44 +964,215 @@ class RedmineDashboardTool(BaseTool):
         self.dependencies = ["requests"]
         self.requires_permission = None
         self.default_config = {
-            "api_url": self.REDMINE_API_URL,
-            "api_key": self.REDMINE_API_KEY,
-            "timeout": 30
-        }
-        self.inputSchema = {
-            "type": "object",
-            "properties": {
-                "project_name": {"type": "string", "description": "Redmine Project Name"},
-                "filter": {"type": "string", "description": "Optional filter: status, assignee, priority"},
-            },
-            "required": ["project_name"]
+            "timeout": 30,
+            "page_size": 100
         }
+        self.inputSchema = self.INPUT_SCHEMA
+
+    def _config(self, name: str) -> Any:
+        """default_config value; ENV_CONFIG keys are read from the environment on first use"""
+        if name not in self.default_config:
+            self.default_config[name] = env_int(*self.ENV_CONFIG[name])
+        return self.default_config[name]
 
+    @spanned("resolve_project")
     def _get_project_id(self, project_name: str, headers: dict, timeout: int) -> Optional[int]:
-        """Fetch project ID by project name"""
-        resp = requests.get(f"{self.REDMINE_API_URL}/projects.json", headers=headers, timeout=timeout)
-        resp.raise_for_status()
-        projects = resp.json().get("projects", [])
-        return next((p["id"] for p in projects if p["name"].lower() == project_name.lower()), None)
-
-    def _fetch_all_issues(self, project_id: int, headers: dict, timeout: int) -> List[dict]:
-        """Fetch all issues for a project with pagination"""
-        issues = []
-        offset = 0
-        while True:
-            resp = requests.get(
-                f"{self.REDMINE_API_URL}/issues.json?project_id={project_id}&limit=100&offset={offset}",
-                headers=headers,
-                timeout=timeout
+        """Resolve project ID by name (or id/identifier) from the shared project catalog"""
+        project = get_project_catalog(self.REDMINE_API_URL, self.REDMINE_API_KEY, timeout).get(project_name)
+        return project["id"] if project else None
+
+    def _fetch_issue_page(self, project_id: int, offset: int, headers: dict, timeout: int,
+                          sort: str = "id:desc", query: str = "") -> dict:
+        """Fetch a single page of project issues (`query` adds extra filter parameters)"""
+        page_size = self.default_config["page_size"]
+        record_page()
+        with span("issue_page", project_id=project_id, offset=offset):
+            page = self._get_json(
+                f"/issues.json?project_id={project_id}{'&' + query if query else ''}"
+                f"&sort={sort}&limit={page_size}&offset={offset}",
+                headers,
+                timeout
             )
-            resp.raise_for_status()
-            data = resp.json()
-            issues.extend(data.get("issues", []))
-            if offset + 100 >= data.get("total_count", 0):
-                break
-            offset += 100
+        record_job_page(project_id, page.get("total_count", 0), page_size)
+        return page
+
+    def _fetch_pages(self, project_id: int, offsets: List[int], headers: dict, timeout: int,
+                     concurrency: int, query: str = "") -> List[dict]:
+        """Fetch the given page offsets, at most `concurrency` at a time, in offset order"""
+        if concurrency <= 1 or len(offsets) <= 1:
+            return [self._fetch_issue_page(project_id, offset, headers, timeout, query=query) for offset in offsets]
+        fetch_page = bind_context(self._fetch_issue_page)
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(offsets))) as pool:
+            # map() yields results in submission order, so pages merge in order
+            return list(pool.map(
+                lambda offset: fetch_page(project_id, offset, headers, timeout, query=query),
+                offsets
+            ))
+
+    @spanned("fetch_issues")
+    def _fetch_all_issues(self, project_id: int, headers: dict, timeout: int,
+                          concurrency: Optional[int] = None, query: str = "") -> List[dict]:
+        """Fetch all issues for a project, pulling the remaining pages in parallel"""
+        page_size = self.default_config["page_size"]
+        if concurrency is None:
+            concurrency = self._config("fetch_concurrency")
+
+        first = self._fetch_issue_page(project_id, 0, headers, timeout, query=query)
+        total_count = first.get("total_count", 0)
+        offsets = list(range(page_size, total_count, page_size))
+        pages = [first] + self._fetch_pages(project_id, offsets, headers, timeout, concurrency, query)
+
+        # Issues created or deleted mid-scan shift page boundaries; when the
+        # totals disagree, walk the project once more so nothing is skipped.
+        if any(page.get("total_count", 0) != total_count for page in pages):
+            offset = 0
+            while True:
+                page = self._fetch_issue_page(project_id, offset, headers, timeout, query=query)
+                pages.append(page)
+                if offset + page_size >= page.get("total_count", 0):
+                    break
+                offset += page_size
+
+        # Merge in page order, dropping issues seen on an earlier page
+        issues = []
+        seen_ids = set()
+        for page in pages:
+            for issue in page.get("issues", []):
+                if issue["id"] not in seen_ids:
+                    seen_ids.add(issue["id"])
+                    issues.append(issue)
         return issues
 
+    def _iter_issue_pages(self, project_id: int, headers: dict, timeout: int,
+                          concurrency: Optional[int] = None, sort: str = "id:desc",
+                          query: str = "", total_counts: Optional[List[int]] = None) -> Iterator[List[dict]]:
+        """Yield issue pages in order, keeping up to `concurrency` requests in flight ahead.
+
+        Each page's total_count is appended to `total_counts` when given.
+        """
+        page_size = self.default_config["page_size"]
+        concurrency = max(1, concurrency or self._config("fetch_concurrency"))
+        if total_counts is None:
+            total_counts = []
+
+        first = self._fetch_issue_page(project_id, 0, headers, timeout, sort, query)
+        total_counts.append(first.get("total_count", 0))
+        yield first.get("issues", [])
+        offsets = iter(range(page_size, first.get("total_count", 0), page_size))
+        fetch_page = bind_context(self._fetch_issue_page)
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            pending = deque()
+            for offset in offsets:
+                pending.append(pool.submit(fetch_page, project_id, offset, headers, timeout, sort, query))
+                if len(pending) >= concurrency:
+                    break
+            while pending:
+                page = pending.popleft().result()
+                offset = next(offsets, None)
+                if offset is not None:
+                    pending.append(pool.submit(fetch_page, project_id, offset, headers, timeout, sort, query))
+                total_counts.append(page.get("total_count", 0))
+                yield page.get("issues", [])
+
+    def _assignee_name(self, issue: dict) -> str:
+        return issue.get("assigned_to", {}).get("name") or "Unassigned"
+
+    def _iter_dashboard_html(self, project_name: str, issues: Iterable[dict], stats: dict,
+                             extra_sections: Optional[List[str]] = None) -> Iterator[str]:
+        """Stream the dashboard for issues that arrive grouped by assignee"""
+        yield self._html_template_head(project_name)
+        for user, user_issues in groupby(issues, key=self._assignee_name):
+            stats["sections"] += 1
+            record_job_sections()
+            yield from self._iter_user_section(user, user_issues)
+        yield from extra_sections or []
+        yield self._html_template_tail()
+
+    def _spool_issue_pages(self, spool: IssueSpool, project_id: int, headers: dict, timeout: int,
+                           concurrency: Optional[int], query: str, stats: dict) -> None:
+        """Spool every issue of the listing, walking it once more if it shifted mid-scan"""
+        total_counts: List[int] = []
+        for page in self._iter_issue_pages(project_id, headers, timeout, concurrency, query=query,
+                                           total_counts=total_counts):
+            stats["pages"] += 1
+            spool.add(page)
+        # Issues created or deleted mid-scan shift page boundaries, as in _fetch_all_issues
+        if len(set(total_counts)) > 1 or len(spool) < total_counts[0]:
+            for page in self._iter_issue_pages(project_id, headers, timeout, concurrency, query=query):
+                stats["pages"] += 1
+                spool.add(page)
+
+    @spanned("stream_to_file")
+    def _stream_dashboard_to_file(self, project_name: str, project_id: int, headers: dict,
+                                  concurrency: Optional[int] = None, query: str = "",
+                                  extra_sections: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Render the dashboard to a file, parking issues on disk rather than in memory.
+
+        The spool keeps one row per issue id and returns each assignee's
+        issues together, so an issue reassigned (or a page re-read) during
+        the scan never yields a second section for the same user.
+        """
+        timeout = self.default_config["timeout"]
+        stats = {"pages": 0, "issues": 0, "sections": 0}
+        spool = IssueSpool(self._assignee_name)
+        try:
+            # The mirror only holds open issues, so filtered reports go to Redmine
+            mirror = None if query else get_issue_mirror()
+            issues = self._fetch_mirrored_issues(mirror, project_id, headers, timeout) if mirror else None
+            if issues is not None:
+                stats["pages"] += 1
+                spool.add(issues)
+            else:
+                self._spool_issue_pages(spool, project_id, headers, timeout, concurrency, query, stats)
+            stats["issues"] = len(spool)
+            chunks = self._iter_dashboard_html(project_name, iter(spool), stats, extra_sections)
+            output = write_report(chunks, report_file_name(project_name))
+        finally:
+            spool.close()
+        return {"project": project_name, **output, **stats}
+
+    def _get_json(self, endpoint: str, headers: dict, timeout: int) -> dict:
+        """GET an endpoint through the shared session and return its JSON"""
+        url = f"{self.REDMINE_API_URL}{endpoint}"
+
+        def fetch() -> dict:
+            resp = get_session().get(url, headers=headers, timeout=timeout)
+            resp.raise_for_status()
+            with span("json_decode"):
+                return resp.json()
+
+        # Identical concurrent GETs share one upstream call
+        return coalesce(url, headers.get("X-Redmine-API-Key"), fetch)
+
+    @spanned("compile_filter")
+    def _compile_filter(self, filter_value: Any, project_id: int, headers: dict, timeout: int,
+                        shared: Optional[Dict[str, Dict[str, int]]] = None) -> List[tuple]:
+        """Compile the `filter` argument to /issues.json parameters (ValueError if invalid)"""
+        if not filter_value:
+            return []
+        return compile_filter(
+            filter_value, make_lookup(lambda e: self._get_json(e, headers, timeout), project_id, shared)
+        )
+
+    @spanned("mirror_sync")
+    def _fetch_mirrored_issues(self, mirror: IssueMirror, project_id: int, headers: dict,
+                               timeout: int) -> Optional[List[dict]]:
+        """Open issues served from the local mirror after an incremental sync.
+
+        None while the project's first load is still running in the
+        background; the caller then reads from Redmine.
+        """
+        fetch = lambda endpoint: self._get_json(endpoint, headers, timeout)
+        statuses = fetch("/issue_statuses.json").get("issue_statuses", [])
+        closed_ids = {s["id"] for s in statuses if s.get("is_closed")}
+        scope = cache_scope(self.REDMINE_API_URL, self.REDMINE_API_KEY)
+        if not mirror.is_loaded(scope, project_id):
+            mirror.load_in_background(scope, project_id, bind_context(fetch), closed_ids)
+            return None
+        mirror.sync(scope, project_id, fetch, closed_ids)
+        return mirror.issues(scope, project_id)
+
+    @spanned("group_by_assignee")
     def _group_issues_by_assignee(self, issues: List[dict]) -> defaultdict:
         """Group issues by assignee"""
         users_issues = defaultdict(list)
@@ -479,22 +1186,6 @@ class RedmineDashboardTool(BaseTool):
         priority = issue.get("priority", {}).get("name") or "Normal"
         status = issue.get("status", {}).get("name") or "Open"
         
-        # Priority and status colors
-        PRIORITY_COLORS = {
-            "high": "#ff4757",
-            "normal": "#2ed573",
-            "low": "#1e90ff"
-        }
-        STATUS_COLORS = {
-            "New": "#a4b0be",
-            "In Progress": "#ffa502",
-            "Deployed to UAT": "#3742fa",
-            "Deployed to Production": "#2ed573",
-            "Awaiting For Customer Demo": "#9b59b6",
-            "On Hold": "#e67e22",
-            "default": "#7f8c8d"
-        }
-        
         # Overdue calculation
         today = datetime.today().date()
         due_date = issue.get("due_date")
@@ -504,42 +1195,34 @@ class RedmineDashboardTool(BaseTool):
             if due_dt < today:
                 overdue = " (Overdue)"
         
+        return self._format_issue_row(
+            issue['id'], issue['subject'], priority, self._priority_color(priority),
+            status, self._status_color(status), overdue, index
+        )
+
+    def _priority_color(self, priority: str) -> str:
+        return self.PRIORITY_COLORS.get(priority.lower(), "#2ed573")
+
+    def _status_color(self, status: str) -> str:
+        return self.STATUS_COLORS.get(status, self.STATUS_COLORS["default"])
+
+    def _format_issue_row(self, issue_id: int, subject: str, priority: str, priority_bg: str,
+                          status: str, status_bg: str, overdue: str, index: int) -> str:
+        """HTML row from already-resolved values and colors"""
         # Row styling
         bg_color = "rgba(255, 255, 255, 0.05)" if index % 2 else "rgba(255, 255, 255, 0.1)"
-        priority_bg = PRIORITY_COLORS.get(priority.lower(), "#2ed573")
-        status_bg = STATUS_COLORS.get(status, STATUS_COLORS["default"])
         
         return f"""
         <tr style="background-color:{bg_color}">
-            <td style="padding:12px; border-bottom:1px solid rgba(255,255,255,0.1)">{issue['id']}</td>
-            <td style="padding:12px; border-bottom:1px solid rgba(255,255,255,0.1)">{issue['subject']}</td>
+            <td style="padding:12px; border-bottom:1px solid rgba(255,255,255,0.1)">{issue_id}</td>
+            <td style="padding:12px; border-bottom:1px solid rgba(255,255,255,0.1)">{subject}</td>
             <td style="padding:12px; border-bottom:1px solid rgba(255,255,255,0.1); background-color:{priority_bg}">{priority}</td>
             <td style="padding:12px; border-bottom:1px solid rgba(255,255,255,0.1); background-color:{status_bg}">{status}{overdue}</td>
         </tr>
         """
 
-    def _generate_user_section(self, user: str, user_issues: List[dict]) -> str:
-        """Generate HTML section for a user with charts and issue table"""
-        priority_count = defaultdict(int)
-        status_count = defaultdict(int)
-        summary_rows = []
-        
-        for i, issue in enumerate(user_issues):
-            priority = issue.get("priority", {}).get("name") or "Normal"
-            status = issue.get("status", {}).get("name") or "Open"
-            priority_count[priority] += 1
-            status_count[status] += 1
-            summary_rows.append(self._generate_issue_row(issue, i))
-        
-        # Prepare chart data
-        priority_labels = list(priority_count.keys())
-        priority_values = [priority_count[k] for k in priority_labels]
-        status_labels = list(status_count.keys())
-        status_values = [status_count[k] for k in status_labels]
-        
-        # Generate unique IDs for charts
-        user_id = user.replace(" ", "_")
-        
+    def _user_section_head(self, user: str, user_id: str) -> str:
+        """Opening HTML of a user section: title, chart canvases and table header"""
         return f"""
         <div class="user-section">
             <h2 class="user-title">{user}</h2>
@@ -563,11 +1246,17 @@ class RedmineDashboardTool(BaseTool):
                         </tr>
                     </thead>
                     <tbody>
-                        {''.join(summary_rows)}
-                    </tbody>
-                </table>
-            </div>
-            <script>
+                        """
+
+    def _user_section_charts(self, user_id: str, priority_count: dict, status_count: dict) -> str:
+        """Chart.js script for a user's priority and status charts"""
+        # Prepare chart data
+        priority_labels = list(priority_count.keys())
+        priority_values = [priority_count[k] for k in priority_labels]
+        status_labels = list(status_count.keys())
+        status_values = [status_count[k] for k in status_labels]
+        
+        return f"""<script>
                 // Priority Chart
                 new Chart(
                     document.getElementById('{user_id}_priorityChart').getContext('2d'), {{
@@ -647,12 +1336,79 @@ class RedmineDashboardTool(BaseTool):
                         }}
                     }}
                 );
-            </script>
+            </script>"""
+
+    def _user_section_tail(self, user_id: str, priority_count: dict, status_count: dict) -> str:
+        """Closing HTML of a user section, including the chart scripts"""
+        return (
+            """
+                    </tbody>
+                </table>
+            </div>
+            """
+            + self._user_section_charts(user_id, priority_count, status_count)
+            + """
         </div>
         """
+        )
 
-    def _generate_html_template(self, project_name: str, html_sections: List[str]) -> str:
-        """Generate the complete HTML template with all sections"""
+    def _iter_user_section(self, user: str, user_issues: Iterable[dict]) -> Iterator[str]:
+        """Yield a user section piece by piece so issue rows can be streamed"""
+        priority_count = defaultdict(int)
+        status_count = defaultdict(int)
+        
+        # Generate unique IDs for charts
+        user_id = user.replace(" ", "_")
+        
+        yield self._user_section_head(user, user_id)
+        for i, issue in enumerate(user_issues):
+            priority = issue.get("priority", {}).get("name") or "Normal"
+            status = issue.get("status", {}).get("name") or "Open"
+            priority_count[priority] += 1
+            status_count[status] += 1
+            yield self._generate_issue_row(issue, i)
+        yield self._user_section_tail(user_id, priority_count, status_count)
+
+    def _iter_frame_sections(self, frame: IssueFrame, reuse: Optional[Dict[str, str]] = None) -> Iterator[str]:
+        """User sections straight from the columnar frame, one pass per column.
+
+        `reuse` maps assignee names to already rendered sections that are
+        yielded as-is instead of being rendered again.
+        """
+        priority_names, status_names = frame.priorities.names, frame.statuses.names
+        # Colors are resolved once per distinct name rather than once per row
+        priority_bgs = [self._priority_color(name) for name in priority_names]
+        status_bgs = [self._status_color(name) for name in status_names]
+        overdue_labels = ("", " (Overdue)")
+        groups = frame.group_by_assignee()
+        record_job_sections(0, total=len(groups))
+        for assignee_code, rows in groups.items():
+            user = frame.assignees.names[assignee_code]
+            record_job_sections()
+            if reuse and user in reuse:
+                yield reuse[user]
+                continue
+            user_id = user.replace(" ", "_")
+            parts = [self._user_section_head(user, user_id)]
+            for i, row in enumerate(rows):
+                p, st = frame.priority[row], frame.status[row]
+                parts.append(self._format_issue_row(
+                    frame.ids[row], frame.subjects[row], priority_names[p], priority_bgs[p],
+                    status_names[st], status_bgs[st], overdue_labels[frame.overdue[row]], i
+                ))
+            parts.append(self._user_section_tail(
+                user_id,
+                frame.count_by(frame.priority, priority_names, rows),
+                frame.count_by(frame.status, status_names, rows)
+            ))
+            yield "".join(parts)
+
+    def _generate_user_section(self, user: str, user_issues: List[dict]) -> str:
+        """Generate HTML section for a user with charts and issue table"""
+        return "".join(self._iter_user_section(user, user_issues))
+
+    def _html_template_head(self, project_name: str) -> str:
+        """Document head, styles and page header"""
         return f"""
         <!DOCTYPE html>
         <html lang="en">
@@ -823,42 +1579,603 @@ class RedmineDashboardTool(BaseTool):
                 <h1>Redmine Project Dashboard</h1>
                 <p>Project: {project_name}</p>
             </div>
-            {''.join(html_sections)}
+            """
+
+    def _html_template_tail(self) -> str:
+        return """
         </body>
         </html>
         """
 
+    def _count_issues(self, project_id: int, query: str, headers: dict, timeout: int) -> int:
+        """Number of project issues matching `query`, read from total_count of a limit=1 probe"""
+        data = self._get_json(f"/issues.json?project_id={project_id}&limit=1&{query}", headers, timeout)
+        return data.get("total_count", 0)
+
+    def _project_assignees(self, project_id: int, headers: dict, timeout: int) -> List[tuple]:
+        """(id, name) of the users and groups that are members of the project"""
+        assignees = {}
+        offset = 0
+        while True:
+            data = self._get_json(
+                f"/projects/{project_id}/memberships.json?limit=100&offset={offset}", headers, timeout
+            )
+            for membership in data.get("memberships", []):
+                principal = membership.get("user") or membership.get("group")
+                if principal:
+                    assignees[principal["id"]] = principal["name"]
+            if offset + 100 >= data.get("total_count", 0):
+                break
+            offset += 100
+        return list(assignees.items())
+
+    @spanned("summary_counts")
+    def _summary_counts(self, project_id: int, headers: dict, timeout: int,
+                        concurrency: Optional[int] = None, base_query: str = "") -> Dict[str, Any]:
+        """Open-issue counts per assignee x status and assignee x priority, without issue bodies"""
+        statuses = [
+            s for s in self._get_json("/issue_statuses.json", headers, timeout).get("issue_statuses", [])
+            if not s.get("is_closed")
+        ]
+        priorities = self._get_json("/enumerations/issue_priorities.json", headers, timeout).get("issue_priorities", [])
+        assignees = self._project_assignees(project_id, headers, timeout) + [("!*", "Unassigned")]
+        count = bind_context(lambda query: self._count_issues(
+            project_id, f"{query}&{base_query}" if base_query else query, headers, timeout
+        ))
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency or self._config("fetch_concurrency"))) as pool:
+            # First pass prunes assignees, statuses and priorities with no open issues
+            first_pass = (
+                ["status_id=open"]
+                + [f"status_id=open&assigned_to_id={assignee_id}" for assignee_id, _name in assignees]
+                + [f"status_id={s['id']}" for s in statuses]
+                + [f"status_id=open&priority_id={p['id']}" for p in priorities]
+            )
+            totals = list(pool.map(count, first_pass))
+            open_total = totals[0]
+            assignee_totals = totals[1:1 + len(assignees)]
+            status_totals = totals[1 + len(assignees):1 + len(assignees) + len(statuses)]
+            priority_totals = totals[1 + len(assignees) + len(statuses):]
+            active_assignees = [(a, total) for a, total in zip(assignees, assignee_totals) if total]
+            active_statuses = [s for s, total in zip(statuses, status_totals) if total]
+            active_priorities = [p for p, total in zip(priorities, priority_totals) if total]
+
+            # Second pass: one probe per active assignee x status / priority
+            cells = []
+            for (assignee_id, name), _total in active_assignees:
+                cells += [(name, "status", s["name"], f"status_id={s['id']}&assigned_to_id={assignee_id}")
+                          for s in active_statuses]
+                cells += [(name, "priority", p["name"], f"status_id=open&priority_id={p['id']}&assigned_to_id={assignee_id}")
+                          for p in active_priorities]
+            cell_counts = list(pool.map(count, [cell[3] for cell in cells]))
+
+        users = {name: {"total": total, "priority": {}, "status": {}} for (_id, name), total in active_assignees}
+        for (name, dimension, label, _query), value in zip(cells, cell_counts):
+            if value:
+                users[name][dimension][label] = value
+        return {
+            "open_total": open_total,
+            # Issues assigned to principals that are no longer project members
+            "unattributed": open_total - sum(total for _assignee, total in active_assignees),
+            "users": users,
+            "assignee_ids": {name: assignee_id for assignee_id, name in assignees}
+        }
+
+    def _generate_summary_section(self, user: str, total: int, priority_count: dict, status_count: dict) -> str:
+        """Charts-only section for count-based summary dashboards"""
+        user_id = user.replace(" ", "_")
+        return f"""
+        <div class="user-section">
+            <h2 class="user-title">{user} ({total} open)</h2>
+            <div class="chart-container">
+                <div class="chart-box">
+                    <canvas id="{user_id}_priorityChart"></canvas>
+                </div>
+                <div class="chart-box">
+                    <canvas id="{user_id}_statusChart"></canvas>
+                </div>
+            </div>
+            {self._user_section_charts(user_id, priority_count, status_count)}
+        </div>
+        """
+
+    def _generate_summary_dashboard(self, project_name: str, project_id: int, headers: dict,
+                                    arguments: Dict[str, Any], filter_params: Optional[List[tuple]] = None,
+                                    extra_sections: Optional[List[str]] = None) -> str:
+        """Summary dashboard from total_count probes, with optional drill-down for one user"""
+        timeout = self.default_config["timeout"]
+        # Probes set status_id themselves; every other filter narrows each count
+        base_query = to_query(without(filter_params or [], "status_id", "assigned_to_id"))
+        summary = self._summary_counts(project_id, headers, timeout, arguments.get("concurrency"), base_query)
+        drilldown = (arguments.get("drilldown_user") or "").casefold()
+
+        html_sections = []
+        record_job_sections(0, total=len(summary["users"]))
+        for user, counts in summary["users"].items():
+            record_job_sections()
+            assignee_id = summary["assignee_ids"].get(user)
+            if drilldown and user.casefold() == drilldown and assignee_id is not None:
+                drilldown_query = f"assigned_to_id={assignee_id}" + (f"&{base_query}" if base_query else "")
+                user_issues = self._fetch_all_issues(
+                    project_id, headers, timeout, arguments.get("concurrency"), drilldown_query
+                )
+                html_sections.append(self._generate_user_section(user, user_issues))
+            else:
+                html_sections.append(
+                    self._generate_summary_section(user, counts["total"], counts["priority"], counts["status"])
+                )
+        if summary["unattributed"] > 0:
+            html_sections.append(f"""
+        <div class="user-section">
+            <h2 class="user-title">Other assignees ({summary["unattributed"]} open)</h2>
+        </div>
+        """)
+        return self._generate_html_template(project_name, html_sections + (extra_sections or []))
+
+    @spanned("render_compact")
+    def _generate_compact_html(self, project_name: str, users_issues: Dict[str, List[dict]],
+                               extra_sections: Optional[List[str]] = None) -> str:
+        """Compact dashboard: one data blob and one script instead of per-row markup"""
+        body = render_compact_body(
+            users_issues, self.PRIORITY_COLORS, self.STATUS_COLORS,
+            "#2ed573", self.STATUS_COLORS["default"]
+        )
+        return self._html_template_head(project_name) + body + ''.join(extra_sections or []) + self._html_template_tail()
+
+    @spanned("render_template")
+    def _generate_html_template(self, project_name: str, html_sections: List[str]) -> str:
+        """Generate the complete HTML template with all sections"""
+        return self._html_template_head(project_name) + ''.join(html_sections) + self._html_template_tail()
+
+    def _resolve_portfolio(self, names: List[str], include_subprojects: bool,
+                           timeout: int) -> tuple:
+        """(projects, failures) for the requested names, subprojects appended after their parent"""
+        catalog = get_project_catalog(self.REDMINE_API_URL, self.REDMINE_API_KEY, timeout)
+        projects, failures = {}, []
+        for name in names:
+            project = catalog.get(name)
+            if not project:
+                failures.append({"project": name, "error": "Project not found"})
+                continue
+            projects.setdefault(project["id"], project)
+            if include_subprojects:
+                for subproject in catalog.subprojects(project["id"]):
+                    projects.setdefault(subproject["id"], subproject)
+        return list(projects.values()), failures
+
+    def _report_progress(self, event: Dict[str, Any]) -> None:
+        """Publish a progress event to the requesting user's desk (best effort)"""
+        if not getattr(frappe.local, "site", None):
+            return
+        try:
+            frappe.publish_realtime("redmine_dashboard_progress", event, user=frappe.session.user)
+        except Exception:
+            pass
+
+    @spanned("portfolio_fetch")
+    def _fetch_portfolio(self, projects: List[dict], headers: dict, timeout: int,
+                         concurrency: int, queries: Optional[Dict[int, str]] = None) -> Dict[int, dict]:
+        """Fetch every project's issues through one pool sized to the global budget.
+
+        First pages of all projects are queued up front and each project's
+        remaining pages as soon as its total is known, so the report takes
+        about as long as the slowest project. A failing project is recorded
+        with its error instead of aborting the others.
+        """
+        page_size = self.default_config["page_size"]
+        queries = queries or {}
+        started = time.monotonic()
+        states = {p["id"]: {"project": p, "pages": {}, "expected": None, "error": None} for p in projects}
+        done_count = 0
+
+        def finish(project_id: int) -> None:
+            nonlocal done_count
+            state = states[project_id]
+            state["elapsed_ms"] = round((time.monotonic() - started) * 1000)
+            done_count += 1
+            self._report_progress({
+                "project": state["project"]["name"],
+                "done": done_count,
+                "total": len(states),
+                "issues": sum(len(page.get("issues", [])) for page in state["pages"].values()),
+                "error": state["error"],
+            })
+
+        fetch_page = bind_context(self._fetch_issue_page)
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            submit = lambda project_id, offset: pool.submit(
+                fetch_page, project_id, offset, headers, timeout, "id:desc", queries.get(project_id, "")
+            )
+            pending = {submit(project_id, 0): (project_id, 0) for project_id in states}
+            # Completed pages are merged on this thread only
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    project_id, offset = pending.pop(future)
+                    state = states[project_id]
+                    if state["error"]:
+                        continue
+                    try:
+                        page = future.result()
+                    except Exception as e:
+                        state["error"] = str(e)
+                        finish(project_id)
+                        continue
+                    state["pages"][offset] = page
+                    if offset == 0:
+                        offsets = range(page_size, page.get("total_count", 0), page_size)
+                        state["expected"] = 1 + len(offsets)
+                        for next_offset in offsets:
+                            pending[submit(project_id, next_offset)] = (project_id, next_offset)
+                    if len(state["pages"]) == state["expected"]:
+                        finish(project_id)
+
+        for project_id, state in states.items():
+            if state["error"]:
+                continue
+            pages = [state["pages"][offset] for offset in sorted(state["pages"])]
+            if len({page.get("total_count", 0) for page in pages}) > 1:
+                # Project changed mid-scan: walk it again the slow, consistent way
+                state["issues"] = self._fetch_all_issues(
+                    project_id, headers, timeout, 1, queries.get(project_id, "")
+                )
+                continue
+            issues, seen_ids = [], set()
+            for page in pages:
+                for issue in page.get("issues", []):
+                    if issue["id"] not in seen_ids:
+                        seen_ids.add(issue["id"])
+                        issues.append(issue)
+            state["issues"] = issues
+        return states
+
+    @spanned("time_report")
+    def _time_report_sections(self, project_id: int, headers: dict, arguments: Dict[str, Any]) -> List[str]:
+        """Spent-time section requested with `time_report`, or none"""
+        spec = arguments.get("time_report")
+        if not spec:
+            return []
+        spec = spec if isinstance(spec, dict) else {}
+        timeout = self.default_config["timeout"]
+        totals = aggregate_time_entries(
+            bind_context(lambda endpoint: self._get_json(endpoint, headers, timeout)),
+            time_entries_query(project_id, spec.get("from_date"), spec.get("to_date")),
+            max(1, arguments.get("concurrency") or self._config("fetch_concurrency"))
+        )
+        return [self._generate_time_section(totals.tables(10))]
+
+    def _generate_time_section(self, report: Dict[str, Any]) -> str:
+        """Weekly and per-activity hour charts with hours per user and the top issues"""
+        weeks = report["by_week"]["rows"]
+        activities = report["by_activity"]["rows"]
+        period = f"{report['from']} to {report['to']}" if report["entries"] else "no entries"
+        return f"""
+        <div class="user-section">
+            <h2 class="user-title">Time Spent ({report["total_hours"]} h, {period})</h2>
+            <div class="chart-container">
+                <div class="chart-box">
+                    <canvas id="time_weekChart"></canvas>
+                </div>
+                <div class="chart-box">
+                    <canvas id="time_activityChart"></canvas>
+                </div>
+            </div>
+            <h3 class="table-title">Hours by User</h3>
+            {self._portfolio_table(["User", "Hours", "Entries"], report["by_user"]["rows"])}
+            <h3 class="table-title">Top Issues ({report["issue_count"]} with time logged)</h3>
+            {self._portfolio_table(["Issue", "Hours", "Entries"], [[f"#{row[0]}", row[1], row[2]] for row in report["by_issue"]["rows"]])}
+            <script>
+                new Chart(
+                    document.getElementById('time_weekChart').getContext('2d'), {{
+                        type: 'bar',
+                        data: {{
+                            labels: {json.dumps([row[0] for row in weeks])},
+                            datasets: [{{
+                                label: 'Hours',
+                                data: {json.dumps([row[1] for row in weeks])},
+                                backgroundColor: '#1e90ff',
+                                borderColor: 'rgba(255, 255, 255, 0.2)',
+                                borderWidth: 1
+                            }}]
+                        }},
+                        options: {{
+                            responsive: true,
+                            maintainAspectRatio: false,
+                            plugins: {{
+                                legend: {{ display: false }},
+                                title: {{ display: true, text: 'Hours per Week', color: '#ffffff', font: {{ size: 14 }} }}
+                            }},
+                            scales: {{
+                                x: {{ grid: {{ color: 'rgba(255, 255, 255, 0.1)' }}, ticks: {{ color: '#ffffff' }} }},
+                                y: {{ grid: {{ color: 'rgba(255, 255, 255, 0.1)' }}, ticks: {{ color: '#ffffff' }}, beginAtZero: true }}
+                            }}
+                        }}
+                    }}
+                );
+                new Chart(
+                    document.getElementById('time_activityChart').getContext('2d'), {{
+                        type: 'doughnut',
+                        data: {{
+                            labels: {json.dumps([row[0] for row in activities])},
+                            datasets: [{{
+                                label: 'Hours by Activity',
+                                data: {json.dumps([row[1] for row in activities])},
+                                backgroundColor: [
+                                    '#a4b0be', '#ffa502', '#3742fa', '#2ed573',
+                                    '#9b59b6', '#e67e22', '#7f8c8d'
+                                ],
+                                borderColor: 'rgba(255, 255, 255, 0.2)',
+                                borderWidth: 1
+                            }}]
+                        }},
+                        options: {{
+                            responsive: true,
+                            maintainAspectRatio: false,
+                            plugins: {{
+                                legend: {{ position: 'right', labels: {{ color: '#ffffff' }} }},
+                                title: {{ display: true, text: 'Hours by Activity', color: '#ffffff', font: {{ size: 14 }} }}
+                            }},
+                            cutout: '65%'
+                        }}
+                    }}
+                );
+            </script>
+        </div>
+        """
+
+    def _portfolio_table(self, headings: List[str], rows: List[List[Any]]) -> str:
+        """Plain table in the dashboard's issue-table styling"""
+        cell_style = "padding:12px; border-bottom:1px solid rgba(255,255,255,0.1)"
+        body = []
+        for i, row in enumerate(rows):
+            bg_color = "rgba(255, 255, 255, 0.05)" if i % 2 else "rgba(255, 255, 255, 0.1)"
+            cells = "".join(f'<td style="{cell_style}">{cell}</td>' for cell in row)
+            body.append(f'<tr style="background-color:{bg_color}">{cells}</tr>')
+        return f"""
+            <div class="table-container">
+                <table class="issue-table">
+                    <thead>
+                        <tr>{"".join(f"<th>{heading}</th>" for heading in headings)}</tr>
+                    </thead>
+                    <tbody>
+                        {"".join(body)}
+                    </tbody>
+                </table>
+            </div>
+        """
+
+    @spanned("portfolio_render")
+    def _generate_portfolio_html(self, title: str, states: Dict[int, dict], failures: List[dict]) -> str:
+        """Roll-up report: project overview, per-project assignee tables and cross-project charts"""
+        breakdown = lambda counts: ", ".join(f"{name} {count}" for name, count in counts.items())
+        overview, project_sections = [], []
+        rollup: Dict[str, dict] = {}
+        record_job_sections(0, total=len(states))
+        for state in states.values():
+            record_job_sections()
+            name = state["project"]["name"]
+            if state["error"]:
+                overview.append([name, "-", "-", "-", state.get("elapsed_ms", "-"), f"Failed: {state['error']}"])
+                continue
+            frame = IssueFrame.from_issues(state["issues"])
+            assignee_rows = []
+            for assignee_code, rows in frame.group_by_assignee().items():
+                user = frame.assignees.names[assignee_code]
+                priority_count = frame.count_by(frame.priority, frame.priorities.names, rows)
+                status_count = frame.count_by(frame.status, frame.statuses.names, rows)
+                overdue = sum(frame.overdue[row] for row in rows)
+                assignee_rows.append([user, len(rows), overdue, breakdown(priority_count), breakdown(status_count)])
+
+                totals = rollup.setdefault(user, {"total": 0, "priority": {}, "status": {}, "projects": {}})
+                totals["total"] += len(rows)
+                totals["projects"][name] = len(rows)
+                for key, counts in (("priority", priority_count), ("status", status_count)):
+                    for label, count in counts.items():
+                        totals[key][label] = totals[key].get(label, 0) + count
+            overview.append([
+                name, len(frame), sum(frame.overdue), len(assignee_rows), state["elapsed_ms"], "OK"
+            ])
+            project_sections.append(f"""
+        <div class="user-section">
+            <h2 class="user-title">{name} ({len(frame)} issues)</h2>
+            {self._portfolio_table(["Assignee", "Issues", "Overdue", "Priority", "Status"], assignee_rows)}
+        </div>
+        """)
+        for failure in failures:
+            overview.append([failure["project"], "-", "-", "-", "-", f"Failed: {failure['error']}"])
+
+        rollup_rows = [
+            [user, totals["total"], breakdown(totals["projects"])]
+            for user, totals in sorted(rollup.items(), key=lambda item: -item[1]["total"])
+        ]
+        sections = [f"""
+        <div class="user-section">
+            <h2 class="user-title">Portfolio Overview</h2>
+            {self._portfolio_table(["Project", "Issues", "Overdue", "Assignees", "Fetch (ms)", "Status"], overview)}
+            <h3 class="table-title">Assignees Across Projects</h3>
+            {self._portfolio_table(["Assignee", "Issues", "Projects"], rollup_rows)}
+        </div>
+        """]
+        sections += project_sections
+        sections += [
+            self._generate_summary_section(user, totals["total"], totals["priority"], totals["status"])
+            for user, totals in rollup.items()
+        ]
+        return self._generate_html_template(title, sections)
+
+    def _generate_portfolio(self, arguments: Dict[str, Any], headers: dict) -> Dict[str, Any]:
+        """Portfolio mode: many projects fetched concurrently into one roll-up report"""
+        timeout = self.default_config["timeout"]
+        projects, failures = self._resolve_portfolio(
+            arguments["projects"], bool(arguments.get("include_subprojects")), timeout
+        )
+        if not projects:
+            return {"success": False, "error": "None of the requested projects were found"}
+
+        # Assignee names resolve against each project's own members; a project
+        # the filter cannot be compiled for is reported as failed
+        queries, shared, error = {}, {}, None
+        for project in projects:
+            try:
+                queries[project["id"]] = to_query(self._compile_filter(
+                    arguments.get("filter"), project["id"], headers, timeout, shared
+                ))
+            except ValueError as e:
+                error = str(e)
+                failures.append({"project": project["name"], "error": error})
+        projects = [project for project in projects if project["id"] in queries]
+        if not projects:
+            return {"success": False, "error": error}
+
+        concurrency = arguments.get("concurrency") or self._config("portfolio_concurrency")
+        states = self._fetch_portfolio(projects, headers, timeout, concurrency, queries)
+        if all(state["error"] for state in states.values()):
+            errors = "; ".join(f"{s['project']['name']}: {s['error']}" for s in states.values())
+            return {"success": False, "error": f"All projects failed: {errors}"}
+
+        title = f"Portfolio ({len(states)} projects)"
+        render_started = time.perf_counter()
+        html = self._generate_portfolio_html(title, states, failures)
+        record_render("portfolio", time.perf_counter() - render_started, len(html))
+        if arguments.get("output") == "file":
+            output = write_report([html], report_file_name(title))
+            return {"success": True, "result": {
+                **output,
+                "projects": len(states),
+                "failed": [s["project"]["name"] for s in states.values() if s["error"]]
+                + [f["project"] for f in failures],
+            }}
+        return {"success": True, "result": html}
+
+    @spanned("report_fingerprint")
+    def _report_fingerprint(self, project_id: int, query: str, headers: dict, timeout: int) -> List[Any]:
+        """total_count and newest updated_on of the issues a report covers, from one probe"""
+        probe = self._get_json(
+            f"/issues.json?project_id={project_id}&limit=1&sort=updated_on:desc{'&' + query if query else ''}",
+            headers, timeout
+        )
+        return issue_fingerprint(probe)
+
+    def _render_dashboard(self, project_name: str, project_id: int, headers: dict,
+                          arguments: Dict[str, Any], query: str = "",
+                          extra_sections: Optional[List[str]] = None) -> str:
+        """Inline dashboard, served from or stored in the shared report cache when enabled"""
+        timeout = self.default_config["timeout"]
+        render = arguments.get("render") or "standard"
+        # The issue fingerprint does not cover extra sections, so those pages are not cached
+        report_cache = None if extra_sections else get_report_cache()
+        cached = None
+        if report_cache:
+            cache_key = ReportCache.make_key(
+                self.REDMINE_API_URL, self.REDMINE_API_KEY, project_name, project_id, query, render
+            )
+            fingerprint = self._report_fingerprint(project_id, query, headers, timeout)
+            with span("report_cache_get"):
+                cached = report_cache.get(cache_key)
+            if cached and cached["fingerprint"] == fingerprint:
+                record_cache("report", "hit")
+                return cached["html"]
+            record_cache("report", "miss")
+        
+        # Fetch all issues (from the local mirror when enabled and unfiltered)
+        mirror = None if query else get_issue_mirror()
+        issues = self._fetch_mirrored_issues(mirror, project_id, headers, timeout) if mirror else None
+        if issues is None:
+            issues = self._fetch_all_issues(project_id, headers, timeout, arguments.get("concurrency"), query)
+        
+        render_started = time.perf_counter()
+        if render == "compact":
+            users_issues = self._group_issues_by_assignee(issues)
+            final_html = self._generate_compact_html(project_name, users_issues, extra_sections)
+            record_job_sections(len(users_issues), total=len(users_issues))
+            record_render(render, time.perf_counter() - render_started, len(final_html))
+            if report_cache:
+                report_cache.put(cache_key, fingerprint, final_html)
+            return final_html
+        
+        # Sections whose assignee's issues are unchanged are reused from the last render
+        signatures = section_signatures(issues) if report_cache else {}
+        stored_sections = cached["sections"] if cached else {}
+        reuse = {user: stored_sections[sig] for user, sig in signatures.items() if sig in stored_sections}
+        if report_cache:
+            record_cache("report_section", "hit", len(reuse))
+            record_cache("report_section", "miss", len(signatures) - len(reuse))
+        
+        # Generate HTML sections for each user from the columnar frame
+        with span("build_frame", issues=len(issues)):
+            frame = IssueFrame.from_issues(issues)
+        with span("render_sections", reused=len(reuse)):
+            html_sections = list(self._iter_frame_sections(frame, reuse))
+        
+        # Generate final HTML
+        final_html = self._generate_html_template(project_name, html_sections + (extra_sections or []))
+        record_render(render, time.perf_counter() - render_started, len(final_html))
+        
+        if report_cache:
+            report_cache.put(cache_key, fingerprint, final_html, {
+                signatures[user]: section for user, section in zip(frame.assignees.names, html_sections)
+            })
+        return final_html
+
+    @traced("redmine_dashboard_tool")
+    @instrumented("redmine_dashboard_tool", _dashboard_action)
     def execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         try:
+            headers = {"X-Redmine-API-Key": self.REDMINE_API_KEY}
+            
+            if arguments.get("action") == "get_report":
+                return get_report(arguments.get("job_id"), self.REDMINE_API_URL, self.REDMINE_API_KEY)
+            
+            if arguments.get("background"):
+                if not (arguments.get("project_name") or arguments.get("projects")):
+                    return {"success": False, "error": "project_name or projects is required"}
+                return submit_report_job(self.REDMINE_API_URL, self.REDMINE_API_KEY, arguments)
+            
+            if arguments.get("projects"):
+                try:
+                    return self._generate_portfolio(arguments, headers)
+                except ValueError as e:
+                    return {"success": False, "error": str(e)}
+            
             project_name = arguments.get("project_name")
             if not project_name:
-                return {"success": False, "error": "project_name is required"}
-            
-            headers = {
-                "X-Redmine-API-Key": self.REDMINE_API_KEY,
-                "Content-Type": "application/json"
-            }
+                return {"success": False, "error": "project_name or projects is required"}
             
             # Get project ID
             project_id = self._get_project_id(project_name, headers, self.default_config["timeout"])
             if not project_id:
                 return {"success": False, "error": f"Project '{project_name}' not found"}
             
-            # Fetch all issues
-            issues = self._fetch_all_issues(project_id, headers, self.default_config["timeout"])
+            # Push the optional filter down to Redmine's issue query
+            try:
+                filter_params = self._compile_filter(
+                    arguments.get("filter"), project_id, headers, self.default_config["timeout"]
+                )
+            except ValueError as e:
+                return {"success": False, "error": str(e)}
+            query = to_query(filter_params)
+            extra_sections = self._time_report_sections(project_id, headers, arguments)
             
-            # Group issues by assignee
-            users_issues = self._group_issues_by_assignee(issues)
+            if arguments.get("mode") == "summary":
+                return {
+                    "success": True,
+                    "result": self._generate_summary_dashboard(
+                        project_name, project_id, headers, arguments, filter_params, extra_sections
+                    )
+                }
             
-            # Generate HTML sections for each user
-            html_sections = []
-            for user, user_issues in users_issues.items():
-                html_sections.append(self._generate_user_section(user, user_issues))
+            if arguments.get("output") == "file":
+                return {
+                    "success": True,
+                    "result": self._stream_dashboard_to_file(
+                        project_name, project_id, headers, arguments.get("concurrency"), query, extra_sections
+                    )
+                }
             
-            # Generate final HTML
-            final_html = self._generate_html_template(project_name, html_sections)
-            
-            return {"success": True, "result": final_html}
+            return {
+                "success": True,
+                "result": self._render_dashboard(project_name, project_id, headers, arguments, query, extra_sections)
+            }
             
         except Exception as e:
             frappe.log_error(title=_("Redmine Issue Reporter Tool Error"), message=str(e))
@@ -0,0 +1,353 @@
+"""
+In-process metrics for the Redmine tools, exported in Prometheus text format.
+
+Recorded:
+
+* redmine_tool_action_seconds          tool action latency (tool, action, outcome)
+* redmine_upstream_requests_total      Redmine calls (method, endpoint template, status)
+* redmine_upstream_seconds             Redmine call latency (method, endpoint template)
+* redmine_upstream_response_bytes_total
+* redmine_upstream_retries_total       urllib3 retries (endpoint template)
+* redmine_action_pages / _response_bytes / _retries
+                                       per tool call: issue pages, bytes and retries
+* redmine_dashboard_render_seconds / redmine_dashboard_output_bytes
+* redmine_cache_requests_total         hit/miss per caching layer (cache, result)
+
+Each process records into its own registry behind one lock; recording is a
+dict lookup plus a bisect, cheap enough to leave on. At the end of every
+tool call the process adds what it recorded to shared totals in Redis
+(`frappe.cache()`, one pipelined HINCRBYFLOAT per series), so the export
+covers every gunicorn and RQ worker, including short-lived forked jobs.
+Without Redis each process keeps and exports only its own numbers. Set
+REDMINE_METRICS=0 to turn it off. Scrape
+`/api/method/redmine_mcp_tools.assistant_tools.metrics.export_metrics`
+(System Manager only).
+"""
+
+import contextvars
+import functools
+import json
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import frappe
+from werkzeug.wrappers import Response
+
+from redmine_mcp_tools.assistant_tools.http_client import env_flag
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+BYTES_BUCKETS = (1024, 10240, 102400, 1048576, 10485760, 104857600)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 1000)
+
+HELP = {
+    "redmine_tool_action_seconds": "Tool action latency in seconds",
+    "redmine_upstream_requests_total": "Requests sent to Redmine",
+    "redmine_upstream_seconds": "Redmine request latency in seconds",
+    "redmine_upstream_response_bytes_total": "Response bytes received from Redmine",
+    "redmine_upstream_retries_total": "Retries of Redmine requests",
+    "redmine_action_pages": "Issue pages fetched per tool call",
+    "redmine_action_response_bytes": "Response bytes received per tool call",
+    "redmine_action_retries": "Retries per tool call",
+    "redmine_dashboard_render_seconds": "Dashboard HTML render time in seconds",
+    "redmine_dashboard_output_bytes": "Dashboard HTML size in bytes",
+    "redmine_cache_requests_total": "Cache lookups by layer and result",
+}
+
+# Path segments that identify one object; replaced by ":id" in endpoint labels
+_ID_SEGMENT = re.compile(r"^\d+$")
+_ID_AFTER = {"projects", "users", "groups", "versions"}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+# Redis hash holding the totals of all processes; one field per series value
+SHARED_KEY = "redmine_metrics"
+
+
+def enabled() -> bool:
+    return env_flag("REDMINE_METRICS", True)
+
+
+def endpoint_template(url: str) -> str:
+    """'/issues/123.json?x=1' -> '/issues/:id.json'; keeps label cardinality low"""
+    segments = urlsplit(url).path.split("/")
+    for i, segment in enumerate(segments):
+        stem, dot, ext = segment.partition(".")
+        if _ID_SEGMENT.match(stem) or (i and segments[i - 1] in _ID_AFTER and stem):
+            segments[i] = f":id{dot}{ext}"
+    return "/".join(segments)
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        i = bisect_left(self.buckets, value)
+        if i < len(self.counts):
+            self.counts[i] += 1
+        self.sum += value
+        self.count += 1
+
+    def add(self, other: "_Histogram") -> None:
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.sum += other.sum
+        self.count += other.count
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, _Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        key = tuple(labels.items())
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, buckets: tuple = LATENCY_BUCKETS, **labels: str) -> None:
+        key = tuple(labels.items())
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(buckets)
+            histogram.observe(value)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        lines: List[str] = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                lines += [f"# HELP {name} {HELP.get(name, name)}", f"# TYPE {name} counter"]
+                lines += [f"{name}{_format_labels(labels)} {_format_value(value)}" for labels, value in series.items()]
+            for name, series in sorted(self._histograms.items()):
+                lines += [f"# HELP {name} {HELP.get(name, name)}", f"# TYPE {name} histogram"]
+                for labels, histogram in series.items():
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        cumulative += count
+                        lines.append(f"{name}_bucket{_format_labels(labels + (('le', _format_value(bound)),))} {cumulative}")
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', '+Inf'),))} {histogram.count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def drain(self) -> Tuple[Dict[str, Dict[Labels, float]], Dict[str, Dict[Labels, _Histogram]]]:
+        """Take everything recorded so far, leaving the registry empty"""
+        with self._lock:
+            counters, histograms = self._counters, self._histograms
+            self._counters, self._histograms = {}, {}
+        return counters, histograms
+
+    def merge(self, counters: Dict[str, Dict[Labels, float]],
+              histograms: Dict[str, Dict[Labels, _Histogram]]) -> None:
+        """Add drained series back, e.g. after a failed flush"""
+        with self._lock:
+            for name, series in counters.items():
+                mine = self._counters.setdefault(name, {})
+                for labels, value in series.items():
+                    mine[labels] = mine.get(labels, 0) + value
+            for name, series in histograms.items():
+                mine = self._histograms.setdefault(name, {})
+                for labels, histogram in series.items():
+                    if labels in mine:
+                        mine[labels].add(histogram)
+                    else:
+                        mine[labels] = histogram
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+registry = Registry()
+# A forked RQ job starts with its parent's unflushed series; the parent flushes those
+os.register_at_fork(after_in_child=registry.clear)
+
+
+def _shared_cache():
+    """Redis client from frappe.cache(), or None outside a configured bench"""
+    try:
+        return frappe.cache()
+    except Exception:
+        return None
+
+
+def _shared_fields(counters: Dict[str, Dict[Labels, float]],
+                   histograms: Dict[str, Dict[Labels, _Histogram]]) -> List[Tuple[str, float]]:
+    """(hash field, increment) pairs; fields are JSON [kind, name, labels, part]"""
+    fields = []
+    for name, series in counters.items():
+        for labels, value in series.items():
+            fields.append((json.dumps(["c", name, labels, None]), value))
+    for name, series in histograms.items():
+        for labels, histogram in series.items():
+            fields += [(json.dumps(["h", name, labels, bound]), count)
+                       for bound, count in zip(histogram.buckets, histogram.counts)]
+            fields.append((json.dumps(["h", name, labels, "sum"]), histogram.sum))
+            fields.append((json.dumps(["h", name, labels, "count"]), histogram.count))
+    return fields
+
+
+def flush() -> bool:
+    """Add this process's series to the shared totals; False (series kept) without Redis"""
+    cache = _shared_cache()
+    if cache is None:
+        return False
+    counters, histograms = registry.drain()
+    if not counters and not histograms:
+        return True
+    try:
+        pipe = cache.pipeline()
+        for field, value in _shared_fields(counters, histograms):
+            pipe.hincrbyfloat(SHARED_KEY, field, value)
+        pipe.execute()
+    except Exception:
+        registry.merge(counters, histograms)
+        return False
+    return True
+
+
+def shared_registry() -> Optional[Registry]:
+    """A Registry holding the totals of every process, or None without Redis"""
+    cache = _shared_cache()
+    if cache is None:
+        return None
+    try:
+        values = cache.hgetall(SHARED_KEY) or {}
+    except Exception:
+        return None
+    totals = Registry()
+    parts: Dict[Tuple[str, Labels], Dict[Any, float]] = {}
+    for field, value in values.items():
+        kind, name, labels, part = json.loads(field)
+        labels = tuple(tuple(pair) for pair in labels)
+        if kind == "c":
+            totals._counters.setdefault(name, {})[labels] = float(value)
+        else:
+            parts.setdefault((name, labels), {})[part] = float(value)
+    for (name, labels), values_by_part in parts.items():
+        histogram = _Histogram(tuple(sorted(b for b in values_by_part if not isinstance(b, str))))
+        histogram.counts = [int(values_by_part[bound]) for bound in histogram.buckets]
+        histogram.sum = values_by_part.get("sum", 0.0)
+        histogram.count = int(values_by_part.get("count", 0))
+        totals._histograms.setdefault(name, {})[labels] = histogram
+    return totals
+
+
+class _CallStats:
+    """Upstream totals for the tool call running in the current context"""
+    __slots__ = ("pages", "bytes", "retries")
+
+    def __init__(self):
+        self.pages = 0
+        self.bytes = 0
+        self.retries = 0
+
+
+_call_stats: contextvars.ContextVar = contextvars.ContextVar("redmine_call_stats", default=None)
+
+
+def instrumented(tool: str, action: Callable[[Dict[str, Any]], str]):
+    """Decorate a tool's execute(arguments) to record latency, outcome and per-call totals"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, arguments: Dict[str, Any]) -> Any:
+            if not enabled():
+                return func(self, arguments)
+            stats = _CallStats()
+            token = _call_stats.set(stats)
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                result = func(self, arguments)
+                if isinstance(result, dict) and result.get("success"):
+                    outcome = "success"
+                return result
+            finally:
+                _call_stats.reset(token)
+                name = action(arguments or {}) or "unknown"
+                registry.observe("redmine_tool_action_seconds", time.perf_counter() - started,
+                                 tool=tool, action=name, outcome=outcome)
+                registry.observe("redmine_action_pages", stats.pages, COUNT_BUCKETS, tool=tool, action=name)
+                registry.observe("redmine_action_response_bytes", stats.bytes, BYTES_BUCKETS, tool=tool, action=name)
+                registry.observe("redmine_action_retries", stats.retries, COUNT_BUCKETS, tool=tool, action=name)
+                flush()
+        return wrapper
+    return decorator
+
+
+def record_upstream(method: str, endpoint: str, status: Optional[int], seconds: float, size: int) -> None:
+    """Record one Redmine call; `endpoint` is an endpoint_template()"""
+    if not enabled():
+        return
+    registry.inc("redmine_upstream_requests_total", method=method, endpoint=endpoint, status=str(status or "error"))
+    registry.observe("redmine_upstream_seconds", seconds, method=method, endpoint=endpoint)
+    if size:
+        registry.inc("redmine_upstream_response_bytes_total", size, endpoint=endpoint)
+    stats = _call_stats.get()
+    if stats is not None:
+        stats.bytes += size
+
+
+def record_retry(url: str) -> None:
+    if not enabled():
+        return
+    registry.inc("redmine_upstream_retries_total", endpoint=endpoint_template(url or ""))
+    stats = _call_stats.get()
+    if stats is not None:
+        stats.retries += 1
+
+
+def record_page() -> None:
+    stats = _call_stats.get()
+    if stats is not None:
+        stats.pages += 1
+
+
+def record_render(render: str, seconds: float, size: int) -> None:
+    if not enabled():
+        return
+    registry.observe("redmine_dashboard_render_seconds", seconds, render=render)
+    registry.observe("redmine_dashboard_output_bytes", size, BYTES_BUCKETS, render=render)
+
+
+def record_cache(cache: str, result: str, count: int = 1) -> None:
+    if not enabled() or not count:
+        return
+    registry.inc("redmine_cache_requests_total", count, cache=cache, result=result)
+
+
+@frappe.whitelist()
+def export_metrics():
+    """Metrics of all workers (this worker's alone without Redis) in Prometheus text format"""
+    frappe.only_for("System Manager")
+    totals = shared_registry() if flush() else None
+    return Response((totals or registry).render(), mimetype="text/plain; version=0.0.4")
@@ -0,0 +1,61 @@
+"""
+Optional warm-up of a worker process for the Redmine tools.
+
+With REDMINE_PREWARM=1 the first request (or background job) a worker
+handles starts a daemon thread that imports the tools, opens the pooled
+connection to Redmine and loads the reference data the first assistant
+call would otherwise fetch: issue statuses and priorities (kept in the
+HTTP cache) and the project catalog. The request itself does not wait.
+
+Warm-up is best effort; if Redmine is unreachable the first tool call
+simply does the work itself.
+"""
+
+import os
+import threading
+
+from redmine_mcp_tools.assistant_tools.http_client import env_flag
+
+_warmed_pid = None
+_warm_lock = threading.Lock()
+
+
+def prewarm() -> None:
+    """Import the tools and prefetch reference data through the normal request path"""
+    from redmine_mcp_tools.assistant_tools.mcp_custom_tools import RedmineIssueTool
+
+    tool = RedmineIssueTool()
+    if not tool.REDMINE_API_URL or not tool.REDMINE_API_KEY:
+        return
+    tool.get_issue_statuses()
+    tool.get_issue_priorities()
+    tool._project_catalog().ensure_fresh()
+
+
+def _prewarm_quietly() -> None:
+    try:
+        prewarm()
+    except Exception:
+        # The request that triggered us may have closed its DB connection,
+        # so there is nowhere reliable to log; the first real call retries.
+        pass
+
+
+def prewarm_once(*args, **kwargs) -> None:
+    """before_request / before_job hook: start the warm-up once per worker process"""
+    global _warmed_pid
+    pid = os.getpid()
+    if _warmed_pid == pid:
+        return
+    with _warm_lock:
+        if _warmed_pid == pid:
+            return
+        _warmed_pid = pid
+    if not env_flag("REDMINE_PREWARM", False):
+        return
+
+    from redmine_mcp_tools.assistant_tools.async_client import bind_context
+
+    # The thread keeps a copy of the request context so frappe.local.site
+    # (HTTP cache path) stays visible after the request finishes.
+    threading.Thread(target=bind_context(_prewarm_quietly), name="redmine-prewarm", daemon=True).start()
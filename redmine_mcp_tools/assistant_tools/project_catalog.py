@@ -0,0 +1,216 @@
+"""
+Project catalog shared by the Redmine tools.
+
+Pages through every project in /projects.json once and indexes them by id,
+identifier, exact name, case-folded name and name prefix, along with the
+parent/subproject hierarchy. Lookups are answered from memory; once the TTL
+expires the catalog keeps serving the current snapshot while a background
+thread refreshes it. A name that is not in the catalog (a project created
+since the last load) triggers an immediate reload, at most once every
+REDMINE_PROJECT_CATALOG_MISS_INTERVAL seconds.
+
+Each load builds a new immutable snapshot and swaps it in with a single
+assignment; every lookup reads the snapshot once, so it never mixes
+indexes from two loads.
+"""
+
+import bisect
+import hashlib
+import threading
+import time
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from redmine_mcp_tools.assistant_tools.http_client import env_int, get_session
+
+PAGE_SIZE = 100
+
+
+class _Snapshot(NamedTuple):
+    by_id: Mapping[int, Dict[str, Any]]
+    by_identifier: Mapping[str, int]
+    by_name: Mapping[str, int]
+    by_casefold: Mapping[str, int]
+    children: Mapping[int, Tuple[int, ...]]
+    # Sorted (casefolded name, id) pairs for prefix search via bisect
+    sorted_names: Tuple[tuple, ...]
+    loaded_at: float
+
+
+_EMPTY = _Snapshot({}, {}, {}, {}, {}, (), 0.0)
+
+
+class ProjectCatalog:
+    """In-memory index of all Redmine projects visible to one API key"""
+
+    def __init__(self, api_url: str, api_key: str, timeout: int = 30, ttl: int = 300,
+                 miss_interval: int = 5):
+        self.api_url = api_url.rstrip("/")
+        self.api_key = api_key
+        self.timeout = timeout
+        self.ttl = ttl
+        self.miss_interval = miss_interval
+        self._snapshot = _EMPTY
+        self._load_lock = threading.Lock()
+        self._refreshing = False
+
+    @property
+    def loaded_at(self) -> float:
+        return self._snapshot.loaded_at
+
+    # -------------------------
+    # Loading
+    # -------------------------
+    def _fetch_all(self) -> List[Dict[str, Any]]:
+        projects = []
+        offset = 0
+        while True:
+            resp = get_session().get(
+                f"{self.api_url}/projects.json?limit={PAGE_SIZE}&offset={offset}",
+                headers={"X-Redmine-API-Key": self.api_key},
+                timeout=self.timeout
+            )
+            resp.raise_for_status()
+            data = resp.json()
+            projects.extend(data.get("projects", []))
+            if offset + PAGE_SIZE >= data.get("total_count", 0):
+                break
+            offset += PAGE_SIZE
+        return projects
+
+    def refresh(self) -> None:
+        """Reload every project and swap in a freshly built snapshot"""
+        projects = self._fetch_all()
+        by_name = {}
+        by_casefold = {}
+        children: Dict[int, List[int]] = {}
+        for p in projects:
+            by_name.setdefault(p["name"], p["id"])
+            by_casefold.setdefault(p["name"].casefold(), p["id"])
+            parent = p.get("parent")
+            if parent:
+                children.setdefault(parent["id"], []).append(p["id"])
+        self._snapshot = _Snapshot(
+            by_id={p["id"]: p for p in projects},
+            by_identifier={p["identifier"]: p["id"] for p in projects if p.get("identifier")},
+            by_name=by_name,
+            by_casefold=by_casefold,
+            children={parent_id: tuple(ids) for parent_id, ids in children.items()},
+            sorted_names=tuple(sorted((p["name"].casefold(), p["id"]) for p in projects)),
+            loaded_at=time.time(),
+        )
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            # Keep serving the previous snapshot; the next lookup retries
+            pass
+        finally:
+            self._refreshing = False
+
+    def ensure_fresh(self) -> _Snapshot:
+        """Load synchronously on first use; afterwards refresh in the background.
+
+        Returns the snapshot the caller should read.
+        """
+        if not self._snapshot.loaded_at:
+            with self._load_lock:
+                if not self._snapshot.loaded_at:
+                    self.refresh()
+            return self._snapshot
+        snapshot = self._snapshot
+        if time.time() - snapshot.loaded_at >= self.ttl and not self._refreshing:
+            self._refreshing = True
+            threading.Thread(target=self._refresh_in_background, daemon=True).start()
+        return snapshot
+
+    def _refresh_after_miss(self, seen: _Snapshot) -> Optional[_Snapshot]:
+        """Reload now for a lookup that missed in `seen`; None if that snapshot is too recent"""
+        if time.time() - seen.loaded_at < self.miss_interval:
+            return None
+        with self._load_lock:
+            # Another miss may have reloaded while this one waited
+            if self._snapshot is seen:
+                try:
+                    self.refresh()
+                except Exception:
+                    return None
+        return self._snapshot
+
+    # -------------------------
+    # Lookups
+    # -------------------------
+    @staticmethod
+    def _find(snapshot: _Snapshot, key: str) -> Optional[Dict[str, Any]]:
+        if key.isdigit() and int(key) in snapshot.by_id:
+            return snapshot.by_id[int(key)]
+        project_id = (
+            snapshot.by_identifier.get(key)
+            or snapshot.by_name.get(key)
+            or snapshot.by_casefold.get(key.casefold())
+        )
+        return snapshot.by_id.get(project_id) if project_id else None
+
+    def get(self, project: Any) -> Optional[Dict[str, Any]]:
+        """Resolve a project by id, identifier, exact name or case-insensitive name"""
+        if project is None or project == "":
+            return None
+        snapshot = self.ensure_fresh()
+        key = str(project).strip()
+        found = self._find(snapshot, key)
+        if found is None:
+            reloaded = self._refresh_after_miss(snapshot)
+            if reloaded is not None:
+                found = self._find(reloaded, key)
+        return found
+
+    def search(self, query: str) -> List[Dict[str, Any]]:
+        """Projects whose name starts with the query, then those containing it"""
+        snapshot = self.ensure_fresh()
+        needle = (query or "").strip().casefold()
+        names = snapshot.sorted_names
+        matches = []
+        seen = set()
+        start = bisect.bisect_left(names, (needle,))
+        for name, project_id in names[start:]:
+            if not name.startswith(needle):
+                break
+            matches.append(project_id)
+            seen.add(project_id)
+        for name, project_id in names:
+            if project_id not in seen and needle in name:
+                matches.append(project_id)
+        return [snapshot.by_id[project_id] for project_id in matches]
+
+    def subprojects(self, project_id: int, recursive: bool = True) -> List[Dict[str, Any]]:
+        """Direct (or all nested) subprojects of a project"""
+        snapshot = self.ensure_fresh()
+        result = []
+        stack = list(snapshot.children.get(int(project_id), ()))
+        while stack:
+            child_id = stack.pop(0)
+            result.append(snapshot.by_id[child_id])
+            if recursive:
+                stack.extend(snapshot.children.get(child_id, ()))
+        return result
+
+
+_catalogs: Dict[str, ProjectCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_project_catalog(api_url: str, api_key: str, timeout: int = 30) -> ProjectCatalog:
+    """Return the per-process catalog for this Redmine URL and credential"""
+    credential = hashlib.sha256((api_key or "").encode()).hexdigest()[:16]
+    key = f"{api_url.rstrip('/')}|{credential}"
+    catalog = _catalogs.get(key)
+    if catalog is None:
+        with _catalogs_lock:
+            catalog = _catalogs.get(key)
+            if catalog is None:
+                catalog = ProjectCatalog(
+                    api_url, api_key, timeout, ttl=env_int("REDMINE_PROJECT_CATALOG_TTL", 300),
+                    miss_interval=env_int("REDMINE_PROJECT_CATALOG_MISS_INTERVAL", 5)
+                )
+                _catalogs[key] = catalog
+    return catalog
@@ -0,0 +1,95 @@
+"""
+Field projection for read-action results.
+
+Redmine returns every issue/project with nested `{id, name}` objects and
+fields the assistant rarely reads. These helpers keep only the requested
+fields (or a named preset), flatten `{id, name}` references to their name
+and can pack lists into a columnar `{columns, rows}` table.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+ISSUE_PRESETS = {
+    "minimal": ("id", "subject", "status", "assigned_to", "priority", "due_date"),
+    "detail": (
+        "id", "subject", "description", "project", "tracker", "status", "priority",
+        "author", "assigned_to", "category", "fixed_version", "parent", "start_date",
+        "due_date", "done_ratio", "estimated_hours", "created_on", "updated_on", "closed_on",
+    ),
+}
+
+PROJECT_PRESETS = {
+    "minimal": ("id", "name", "identifier", "parent"),
+    "detail": ("id", "name", "identifier", "description", "parent", "status", "is_public",
+               "created_on", "updated_on"),
+}
+
+FORMATS = ("full", "records", "columnar")
+
+
+def flatten(value: Any) -> Any:
+    """Collapse `{id, name}` references to the name (or id when unnamed)"""
+    if isinstance(value, dict) and "id" in value and set(value) <= {"id", "name", "is_closed"}:
+        return value.get("name", value["id"])
+    if isinstance(value, list):
+        return [flatten(v) for v in value]
+    return value
+
+
+def resolve_fields(fields: Union[str, Sequence[str], None], presets: Dict[str, tuple]) -> Optional[tuple]:
+    """Turn a preset name, comma string or list into a field tuple (None = all fields)"""
+    if not fields:
+        return None
+    if isinstance(fields, str):
+        if fields in presets:
+            return presets[fields]
+        fields = [f.strip() for f in fields.split(",") if f.strip()]
+    return tuple(fields)
+
+
+def project_record(record: Dict[str, Any], fields: Optional[tuple]) -> Dict[str, Any]:
+    keys = fields or tuple(record.keys())
+    return {key: flatten(record.get(key)) for key in keys if fields or key in record}
+
+
+def shape_result(result: Dict[str, Any], collection_key: str, fields: Union[str, Sequence[str], None],
+                 fmt: Optional[str], presets: Dict[str, tuple]) -> Dict[str, Any]:
+    """Apply projection to a `_make_request`-style result.
+
+    `collection_key` is the list key ("issues", "projects") or, for a single
+    object, its key ("issue"). With neither `fields` nor `format` set the
+    result is returned untouched.
+    """
+    if not result.get("success"):
+        return result
+    if fmt not in (None, *FORMATS):
+        return {"success": False, "error": f"Unknown format: {fmt}"}
+    selected = resolve_fields(fields, presets)
+    if selected is None and fmt in (None, "full"):
+        return result
+
+    payload = result["result"]
+    value = payload.get(collection_key)
+    if isinstance(value, dict):
+        return {"success": True, "result": {collection_key: project_record(value, selected)}}
+    if not isinstance(value, list):
+        return result
+
+    shaped = {k: v for k, v in payload.items() if k != collection_key}
+    if fmt == "columnar":
+        columns = list(selected) if selected else _union_keys(value)
+        shaped[collection_key] = {
+            "columns": columns,
+            "rows": [[flatten(record.get(column)) for column in columns] for record in value],
+        }
+    else:
+        shaped[collection_key] = [project_record(record, selected) for record in value]
+    return {"success": True, "result": shaped}
+
+
+def _union_keys(records: List[Dict[str, Any]]) -> List[str]:
+    columns: Dict[str, None] = {}
+    for record in records:
+        for key in record:
+            columns.setdefault(key)
+    return list(columns)
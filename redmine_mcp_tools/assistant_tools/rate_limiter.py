@@ -0,0 +1,240 @@
+"""
+Adaptive rate limiting for outgoing Redmine requests.
+
+Every request sent through the shared session passes an AdaptiveLimiter:
+
+* concurrency per process follows AIMD - it grows by one slot per window of
+  healthy responses and halves on 429/5xx, connection errors or latency
+  above the target, so parallel fetches back off instead of piling on;
+* a Retry-After (or a bare 429/503) pauses all workers for that Redmine
+  host through `frappe.cache()`, not just the thread that saw it;
+* REDMINE_RATE_LIMIT optionally caps requests per second across all
+  workers with a shared one-second counter (a local token bucket when
+  Redis is unreachable).
+"""
+
+import math
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+from urllib.parse import urlsplit
+
+import frappe
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from redmine_mcp_tools.assistant_tools.http_client import env_flag, env_float, env_int
+from redmine_mcp_tools.assistant_tools.metrics import endpoint_template, record_retry, record_upstream
+from redmine_mcp_tools.assistant_tools.tracing import span
+
+THROTTLE_STATUS_CODES = (429, 503)
+KEY_PREFIX = "redmine_limiter"
+
+# Pause applied after a 429/503 without a Retry-After header
+DEFAULT_PAUSE = 1.0
+
+_limiter = None
+_limiter_pid = None
+_limiter_lock = threading.Lock()
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _shared_cache():
+    """Redis client from frappe.cache(), or None outside a configured bench"""
+    try:
+        return frappe.cache()
+    except Exception:
+        return None
+
+
+class AdaptiveLimiter:
+    def __init__(self, max_concurrency: int, min_concurrency: int = 1, rate: float = 0,
+                 target_latency: float = 2.0, max_wait: float = 30):
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.rate = rate
+        self.target_latency = target_latency
+        self.max_wait = max_wait
+
+        self.limit = float(self.max_concurrency)
+        self.in_flight = 0
+        self.latency = None  # EWMA of response time in seconds
+        self._cond = threading.Condition()
+        self._last_decrease = 0.0
+        self._paused_until = 0.0
+        # Local token bucket, used when the shared counter is unavailable
+        self._tokens = float(rate or 0)
+        self._refilled_at = time.monotonic()
+
+    # ---- admission -------------------------------------------------------
+    def acquire(self, host: str) -> float:
+        """Block until the request may be sent; returns its start time for release()"""
+        self._wait_for_pause(host)
+        if self.rate > 0:
+            self._take_token(host)
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+        return time.monotonic()
+
+    def release(self, started: float, status: Optional[int]) -> None:
+        """Record the outcome (status None = connection error) and adapt the limit"""
+        now = time.monotonic()
+        latency = now - started
+        with self._cond:
+            self.in_flight -= 1
+            self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+            failed = status is None or status in THROTTLE_STATUS_CODES or status >= 500
+            if failed or (latency > self.target_latency and self.latency > self.target_latency):
+                self._decrease(now)
+            elif self.limit < self.max_concurrency:
+                self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+    def throttled(self, host: str, retry_after: Optional[float]) -> None:
+        """Pause every worker talking to `host` for the server-requested time"""
+        pause = min(retry_after if retry_after is not None else DEFAULT_PAUSE, self.max_wait)
+        until = time.time() + pause
+        with self._cond:
+            self._paused_until = max(self._paused_until, until)
+            self._decrease(time.monotonic())
+        cache = _shared_cache()
+        if cache is None:
+            return
+        try:
+            cache.set_value(f"{KEY_PREFIX}|pause|{host}", until, expires_in_sec=math.ceil(pause) + 1)
+        except Exception:
+            pass
+
+    # ---- internals -------------------------------------------------------
+    def _decrease(self, now: float) -> None:
+        """Halve the limit, at most once per window so a burst of errors counts once"""
+        if now - self._last_decrease > max(self.latency or 0, 0.5):
+            self.limit = max(float(self.min_concurrency), self.limit / 2)
+            self._last_decrease = now
+
+    def _wait_for_pause(self, host: str) -> None:
+        until = self._paused_until
+        cache = _shared_cache()
+        if cache is not None:
+            try:
+                until = max(until, float(cache.get_value(f"{KEY_PREFIX}|pause|{host}") or 0))
+            except Exception:
+                pass
+        delay = min(until - time.time(), self.max_wait)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _take_token(self, host: str) -> None:
+        deadline = time.monotonic() + self.max_wait
+        while time.monotonic() < deadline:
+            now = time.time()
+            count = self._shared_count(f"{KEY_PREFIX}|rate|{host}|{int(now)}")
+            if count is None:
+                if self._take_local_token():
+                    return
+                time.sleep(1 / self.rate)
+            elif count <= self.rate:
+                return
+            else:
+                # This second's budget is spent; retry at the next one
+                time.sleep(math.floor(now) + 1 - now)
+
+    def _shared_count(self, key: str) -> Optional[int]:
+        """Increment a one-second request counter in Redis (None when unavailable)"""
+        cache = _shared_cache()
+        if cache is None:
+            return None
+        try:
+            count = cache.incr(key)
+            if count == 1:
+                cache.expire(key, 2)
+            return count
+        except Exception:
+            return None
+
+    def _take_local_token(self) -> bool:
+        with self._cond:
+            now = time.monotonic()
+            self._tokens = min(float(self.rate), self._tokens + (now - self._refilled_at) * self.rate)
+            self._refilled_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+class LimitedRetry(Retry):
+    """urllib3 Retry that also reports intermediate 429/503 responses to the limiter"""
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        record_retry(url)
+        limiter = get_limiter()
+        if limiter and response is not None and response.status in THROTTLE_STATUS_CODES and _pool is not None:
+            limiter.throttled(_pool.host, retry_after_seconds(response.headers.get("Retry-After")))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+class LimitedAdapter(HTTPAdapter):
+    """HTTPAdapter whose requests are admitted by the shared limiter and recorded in metrics"""
+
+    def send(self, request, **kwargs):
+        limiter = get_limiter()
+        host = urlsplit(request.url).hostname or ""
+        endpoint = endpoint_template(request.url)
+        queued = time.monotonic()
+        started = limiter.acquire(host) if limiter else queued
+        status = None
+        size = 0
+        with span(f"http {request.method} {endpoint}") as trace_span:
+            try:
+                response = super().send(request, **kwargs)
+                status = response.status_code
+                if not kwargs.get("stream"):
+                    # requests reads the body right after send() anyway
+                    size = len(response.content)
+                if limiter and status in THROTTLE_STATUS_CODES:
+                    limiter.throttled(host, retry_after_seconds(response.headers.get("Retry-After")))
+                return response
+            finally:
+                if limiter:
+                    limiter.release(started, status)
+                record_upstream(request.method, endpoint, status, time.monotonic() - started, size)
+                trace_span.set(status=status, bytes=size, queued_ms=round((started - queued) * 1000, 1))
+
+
+def get_limiter() -> Optional[AdaptiveLimiter]:
+    """Return the per-process limiter, or None when disabled via REDMINE_LIMITER=0"""
+    global _limiter, _limiter_pid
+    if not env_flag("REDMINE_LIMITER", True):
+        return None
+    pid = os.getpid()
+    if _limiter is not None and _limiter_pid == pid:
+        return _limiter
+    with _limiter_lock:
+        if _limiter is None or _limiter_pid != pid:
+            _limiter = AdaptiveLimiter(
+                max_concurrency=env_int("REDMINE_LIMITER_MAX_CONCURRENCY", 16),
+                min_concurrency=env_int("REDMINE_LIMITER_MIN_CONCURRENCY", 1),
+                rate=env_float("REDMINE_RATE_LIMIT", 0),
+                target_latency=env_float("REDMINE_LIMITER_TARGET_LATENCY", 2.0),
+                max_wait=env_float("REDMINE_RATE_MAX_WAIT", 30),
+            )
+            _limiter_pid = pid
+    return _limiter
@@ -0,0 +1,85 @@
+"""
+Report cache for RedmineDashboardTool.
+
+Rendered dashboards are kept in `frappe.cache()` (Redis, so every worker
+shares them) keyed by credentials, project, filter and render mode. Each
+entry carries a data fingerprint - total_count plus the newest updated_on
+from a single `limit=1` probe - and the HTML of every user section under a
+hash of that assignee's issue signatures. An unchanged fingerprint returns
+the stored page at once; otherwise only sections whose issues changed are
+rendered again. Entries expire after a TTL and oversized pages are not
+stored.
+"""
+
+import hashlib
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
+
+import frappe
+
+from redmine_mcp_tools.assistant_tools.http_client import env_flag, env_int
+
+KEY_PREFIX = "redmine_report"
+
+
+def issue_fingerprint(probe: Dict[str, Any]) -> List[Any]:
+    """Fingerprint from a `sort=updated_on:desc&limit=1` issues response.
+
+    The date is included because overdue labels change at midnight.
+    """
+    newest = probe.get("issues") or [{}]
+    return [probe.get("total_count", 0), newest[0].get("updated_on"), date.today().isoformat()]
+
+
+def section_signatures(issues: Iterable[dict]) -> Dict[str, str]:
+    """Hash of (id, updated_on) in row order for each assignee, assignees in first-seen order"""
+    today = date.today().isoformat()
+    digests = {}
+    for issue in issues:
+        user = (issue.get("assigned_to") or {}).get("name") or "Unassigned"
+        digest = digests.get(user)
+        if digest is None:
+            digest = digests[user] = hashlib.sha1(f"{user}|{today}".encode("utf-8"))
+        digest.update(f"{issue['id']}:{issue.get('updated_on')};".encode("utf-8"))
+    return {user: digest.hexdigest() for user, digest in digests.items()}
+
+
+class ReportCache:
+    def __init__(self, ttl: int, max_bytes: int):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def make_key(api_url: str, api_key: str, *parts: Any) -> str:
+        raw = "|".join([api_url, hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]]
+                       + [str(part) for part in parts])
+        return f"{KEY_PREFIX}|{hashlib.sha256(raw.encode('utf-8')).hexdigest()}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return frappe.cache().get_value(key)
+
+    def put(self, key: str, fingerprint: List[Any], html: str,
+            sections: Optional[Dict[str, str]] = None) -> None:
+        size = len(html) + sum(len(section) for section in (sections or {}).values())
+        if size > self.max_bytes:
+            # Keep the page without its reusable sections if that fits
+            if len(html) > self.max_bytes:
+                return
+            sections = None
+        frappe.cache().set_value(
+            key,
+            {"fingerprint": fingerprint, "html": html, "sections": sections or {}},
+            expires_in_sec=self.ttl,
+        )
+
+
+def get_report_cache() -> Optional[ReportCache]:
+    """Return the report cache, or None outside a site or when REDMINE_REPORT_CACHE=0"""
+    if not env_flag("REDMINE_REPORT_CACHE", True):
+        return None
+    if not getattr(frappe.local, "site", None):
+        return None
+    return ReportCache(
+        env_int("REDMINE_REPORT_CACHE_TTL", 300),
+        env_int("REDMINE_REPORT_CACHE_MAX_BYTES", 8 * 1024 * 1024),
+    )
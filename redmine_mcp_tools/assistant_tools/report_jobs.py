@@ -0,0 +1,233 @@
+"""
+Background dashboard jobs for RedmineDashboardTool.
+
+A call with `background: true` validates its arguments, enqueues the
+generation on the "long" RQ queue and returns a job id at once. The worker
+runs the normal execute() path; pages fetched (out of the total implied by
+each project's total_count) and sections rendered are recorded through a
+context variable, so the fetch and render code only pays for a lookup when
+no job is running, and written to `frappe.cache()` at most twice a second.
+
+`action: "get_report"` with the job id returns the status and progress and,
+once the job has finished, the report itself. Pages larger than
+REDMINE_REPORT_JOB_MAX_BYTES are written to a private File and the result
+carries its URL instead.
+
+Identical requests (same user, Redmine credentials and arguments) attach
+to the job already queued or running instead of starting another one. A
+job is only readable by the user who submitted it, with the credentials
+it ran with.
+"""
+
+import contextvars
+import hashlib
+import json
+import math
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import frappe
+from frappe import _
+
+from redmine_mcp_tools.assistant_tools.http_client import env_int
+from redmine_mcp_tools.assistant_tools.report_output import report_file_name, write_report
+
+KEY_PREFIX = "redmine_report_job"
+
+# Arguments that choose how a job is run or read, not what it produces
+JOB_ARGUMENTS = ("background", "action", "job_id", "trace", "profile")
+
+ACTIVE = ("queued", "running")
+
+# Minimum seconds between progress writes to the cache
+FLUSH_INTERVAL = 0.5
+
+
+def _ttl_ms() -> int:
+    return env_int("REDMINE_REPORT_JOB_TTL", 3600) * 1000
+
+
+def _state_key(job_id: str) -> str:
+    return f"{KEY_PREFIX}|state|{job_id}"
+
+
+def credential_hash(api_url: str, api_key: str) -> str:
+    return hashlib.sha256(f"{api_url}|{api_key or ''}".encode("utf-8")).hexdigest()[:16]
+
+
+def dedupe_key(credentials: str, owner: str, arguments: Dict[str, Any]) -> str:
+    canonical = json.dumps(arguments, sort_keys=True, default=str)
+    digest = hashlib.sha256(f"{credentials}|{owner}|{canonical}".encode("utf-8")).hexdigest()
+    return f"{KEY_PREFIX}|running|{digest}"
+
+
+def _text(value: Any) -> Optional[str]:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def load_state(job_id: str) -> Optional[Dict[str, Any]]:
+    payload = frappe.cache().get(_state_key(job_id))
+    return json.loads(payload) if payload is not None else None
+
+
+def save_state(state: Dict[str, Any]) -> None:
+    frappe.cache().set(_state_key(state["job_id"]), json.dumps(state, default=str), px=_ttl_ms())
+
+
+class JobProgress:
+    """Progress of the job running in this context; shared by its fetch threads"""
+
+    def __init__(self, state: Dict[str, Any]):
+        self.state = state
+        self._lock = threading.Lock()
+        self._project_pages: Dict[int, int] = {}
+        self._flushed = 0.0
+
+    def page(self, project_id: int, total_count: int, page_size: int) -> None:
+        with self._lock:
+            progress = self.state["progress"]
+            progress["pages"] += 1
+            self._project_pages[project_id] = max(1, math.ceil(total_count / max(1, page_size)))
+            progress["total_pages"] = sum(self._project_pages.values())
+            self._flush_locked()
+
+    def sections(self, count: int = 1, total: Optional[int] = None) -> None:
+        with self._lock:
+            progress = self.state["progress"]
+            progress["sections"] += count
+            if total is not None:
+                progress["total_sections"] = total
+            self._flush_locked()
+
+    def finish(self, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        with self._lock:
+            self.state.update(status=status, finished_at=time.time(), result=result, error=error)
+            self._flush_locked(force=True)
+
+    def _flush_locked(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if force or now - self._flushed >= FLUSH_INTERVAL:
+            self._flushed = now
+            save_state(self.state)
+
+
+_progress: contextvars.ContextVar = contextvars.ContextVar("redmine_report_job", default=None)
+
+
+def record_job_page(project_id: int, total_count: int, page_size: int) -> None:
+    progress = _progress.get()
+    if progress is not None:
+        progress.page(project_id, total_count, page_size)
+
+
+def record_job_sections(count: int = 1, total: Optional[int] = None) -> None:
+    progress = _progress.get()
+    if progress is not None:
+        progress.sections(count, total)
+
+
+def _public(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Job state as returned to callers"""
+    view = {key: state.get(key) for key in ("job_id", "status", "progress", "created_at", "started_at", "finished_at")}
+    if state["status"] == "finished":
+        view["report"] = state.get("result")
+    elif state["status"] == "failed":
+        view["error"] = state.get("error")
+    return view
+
+
+def submit_report_job(api_url: str, api_key: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Enqueue a dashboard job, or attach to an identical one still queued or running"""
+    if not getattr(frappe.local, "site", None):
+        return {"success": False, "error": "Background reports need a Frappe site"}
+
+    credentials = credential_hash(api_url, api_key)
+    job_arguments = {k: v for k, v in arguments.items() if k not in JOB_ARGUMENTS}
+    state = {
+        "job_id": frappe.generate_hash(length=16),
+        "status": "queued",
+        "owner": frappe.session.user,
+        "credentials": credentials,
+        "arguments": job_arguments,
+        "progress": {"pages": 0, "total_pages": None, "sections": 0, "total_sections": None},
+        "created_at": time.time(),
+        "started_at": None,
+        "finished_at": None,
+    }
+    timeout = env_int("REDMINE_REPORT_JOB_TIMEOUT", 1500)
+    running_key = dedupe_key(credentials, state["owner"], job_arguments)
+    cache = frappe.cache()
+
+    save_state(state)
+    if not cache.set(running_key, state["job_id"], nx=True, px=timeout * 1000):
+        existing_id = _text(cache.get(running_key))
+        existing = load_state(existing_id) if existing_id else None
+        if existing and existing["status"] in ACTIVE:
+            cache.delete(_state_key(state["job_id"]))
+            return {"success": True, "result": {**_public(existing), "attached": True}}
+        # The previous job is gone or over; this one takes its place
+        cache.set(running_key, state["job_id"], px=timeout * 1000)
+
+    try:
+        frappe.enqueue(
+            "redmine_mcp_tools.assistant_tools.report_jobs.run_report_job",
+            queue="long",
+            timeout=timeout,
+            report_job_id=state["job_id"],
+            running_key=running_key,
+        )
+    except Exception as e:
+        cache.delete(running_key)
+        JobProgress(state).finish("failed", error=str(e))
+        return {"success": False, "error": f"Could not enqueue report job: {e}"}
+    return {"success": True, "result": {**_public(state), "attached": False}}
+
+
+def get_report(job_id: Optional[str], api_url: str, api_key: str) -> Dict[str, Any]:
+    """Status and progress of a job, with the report once it has finished"""
+    if not job_id:
+        return {"success": False, "error": "job_id is required"}
+    state = load_state(job_id)
+    # Jobs are only visible to the user who submitted them, with the Redmine credentials that ran them
+    if (not state or state["credentials"] != credential_hash(api_url, api_key)
+            or state.get("owner") != frappe.session.user):
+        return {"success": False, "error": f"Report job '{job_id}' not found or expired"}
+    return {"success": True, "result": _public(state)}
+
+
+def _store_result(result: Dict[str, Any], title: str) -> Dict[str, Any]:
+    """Keep small pages inline; write larger ones to a private File"""
+    html = result.get("result")
+    if isinstance(html, str) and len(html) > env_int("REDMINE_REPORT_JOB_MAX_BYTES", 8 * 1024 * 1024):
+        return write_report([html], report_file_name(title))
+    return html
+
+
+def run_report_job(report_job_id: str, running_key: str) -> None:
+    """RQ entry point: generate the dashboard described by the job's arguments"""
+    from redmine_mcp_tools.assistant_tools.mcp_custom_tools import RedmineDashboardTool
+
+    state = load_state(report_job_id)
+    if not state:
+        return
+    state.update(status="running", started_at=time.time())
+    save_state(state)
+    progress = JobProgress(state)
+    token = _progress.set(progress)
+    try:
+        arguments = state["arguments"]
+        result = RedmineDashboardTool().execute(arguments)
+        if result.get("success"):
+            title = arguments.get("project_name") or f"Portfolio ({len(arguments.get('projects') or [])} projects)"
+            progress.finish("finished", result=_store_result(result, title))
+        else:
+            progress.finish("failed", error=result.get("error"))
+    except Exception as e:
+        frappe.log_error(title=_("Redmine Report Job Error"), message=str(e))
+        progress.finish("failed", error=str(e))
+    finally:
+        _progress.reset(token)
+        cache = frappe.cache()
+        if _text(cache.get(running_key)) == report_job_id:
+            cache.delete(running_key)
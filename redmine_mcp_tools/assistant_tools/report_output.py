@@ -0,0 +1,108 @@
+"""
+Streaming output for generated Redmine reports.
+
+Reports are written chunk by chunk to a private Frappe File (or a temp
+file outside a site context), so the full HTML never has to be held in
+memory and the tool result carries a file URL instead of the document.
+
+Issues on their way into a report are parked in an IssueSpool, a temporary
+SQLite file keyed by issue id: pages that overlap (or a second walk of a
+listing that shifted) collapse to one row per issue, and each group comes
+back once, however its rows were spread across pages.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import tempfile
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator
+
+import frappe
+
+
+def report_file_name(title: str) -> str:
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", title).strip("_").lower() or "report"
+    return f"redmine_{slug}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.html"
+
+
+def write_report(chunks: Iterable[str], file_name: str) -> Dict[str, Any]:
+    """Write HTML chunks to disk as they arrive and register the file.
+
+    Returns the file URL (or local path) and the number of bytes written.
+    If rendering or registering fails, the partial file is removed before
+    the error propagates.
+    """
+    in_site = bool(getattr(frappe.local, "site", None))
+    if in_site:
+        path = frappe.get_site_path("private", "files", file_name)
+    else:
+        path = os.path.join(tempfile.gettempdir(), file_name)
+
+    size = 0
+    try:
+        with open(path, "w", encoding="utf-8") as fh:
+            for chunk in chunks:
+                fh.write(chunk)
+                size += len(chunk.encode("utf-8"))
+
+        result = {"file_name": file_name, "bytes": size}
+        if in_site:
+            file_doc = frappe.get_doc({
+                "doctype": "File",
+                "file_name": file_name,
+                "file_url": f"/private/files/{file_name}",
+                "is_private": 1,
+                "file_size": size,
+            }).insert(ignore_permissions=True)
+            result["file_url"] = file_doc.file_url
+        else:
+            result["file_path"] = path
+    except BaseException:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        raise
+    return result
+
+
+class IssueSpool:
+    """Issues kept on disk, one row per id, read back grouped in first-seen group order.
+
+    A later copy of an issue replaces the earlier one, moving it to its
+    current group.
+    """
+
+    def __init__(self, group_of: Callable[[dict], str]):
+        self.group_of = group_of
+        fd, self.path = tempfile.mkstemp(prefix="redmine_spool_", suffix=".sqlite3")
+        os.close(fd)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA journal_mode=OFF")
+        self._conn.execute("PRAGMA synchronous=OFF")
+        self._conn.execute("CREATE TABLE issues (id INTEGER PRIMARY KEY, grp INTEGER NOT NULL, data TEXT NOT NULL)")
+        self._groups: Dict[str, int] = {}
+
+    def add(self, issues: Iterable[dict]) -> None:
+        rows = []
+        for issue in issues:
+            group = self._groups.setdefault(self.group_of(issue), len(self._groups))
+            rows.append((issue["id"], group, json.dumps(issue)))
+        self._conn.executemany("INSERT OR REPLACE INTO issues VALUES (?, ?, ?)", rows)
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM issues").fetchone()[0]
+
+    def __iter__(self) -> Iterator[dict]:
+        """Issues by group (in the order groups were first seen), newest id first within each"""
+        for (data,) in self._conn.execute("SELECT data FROM issues ORDER BY grp, id DESC"):
+            yield json.loads(data)
+
+    def close(self) -> None:
+        self._conn.close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
@@ -0,0 +1,254 @@
+"""
+Local BM25 full-text index for `search_issues` in ranked mode.
+
+Issues are streamed page by page from /issues.json and indexed over subject
+(weighted), description and journal notes (one extra request per new or
+updated issue; REDMINE_SEARCH_INDEX_NOTES=0 leaves notes out). Postings are
+kept as parallel `array` columns of document numbers and term frequencies,
+so 100k issues fit comfortably in a worker. Updates arrive through
+`updated_on` deltas: a changed issue gets a new document number and its old
+one is tombstoned until the next compaction. Deletions do not show up in
+deltas, so every REDMINE_SEARCH_INDEX_RECONCILE_INTERVAL seconds the live
+document count is compared with Redmine's total_count and, when they
+disagree, issues Redmine no longer lists are tombstoned too.
+"""
+
+import hashlib
+import math
+import re
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from redmine_mcp_tools.assistant_tools.http_client import env_flag, env_int
+from redmine_mcp_tools.assistant_tools.issue_scan import scan_updated_since
+
+PAGE_SIZE = 100
+SUBJECT_WEIGHT = 3
+K1 = 1.2
+B = 0.75
+
+_TOKEN = re.compile(r"\w{2,}", re.UNICODE)
+
+# fetch(endpoint) -> parsed JSON; raises on HTTP/transport errors
+Fetch = Callable[[str], Dict[str, Any]]
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall((text or "").casefold())
+
+
+class SearchIndex:
+    """Append-only BM25 index with tombstones for replaced documents"""
+
+    def __init__(self, project_id: Optional[str], ttl: int, index_notes: bool, reconcile_interval: int = 3600):
+        self.project_id = project_id
+        self.ttl = ttl
+        self.index_notes = index_notes
+        self.reconcile_interval = reconcile_interval
+        self.watermark: Optional[str] = None
+        self.refreshed_at = 0.0
+        self.reconciled_at = 0.0
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self.issue_ids = array("I")
+        self.doc_lengths = array("I")
+        self.meta: List[tuple] = []  # (subject, status name, project name) per document
+        self.postings: Dict[str, tuple] = {}  # term -> (array of doc numbers, array of tfs)
+        self.current: Dict[int, int] = {}  # issue id -> live document number
+        self.deleted = set()
+        self.total_length = 0
+
+    @property
+    def live_count(self) -> int:
+        return len(self.current)
+
+    # -------------------------
+    # Indexing
+    # -------------------------
+    def _add(self, issue: dict, notes: List[str]) -> None:
+        issue_id = int(issue["id"])
+        old = self.current.get(issue_id)
+        if old is not None:
+            self.deleted.add(old)
+            self.total_length -= self.doc_lengths[old]
+
+        freqs: Dict[str, int] = {}
+        for token in tokenize(issue.get("subject", "")):
+            freqs[token] = freqs.get(token, 0) + SUBJECT_WEIGHT
+        for text in [issue.get("description", "")] + notes:
+            for token in tokenize(text):
+                freqs[token] = freqs.get(token, 0) + 1
+
+        doc = len(self.issue_ids)
+        length = sum(freqs.values())
+        self.issue_ids.append(issue_id)
+        self.doc_lengths.append(length)
+        self.meta.append((
+            issue.get("subject", ""),
+            issue.get("status", {}).get("name"),
+            issue.get("project", {}).get("name"),
+        ))
+        self.current[issue_id] = doc
+        self.total_length += length
+        for term, tf in freqs.items():
+            entry = self.postings.get(term)
+            if entry is None:
+                entry = self.postings[term] = (array("I"), array("H"))
+            entry[0].append(doc)
+            entry[1].append(min(tf, 65535))
+
+    def _remove(self, issue_id: int) -> None:
+        doc = self.current.pop(issue_id, None)
+        if doc is not None:
+            self.deleted.add(doc)
+            self.total_length -= self.doc_lengths[doc]
+
+    def _compact(self) -> None:
+        """Rebuild postings without tombstoned documents"""
+        remap = {}
+        issue_ids, doc_lengths, meta = array("I"), array("I"), []
+        for doc in range(len(self.issue_ids)):
+            if doc in self.deleted:
+                continue
+            remap[doc] = len(issue_ids)
+            issue_ids.append(self.issue_ids[doc])
+            doc_lengths.append(self.doc_lengths[doc])
+            meta.append(self.meta[doc])
+        postings = {}
+        for term, (docs, tfs) in self.postings.items():
+            new_docs, new_tfs = array("I"), array("H")
+            for doc, tf in zip(docs, tfs):
+                if doc in remap:
+                    new_docs.append(remap[doc])
+                    new_tfs.append(tf)
+            if new_docs:
+                postings[term] = (new_docs, new_tfs)
+        self.issue_ids, self.doc_lengths, self.meta, self.postings = issue_ids, doc_lengths, meta, postings
+        self.current = {issue_id: doc for doc, issue_id in enumerate(issue_ids)}
+        self.deleted = set()
+
+    def _notes_for(self, fetch: Fetch, issues: List[dict]) -> Dict[int, List[str]]:
+        if not self.index_notes or not issues:
+            return {}
+
+        def journal_notes(issue_id):
+            data = fetch(f"/issues/{issue_id}.json?include=journals")
+            return issue_id, [j.get("notes") or "" for j in data.get("issue", {}).get("journals", [])]
+
+        with ThreadPoolExecutor(max_workers=env_int("REDMINE_FETCH_CONCURRENCY", 4)) as pool:
+            return dict(pool.map(journal_notes, [issue["id"] for issue in issues]))
+
+    def refresh(self, fetch: Fetch) -> None:
+        """Stream all issues on first use, then only those updated since the watermark"""
+        with self._lock:
+            if time.time() - self.refreshed_at < self.ttl:
+                return
+            query = "status_id=*"
+            if self.project_id:
+                query += f"&project_id={self.project_id}"
+            first_build = self.watermark is None
+            for issues in scan_updated_since(fetch, query, self.watermark, PAGE_SIZE):
+                notes = self._notes_for(fetch, issues)
+                for issue in issues:
+                    self._add(issue, notes.get(issue["id"], []))
+                    updated_on = issue.get("updated_on")
+                    if updated_on and (self.watermark is None or updated_on > self.watermark):
+                        self.watermark = updated_on
+            now = time.time()
+            if first_build:
+                self.reconciled_at = now
+            elif now - self.reconciled_at >= self.reconcile_interval:
+                self._reconcile(fetch, query)
+                self.reconciled_at = now
+            if len(self.deleted) > max(1000, len(self.issue_ids) // 5):
+                self._compact()
+            self.refreshed_at = time.time()
+
+    def _reconcile(self, fetch: Fetch, query: str) -> None:
+        """Tombstone issues Redmine no longer lists; only re-lists ids when the counts disagree"""
+        probe = fetch(f"/issues.json?{query}&limit=1")
+        if probe.get("total_count", 0) == self.live_count:
+            return
+        remote_ids, total_counts, offset = set(), set(), 0
+        while True:
+            data = fetch(f"/issues.json?{query}&sort=id:desc&limit={PAGE_SIZE}&offset={offset}")
+            issues = data.get("issues", [])
+            remote_ids.update(issue["id"] for issue in issues)
+            total_counts.add(data.get("total_count", 0))
+            if not issues or offset + PAGE_SIZE >= data.get("total_count", 0):
+                break
+            offset += PAGE_SIZE
+        if len(total_counts) > 1:
+            # The listing shifted while it was read; an id missing from it may still exist
+            return
+        for issue_id in set(self.current) - remote_ids:
+            self._remove(issue_id)
+
+    # -------------------------
+    # Querying
+    # -------------------------
+    def search(self, query: str, limit: int = 25, offset: int = 0) -> Dict[str, Any]:
+        """BM25-ranked matches for a free-text query"""
+        # A refresh on another thread appends to, and _compact() replaces, the columns read here
+        with self._lock:
+            return self._search(query, limit, offset)
+
+    def _search(self, query: str, limit: int, offset: int) -> Dict[str, Any]:
+        n = self.live_count
+        if not n:
+            return {"issues": [], "total_count": 0, "offset": offset, "limit": limit}
+        avg_length = self.total_length / n
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            entry = self.postings.get(term)
+            if not entry:
+                continue
+            docs, tfs = entry
+            df = len(docs)
+            idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for doc, tf in zip(docs, tfs):
+                if doc in self.deleted:
+                    continue
+                norm = K1 * (1 - B + B * self.doc_lengths[doc] / avg_length)
+                scores[doc] = scores.get(doc, 0.0) + idf * tf * (K1 + 1) / (tf + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], -self.issue_ids[item[0]]))
+        issues = []
+        for doc, score in ranked[offset:offset + limit]:
+            subject, status, project = self.meta[doc]
+            issues.append({
+                "id": self.issue_ids[doc],
+                "subject": subject,
+                "status": status,
+                "project": project,
+                "score": round(score, 4),
+            })
+        return {"issues": issues, "total_count": len(ranked), "offset": offset, "limit": limit}
+
+
+_indexes: Dict[str, SearchIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_search_index(api_url: str, api_key: str, project_id: Optional[str]) -> SearchIndex:
+    """Return the per-process search index for a project (or all projects)"""
+    credential = hashlib.sha256((api_key or "").encode()).hexdigest()[:16]
+    key = f"{api_url}|{credential}|{project_id or '*'}"
+    index = _indexes.get(key)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(key)
+            if index is None:
+                index = SearchIndex(
+                    project_id,
+                    ttl=env_int("REDMINE_SEARCH_INDEX_TTL", 60),
+                    index_notes=env_flag("REDMINE_SEARCH_INDEX_NOTES", True),
+                    reconcile_interval=env_int("REDMINE_SEARCH_INDEX_RECONCILE_INTERVAL", 3600),
+                )
+                _indexes[key] = index
+    return index
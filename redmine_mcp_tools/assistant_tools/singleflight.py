@@ -0,0 +1,158 @@
+"""
+Coalescing of identical in-flight Redmine GETs.
+
+When several threads ask for the same URL with the same credentials at the
+same time, only the first ("leader") calls Redmine; the others wait for it
+and receive the same parsed result (or exception). Results are shared, so
+callers must treat them as read-only.
+
+With REDMINE_SINGLEFLIGHT_SHARED=1 the leader also takes a short Redis lock
+through `frappe.cache()`, and leaders in other workers wait for its result
+in a short-lived slot instead of sending their own request. Only
+successful results are stored there: the tools report HTTP errors as
+`{"success": False, ...}` rather than raising, and such an answer must not
+be replayed to other workers for the slot's lifetime. If the other worker
+fails or the wait times out, the caller simply makes the request itself.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+import frappe
+
+from redmine_mcp_tools.assistant_tools.http_client import env_flag, env_float
+from redmine_mcp_tools.assistant_tools.metrics import record_cache
+
+KEY_PREFIX = "redmine_singleflight"
+
+_flight = None
+_flight_pid = None
+_flight_lock = threading.Lock()
+
+
+def make_key(method: str, url: str, api_key: Optional[str], **kwargs) -> str:
+    raw = "|".join([
+        method.upper(),
+        url,
+        hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16],
+        json.dumps(kwargs, sort_keys=True, default=str) if kwargs else "",
+    ])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _shareable(result: Any) -> bool:
+    """Whether `result` may be handed to other workers (failure dicts are not)"""
+    return not (isinstance(result, dict) and result.get("success") is False)
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self, shared: bool = False, wait: float = 30, result_ttl: float = 5):
+        self.shared = shared
+        self.wait = wait
+        self.result_ttl = result_ttl
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Run `fn` once for all concurrent callers with the same key"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+        # "hit" = answered by a call already in flight
+        record_cache("singleflight", "miss" if leader else "hit")
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._shared_do(key, fn) if self.shared else fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def _shared_do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """Coalesce across workers with a Redis lock and result slot"""
+        try:
+            cache = frappe.cache()
+            lock_key, result_key = f"{KEY_PREFIX}|lock|{key}", f"{KEY_PREFIX}|result|{key}"
+            acquired = cache.set(lock_key, os.getpid(), nx=True, px=int(self.wait * 1000))
+        except Exception:
+            return fn()
+
+        if not acquired:
+            deadline = time.monotonic() + self.wait
+            while time.monotonic() < deadline:
+                try:
+                    payload = cache.get(result_key)
+                    if payload is not None:
+                        return json.loads(payload)
+                    if not cache.exists(lock_key):
+                        # The other worker finished without a result (it failed)
+                        break
+                except Exception:
+                    break
+                time.sleep(0.05)
+            return fn()
+
+        try:
+            result = fn()
+            if _shareable(result):
+                try:
+                    cache.set(result_key, json.dumps(result), px=int(self.result_ttl * 1000))
+                except (TypeError, ValueError):
+                    pass
+            return result
+        finally:
+            try:
+                cache.delete(lock_key)
+            except Exception:
+                pass
+
+
+def get_singleflight() -> Optional[SingleFlight]:
+    """Return the per-process coalescer, or None when disabled via REDMINE_SINGLEFLIGHT=0"""
+    global _flight, _flight_pid
+    if not env_flag("REDMINE_SINGLEFLIGHT", True):
+        return None
+    pid = os.getpid()
+    if _flight is not None and _flight_pid == pid:
+        return _flight
+    with _flight_lock:
+        if _flight is None or _flight_pid != pid:
+            _flight = SingleFlight(
+                shared=env_flag("REDMINE_SINGLEFLIGHT_SHARED", False),
+                wait=env_float("REDMINE_SINGLEFLIGHT_WAIT", 30),
+                result_ttl=env_float("REDMINE_SINGLEFLIGHT_RESULT_TTL", 5),
+            )
+            _flight_pid = pid
+    return _flight
+
+
+def coalesce(url: str, api_key: Optional[str], fn: Callable[[], Any], **kwargs) -> Any:
+    """GET `url` via `fn`, sharing the call with identical concurrent requests"""
+    flight = get_singleflight()
+    if flight is None:
+        return fn()
+    return flight.do(make_key("GET", url, api_key, **kwargs), fn)
@@ -0,0 +1,204 @@
+"""
+Fuzzy issue-subject resolver.
+
+Keeps a per-project, in-memory trigram index of open issue subjects so
+`issue_subject` lookups can be answered locally with ranked candidates and
+a confidence score. The index is built lazily on first use and refreshed
+incrementally from `updated_on` deltas, and again straight away when a
+lookup misses so a just-created issue is found. Callers fall back to the
+Redmine API only on a miss or an ambiguous match.
+
+Only confident matches resolve an issue. Writes need an exact (case and
+whitespace-insensitive) subject or a near-identical one well ahead of the
+runner-up; anything looser is returned to the caller as candidates.
+"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set
+
+from redmine_mcp_tools.assistant_tools.http_client import env_float, env_int
+from redmine_mcp_tools.assistant_tools.issue_scan import scan_updated_since
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class SubjectMatch(NamedTuple):
+    issue_id: int
+    subject: str
+    score: float
+
+
+def normalize(text: str) -> str:
+    return _WHITESPACE.sub(" ", (text or "").casefold()).strip()
+
+
+def trigrams(text: str) -> Set[str]:
+    padded = f"  {normalize(text)} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def similarity(query: str, subject: str) -> float:
+    """Dice coefficient over trigrams, with exact and substring matches boosted"""
+    q, s = normalize(query), normalize(subject)
+    if not q or not s:
+        return 0.0
+    if q == s:
+        return 1.0
+    q_grams, s_grams = trigrams(q), trigrams(s)
+    score = 2 * len(q_grams & s_grams) / (len(q_grams) + len(s_grams))
+    if q in s:
+        score = max(score, 0.5 + 0.4 * len(q) / len(s))
+    return score
+
+
+def is_confident(matches: List[SubjectMatch], for_write: bool = False) -> bool:
+    """True when the best candidate is good enough and clearly ahead of the next.
+
+    An exact normalized match that no other candidate shares always counts.
+    Otherwise reads need REDMINE_SUBJECT_MATCH_THRESHOLD / _MARGIN and
+    writes the stricter REDMINE_SUBJECT_WRITE_THRESHOLD / _MARGIN.
+    """
+    if not matches:
+        return False
+    best = matches[0].score
+    if best >= 1.0:
+        return len(matches) == 1 or matches[1].score < 1.0
+    runner_up = matches[1].score if len(matches) > 1 else 0.0
+    if for_write:
+        threshold = env_float("REDMINE_SUBJECT_WRITE_THRESHOLD", 0.92)
+        margin = env_float("REDMINE_SUBJECT_WRITE_MARGIN", 0.2)
+    else:
+        threshold = env_float("REDMINE_SUBJECT_MATCH_THRESHOLD", 0.8)
+        margin = env_float("REDMINE_SUBJECT_MATCH_MARGIN", 0.15)
+    return best >= threshold and best - runner_up >= margin
+
+
+def rank(query: str, issues: List[Dict[str, Any]], limit: int = 5) -> List[SubjectMatch]:
+    """Rank arbitrary issue dicts (e.g. an API fallback result) by subject similarity"""
+    matches = [SubjectMatch(int(i["id"]), i.get("subject", ""), similarity(query, i.get("subject", ""))) for i in issues]
+    matches.sort(key=lambda m: (-m.score, -m.issue_id))
+    return matches[:limit]
+
+
+class SubjectIndex:
+    """Trigram postings over the open issues of one project"""
+
+    def __init__(self, fetch: Callable[[str], Dict[str, Any]], project_id: str, ttl: int):
+        # fetch(endpoint) -> the tool's _make_request("GET", endpoint) result
+        self.fetch = fetch
+        self.project_id = project_id
+        self.ttl = ttl
+        self.subjects: Dict[int, str] = {}
+        self.postings: Dict[str, Set[int]] = defaultdict(set)
+        self.watermark: Optional[str] = None
+        self.refreshed_at = 0.0
+        self._lock = threading.Lock()
+
+    def _add(self, issue_id: int, subject: str) -> None:
+        self._remove(issue_id)
+        self.subjects[issue_id] = subject
+        for gram in trigrams(subject):
+            self.postings[gram].add(issue_id)
+
+    def _remove(self, issue_id: int) -> None:
+        subject = self.subjects.pop(issue_id, None)
+        if subject is None:
+            return
+        for gram in trigrams(subject):
+            ids = self.postings.get(gram)
+            if ids:
+                ids.discard(issue_id)
+                if not ids:
+                    del self.postings[gram]
+
+    def _closed_status_ids(self) -> Set[int]:
+        result = self.fetch("/issue_statuses.json")
+        if not result.get("success"):
+            return set()
+        return {s["id"] for s in result["result"].get("issue_statuses", []) if s.get("is_closed")}
+
+    def _scan(self, query: str, since: Optional[str] = None) -> bool:
+        """Fold issues matching `query` updated since `since` into the index"""
+        def fetch(endpoint):
+            result = self.fetch(endpoint)
+            if not result.get("success"):
+                raise RuntimeError(result.get("error"))
+            return result["result"]
+
+        closed_ids = self._closed_status_ids()
+        try:
+            for issues in scan_updated_since(fetch, f"project_id={self.project_id}&{query}", since):
+                for issue in issues:
+                    status = issue.get("status", {})
+                    if status.get("is_closed") or status.get("id") in closed_ids:
+                        self._remove(int(issue["id"]))
+                    else:
+                        self._add(int(issue["id"]), issue.get("subject", ""))
+                    updated_on = issue.get("updated_on")
+                    if updated_on and (self.watermark is None or updated_on > self.watermark):
+                        self.watermark = updated_on
+        except RuntimeError:
+            return False
+        return True
+
+    def refresh(self, force: bool = False) -> None:
+        """Full build on first use, then only issues updated since the watermark"""
+        with self._lock:
+            if not force and time.time() - self.refreshed_at < self.ttl:
+                return
+            if self.watermark is None:
+                ok = self._scan("status_id=open")
+            else:
+                # Include closed issues so tickets closed since the last refresh drop out
+                ok = self._scan("status_id=*", self.watermark)
+            if ok:
+                self.refreshed_at = time.time()
+
+    def _rank(self, query: str, limit: int) -> List[SubjectMatch]:
+        # Under the lock: a refresh on another thread mutates the postings
+        with self._lock:
+            candidate_ids = set()
+            for gram in trigrams(query):
+                candidate_ids |= self.postings.get(gram, set())
+            matches = [
+                SubjectMatch(issue_id, self.subjects[issue_id], similarity(query, self.subjects[issue_id]))
+                for issue_id in candidate_ids
+            ]
+        matches.sort(key=lambda m: (-m.score, -m.issue_id))
+        return matches[:limit]
+
+    def lookup(self, query: str, limit: int = 5, for_write: bool = False) -> List[SubjectMatch]:
+        """Ranked candidates for a subject query, best first.
+
+        A result that is not confident triggers an immediate incremental
+        refresh (rather than waiting out the TTL) and is ranked again.
+        """
+        self.refresh()
+        matches = self._rank(query, limit)
+        if not is_confident(matches, for_write):
+            self.refresh(force=True)
+            matches = self._rank(query, limit)
+        return matches
+
+
+_indexes: Dict[str, SubjectIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_subject_index(api_url: str, api_key: str, project_id: str,
+                      fetch: Callable[[str], Dict[str, Any]]) -> SubjectIndex:
+    """Return the per-process subject index for a project"""
+    credential = hashlib.sha256((api_key or "").encode()).hexdigest()[:16]
+    key = f"{api_url}|{credential}|{project_id}"
+    index = _indexes.get(key)
+    if index is None:
+        with _indexes_lock:
+            index = _indexes.get(key)
+            if index is None:
+                index = SubjectIndex(fetch, project_id, env_int("REDMINE_SUBJECT_INDEX_TTL", 60))
+                _indexes[key] = index
+    return index
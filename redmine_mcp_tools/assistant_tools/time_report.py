@@ -0,0 +1,161 @@
+"""
+Streaming spent-time rollups from Redmine's /time_entries.json.
+
+Pages are requested with a bounded number in flight and each page is
+folded into running totals (per user, issue, activity and ISO week) as soon
+as it arrives, then dropped. Memory depends only on the number of distinct
+users, issues, activities and weeks, so years of time entries aggregate in
+little more than the footprint of a month.
+
+Offset pages shift when entries are logged or deleted during the scan. A
+shift repeats entries across neighbouring pages only, so duplicates are
+dropped against the ids of the last few pages rather than every id seen. A
+scan whose total_count moved (or that saw fewer entries than it promised)
+is read once more from scratch.
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from urllib.parse import quote
+
+PAGE_SIZE = 100
+
+# fetch(endpoint) -> parsed JSON; raises on HTTP/transport errors
+Fetch = Callable[[str], Dict[str, Any]]
+
+
+def time_entries_query(project_id: Any, from_date: Optional[str] = None, to_date: Optional[str] = None,
+                       user_id: Any = None) -> str:
+    """/time_entries.json parameters for a project and optional date range / user"""
+    params = [f"project_id={quote(str(project_id))}"]
+    if from_date:
+        params.append(f"from={quote(str(from_date))}")
+    if to_date:
+        params.append(f"to={quote(str(to_date))}")
+    if user_id:
+        params.append(f"user_id={quote(str(user_id))}")
+    return "&".join(params)
+
+
+def iter_time_entry_pages(fetch: Fetch, query: str, concurrency: int,
+                          total_counts: Optional[List[int]] = None) -> Iterator[List[dict]]:
+    """Yield time-entry pages, keeping up to `concurrency` requests in flight ahead.
+
+    Each page's total_count is appended to `total_counts` when given.
+    """
+    base = f"/time_entries.json?{query}&limit={PAGE_SIZE}"
+    if total_counts is None:
+        total_counts = []
+    first = fetch(f"{base}&offset=0")
+    total_counts.append(first.get("total_count", 0))
+    yield first.get("time_entries", [])
+    offsets = iter(range(PAGE_SIZE, first.get("total_count", 0), PAGE_SIZE))
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        pending = deque()
+        for offset in offsets:
+            pending.append(pool.submit(fetch, f"{base}&offset={offset}"))
+            if len(pending) >= concurrency:
+                break
+        while pending:
+            page = pending.popleft().result()
+            offset = next(offsets, None)
+            if offset is not None:
+                pending.append(pool.submit(fetch, f"{base}&offset={offset}"))
+            total_counts.append(page.get("total_count", 0))
+            yield page.get("time_entries", [])
+
+
+class TimeAggregates:
+    """Running spent-hours totals; add() pages in any order"""
+
+    def __init__(self):
+        self.hours = 0.0
+        self.entries = 0
+        self.first_day: Optional[str] = None
+        self.last_day: Optional[str] = None
+        # key -> [hours, entries]
+        self.users: Dict[str, list] = {}
+        self.issues: Dict[int, list] = {}
+        self.activities: Dict[str, list] = {}
+        self.weeks: Dict[str, list] = {}
+        self._week_of: Dict[str, str] = {}
+        # False when the listing kept changing and entries may be missing
+        self.complete = True
+
+    def _week(self, spent_on: str) -> str:
+        week = self._week_of.get(spent_on)
+        if week is None:
+            year, number, _ = date.fromisoformat(spent_on).isocalendar()
+            week = self._week_of[spent_on] = f"{year}-W{number:02d}"
+        return week
+
+    @staticmethod
+    def _bump(totals: dict, key: Any, hours: float) -> None:
+        row = totals.get(key)
+        if row is None:
+            totals[key] = [hours, 1]
+        else:
+            row[0] += hours
+            row[1] += 1
+
+    def add(self, entries: List[dict]) -> None:
+        for entry in entries:
+            hours = float(entry.get("hours") or 0)
+            spent_on = entry.get("spent_on")
+            self.hours += hours
+            self.entries += 1
+            self._bump(self.users, (entry.get("user") or {}).get("name") or "Unknown", hours)
+            self._bump(self.activities, (entry.get("activity") or {}).get("name") or "Unknown", hours)
+            issue_id = (entry.get("issue") or {}).get("id")
+            if issue_id is not None:
+                self._bump(self.issues, issue_id, hours)
+            if spent_on:
+                self._bump(self.weeks, self._week(spent_on), hours)
+                if self.first_day is None or spent_on < self.first_day:
+                    self.first_day = spent_on
+                if self.last_day is None or spent_on > self.last_day:
+                    self.last_day = spent_on
+
+    @staticmethod
+    def _table(key_column: str, totals: dict, limit: Optional[int] = None, by_key: bool = False) -> Dict[str, Any]:
+        items = sorted(totals.items()) if by_key else sorted(totals.items(), key=lambda item: -item[1][0])
+        if limit:
+            items = items[:limit]
+        return {
+            "columns": [key_column, "hours", "entries"],
+            "rows": [[key, round(hours, 2), count] for key, (hours, count) in items],
+        }
+
+    def tables(self, issue_limit: Optional[int] = None) -> Dict[str, Any]:
+        """Totals plus {columns, rows} tables; users, issues and activities by hours, weeks in order"""
+        return {
+            "total_hours": round(self.hours, 2),
+            "entries": self.entries,
+            "from": self.first_day,
+            "to": self.last_day,
+            "by_user": self._table("user", self.users),
+            "by_issue": self._table("issue_id", self.issues, issue_limit),
+            "issue_count": len(self.issues),
+            "by_activity": self._table("activity", self.activities),
+            "by_week": self._table("week", self.weeks, by_key=True),
+            "complete": self.complete,
+        }
+
+
+def aggregate_time_entries(fetch: Fetch, query: str, concurrency: int) -> TimeAggregates:
+    """Fold every time entry once, re-reading the listing once if it changed mid-scan"""
+    for _attempt in range(2):
+        totals = TimeAggregates()
+        # Ids of the pages a shift can repeat entries from: those in flight together, plus one
+        recent = deque(maxlen=max(1, concurrency) + 1)
+        total_counts: List[int] = []
+        for page in iter_time_entry_pages(fetch, query, concurrency, total_counts):
+            fresh = [entry for entry in page if not any(entry["id"] in ids for ids in recent)]
+            recent.append({entry["id"] for entry in page})
+            totals.add(fresh)
+        totals.complete = len(set(total_counts)) == 1 and totals.entries >= total_counts[0]
+        if totals.complete:
+            break
+    return totals
@@ -0,0 +1,245 @@
+"""
+Per-invocation tracing for the Redmine tools.
+
+A call made with `trace: true` (or picked by REDMINE_TRACE_SAMPLE_RATE)
+records a span tree: name resolution, every Redmine request with its
+endpoint template, status, bytes and duration, JSON decoding, grouping and
+each render phase. Requested traces come back as a compact waterfall under
+the result's "trace" key; sampled ones are written to the Error Log under
+"Redmine Trace" so normal results keep their shape.
+
+`profile: "cpu"` adds the top cProfile entries and `profile: "memory"` the
+top tracemalloc allocations, for render-heavy calls. cProfile only sees its
+own thread, so work handed to a pool through bind_context()/run_blocking()
+is profiled in the worker and merged into the report.
+
+Without an active trace `span()` is a context-variable lookup returning a
+shared no-op object.
+"""
+
+import contextvars
+import functools
+import itertools
+import json
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import frappe
+from frappe import _
+
+from redmine_mcp_tools.assistant_tools.http_client import env_float, env_int
+
+# Arguments consumed here and never passed on to the tools
+TRACE_ARGUMENTS = ("trace", "profile")
+PROFILE_MODES = ("cpu", "memory")
+
+_trace: contextvars.ContextVar = contextvars.ContextVar("redmine_trace", default=None)
+_parent: contextvars.ContextVar = contextvars.ContextVar("redmine_trace_span", default=None)
+# Worker-thread cProfile runs of the current cpu profile, merged into its report
+_worker_profiles: contextvars.ContextVar = contextvars.ContextVar("redmine_worker_profiles", default=None)
+
+
+class Span:
+    __slots__ = ("id", "parent", "name", "start", "end", "attrs")
+
+    def __init__(self, span_id: int, parent: Optional[int], name: str, start: float, attrs: Dict[str, Any]):
+        self.id = span_id
+        self.parent = parent
+        self.name = name
+        self.start = start
+        self.end = None
+        self.attrs = attrs
+
+    def set(self, **attrs: Any) -> None:
+        self.attrs.update(attrs)
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Trace:
+    def __init__(self, name: str):
+        self.name = name
+        self.started = time.perf_counter()
+        self.spans: List[Span] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def add(self, name: str, start: float, attrs: Dict[str, Any]) -> Span:
+        span = Span(next(self._ids), _parent.get(), name, start, attrs)
+        with self._lock:
+            self.spans.append(span)
+        return span
+
+    def waterfall(self) -> Dict[str, Any]:
+        """Spans in start order as `offset ms | duration ms | indented name attrs` lines"""
+        total_ms = (time.perf_counter() - self.started) * 1000
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: (s.start, s.id))
+        depth = {}
+        lines = []
+        for span in spans:
+            depth[span.id] = depth.get(span.parent, -1) + 1
+            end = span.end if span.end is not None else time.perf_counter()
+            attrs = " ".join(f"{key}={value}" for key, value in span.attrs.items())
+            lines.append(
+                f"{(span.start - self.started) * 1000:9.1f} {(end - span.start) * 1000:9.1f}ms "
+                f"{'  ' * depth[span.id]}{span.name}{' ' + attrs if attrs else ''}"
+            )
+        max_spans = env_int("REDMINE_TRACE_MAX_SPANS", 500)
+        if len(lines) > max_spans:
+            lines = lines[:max_spans] + [f"... {len(lines) - max_spans} more spans"]
+        return {"name": self.name, "total_ms": round(total_ms, 1), "spans": len(spans), "waterfall": lines}
+
+
+class _SpanContext:
+    __slots__ = ("trace", "name", "attrs", "span", "token")
+
+    def __init__(self, trace: Trace, name: str, attrs: Dict[str, Any]):
+        self.trace = trace
+        self.name = name
+        self.attrs = attrs
+
+    def __enter__(self) -> Span:
+        self.span = self.trace.add(self.name, time.perf_counter(), self.attrs)
+        self.token = _parent.set(self.span.id)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        self.span.end = time.perf_counter()
+        if exc_type is not None:
+            self.span.attrs["error"] = exc_type.__name__
+        _parent.reset(self.token)
+        return False
+
+
+def span(name: str, **attrs: Any):
+    """Context manager timing a block as a child of the current span"""
+    trace = _trace.get()
+    if trace is None:
+        return NULL_SPAN
+    return _SpanContext(trace, name, attrs)
+
+
+def run_profiled(func: Callable, *args: Any, **kwargs: Any) -> Any:
+    """Call `func`, under its own cProfile when a cpu profile is active in this context.
+
+    Pool helpers run their callables through this so worker threads show up
+    in the profile of the call that fanned out to them.
+    """
+    profiles = _worker_profiles.get()
+    if profiles is None:
+        return func(*args, **kwargs)
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Another profiler owns this interpreter (3.12+ allows only one)
+        return func(*args, **kwargs)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profiler.disable()
+        profiles.append(profiler)
+
+
+def _profiled(mode: Optional[str], func: Callable[[], Any]) -> tuple:
+    """Run `func` under cProfile or tracemalloc; returns (result, report lines)"""
+    if mode == "cpu":
+        import cProfile
+        import io
+        import pstats
+
+        profiler = cProfile.Profile()
+        profiles: List[Any] = []
+        token = _worker_profiles.set(profiles)
+        try:
+            result = profiler.runcall(func)
+        finally:
+            _worker_profiles.reset(token)
+        out = io.StringIO()
+        stats = pstats.Stats(profiler, stream=out)
+        for worker in list(profiles):
+            stats.add(worker)
+        stats.sort_stats("cumulative").print_stats(25)
+        return result, [line for line in out.getvalue().splitlines() if line.strip()]
+    if mode == "memory":
+        import tracemalloc
+
+        already_tracing = tracemalloc.is_tracing()
+        if not already_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        try:
+            result = func()
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            if not already_tracing:
+                tracemalloc.stop()
+        lines = [f"peak {peak / 1024:.1f} KiB"]
+        lines += [str(stat) for stat in snapshot.statistics("lineno")[:15]]
+        return result, lines
+    return func(), None
+
+
+def traced(tool: str):
+    """Decorate a tool's execute(arguments) with opt-in or sampled tracing"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, arguments: Dict[str, Any]) -> Any:
+            arguments = arguments or {}
+            requested = bool(arguments.get("trace"))
+            profile = arguments.get("profile") if arguments.get("profile") in PROFILE_MODES else None
+            sampled = not requested and random.random() < env_float("REDMINE_TRACE_SAMPLE_RATE", 0)
+            call_args = arguments
+            if any(key in arguments for key in TRACE_ARGUMENTS):
+                call_args = {k: v for k, v in arguments.items() if k not in TRACE_ARGUMENTS}
+            if not (requested or sampled or profile):
+                return func(self, call_args)
+
+            trace = Trace(f"{tool}.{arguments.get('action') or 'execute'}")
+            trace_token = _trace.set(trace)
+            parent_token = _parent.set(None)
+            try:
+                result, profile_lines = _profiled(profile, lambda: func(self, call_args))
+            finally:
+                _parent.reset(parent_token)
+                _trace.reset(trace_token)
+
+            report = trace.waterfall()
+            if profile_lines:
+                report["profile"] = {"mode": profile, "top": profile_lines}
+            if (requested or profile) and isinstance(result, dict):
+                result = {**result, "trace": report}
+            else:
+                frappe.log_error(title=_("Redmine Trace"), message=json.dumps(report, indent=1))
+            return result
+        return wrapper
+    return decorator
+
+
+def spanned(name: str):
+    """Decorator form of span() covering a whole method call"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,5 @@
+# Benchmarks for the Redmine tools
+"""
+A fake Redmine server (fake_redmine.py) and a runner (run.py) that measure
+the tools at 1k, 10k and 100k issues and write the results as JSON.
+"""
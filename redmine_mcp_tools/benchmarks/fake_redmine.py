@@ -0,0 +1,607 @@
+"""
+Local stand-in for the Redmine REST API used by the benchmark suite.
+
+Serves a synthetic, seeded dataset (projects, memberships, statuses,
+priorities, trackers, categories, issues with journals and time entries) over HTTP with
+keep-alive, ETags and the /issues.json filters and sorts the tools send.
+Latency, the largest page Redmine will return and injected errors are
+configurable, so the same dataset can be served fast, slow or flaky.
+
+Only the standard library is used, so the server runs in its own process
+and its CPU time and memory stay out of the measurements:
+
+    python -m redmine_mcp_tools.benchmarks.fake_redmine --issues 10000 --latency 0.02
+
+Two control endpoints are not part of Redmine: GET /_bench/stats returns
+request counters and POST /_bench/reset zeroes them.
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from datetime import date, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+API_KEY_HEADER = "X-Redmine-API-Key"
+BENCH_PROJECT = "benchmark"
+
+STATUSES = [
+    {"id": 1, "name": "New", "is_closed": False},
+    {"id": 2, "name": "In Progress", "is_closed": False},
+    {"id": 3, "name": "Feedback", "is_closed": False},
+    {"id": 4, "name": "Deployed to UAT", "is_closed": False},
+    {"id": 5, "name": "On Hold", "is_closed": False},
+    {"id": 6, "name": "Closed", "is_closed": True},
+    {"id": 7, "name": "Rejected", "is_closed": True},
+]
+PRIORITIES = [
+    {"id": 1, "name": "Low"},
+    {"id": 2, "name": "Normal", "is_default": True},
+    {"id": 3, "name": "High"},
+    {"id": 4, "name": "Urgent"},
+]
+TRACKERS = [
+    {"id": 1, "name": "Bug"},
+    {"id": 2, "name": "Feature"},
+    {"id": 3, "name": "Support"},
+]
+CATEGORIES = [
+    {"id": 1, "name": "Backend"},
+    {"id": 2, "name": "Frontend"},
+    {"id": 3, "name": "Reports"},
+]
+ACTIVITIES = [
+    {"id": 8, "name": "Design"},
+    {"id": 9, "name": "Development"},
+    {"id": 10, "name": "Testing"},
+    {"id": 11, "name": "Support"},
+]
+
+# Share of new issues per status / priority (weights, same order as above)
+STATUS_WEIGHTS = (30, 25, 10, 10, 5, 15, 5)
+PRIORITY_WEIGHTS = (15, 55, 22, 8)
+
+_WORDS = (
+    "login page invoice report sync export import dashboard payment email "
+    "timeout permission search filter upload customer order stock price "
+    "calendar notification api mobile layout translation backup audit"
+).split()
+_VERBS = ("Fix", "Add", "Improve", "Investigate", "Refactor", "Update", "Remove", "Support")
+_SENTENCES = (
+    "Steps to reproduce are in the attached log.",
+    "The customer reported this after the last release.",
+    "Happens only for users with a restricted role.",
+    "Needs a migration for existing records.",
+    "Blocked until the upstream API change is deployed.",
+    "Seen on both staging and production.",
+)
+
+_ISSUE_PATH = re.compile(r"^/issues/(\d+)\.json$")
+_PROJECT_PATH = re.compile(r"^/projects/([^/]+)/(memberships|issue_categories)\.json$")
+
+
+def _ref(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {"id": item["id"], "name": item["name"]}
+
+
+def _timestamp(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class Dataset:
+    """Seeded projects, users and issues; nested refs are shared to keep 100k issues compact"""
+
+    def __init__(self, issues: int = 1000, projects: int = 50, users: int = 25, seed: int = 42):
+        rng = random.Random(seed)
+        self.seed = seed
+        self.today = date.today()
+        self.statuses = STATUSES
+        self.closed_ids = {s["id"] for s in STATUSES if s["is_closed"]}
+        self._status_refs = {s["id"]: _ref(s) for s in STATUSES}
+        self._priority_refs = {p["id"]: _ref(p) for p in PRIORITIES}
+        self._tracker_refs = {t["id"]: _ref(t) for t in TRACKERS}
+        self._activity_refs = {a["id"]: _ref(a) for a in ACTIVITIES}
+
+        self.projects = [{
+            "id": 1, "name": "Benchmark", "identifier": BENCH_PROJECT,
+            "description": "Synthetic benchmark project", "status": 1, "is_public": True,
+        }]
+        for project_id in range(2, projects + 1):
+            project = {
+                "id": project_id, "name": f"Project {project_id:03d}", "identifier": f"project-{project_id:03d}",
+                "description": "", "status": 1, "is_public": True,
+            }
+            if project_id <= 4:
+                project["parent"] = {"id": 1, "name": "Benchmark"}
+            self.projects.append(project)
+        self.projects_by_key = {str(p["id"]): p for p in self.projects}
+        self.projects_by_key.update({p["identifier"]: p for p in self.projects})
+
+        self.users = [{"id": 100 + i, "name": f"User {i:02d}"} for i in range(users)]
+        # project id -> member user ids; every user is a member of projects not listed
+        self.members: Dict[int, List[int]] = {}
+        self._user_refs = {u["id"]: _ref(u) for u in self.users}
+        self._project_ref = _ref(self.projects[0])
+
+        now = datetime.combine(self.today, datetime.min.time()) + timedelta(hours=12)
+        self.issues: List[Dict[str, Any]] = []
+        self.by_id: Dict[int, Dict[str, Any]] = {}
+        self.journals: Dict[int, List[Dict[str, Any]]] = {}
+        status_ids = [s["id"] for s in STATUSES]
+        priority_ids = [p["id"] for p in PRIORITIES]
+        for issue_id in range(issues, 0, -1):
+            created = now - timedelta(minutes=rng.randrange(365 * 24 * 60))
+            updated = min(now, created + timedelta(minutes=rng.randrange(60 * 24 * 60)))
+            status_id = rng.choices(status_ids, STATUS_WEIGHTS)[0]
+            issue = {
+                "id": issue_id,
+                "project": self._project_ref,
+                "tracker": self._tracker_refs[rng.choice((1, 1, 2, 3))],
+                "status": self._status_refs[status_id],
+                "priority": self._priority_refs[rng.choices(priority_ids, PRIORITY_WEIGHTS)[0]],
+                "author": self._user_refs[self.users[rng.randrange(users)]["id"]],
+                "subject": f"{rng.choice(_VERBS)} {rng.choice(_WORDS)} {rng.choice(_WORDS)} #{issue_id}",
+                "description": rng.choice(_SENTENCES),
+                "start_date": created.date().isoformat(),
+                "due_date": (created.date() + timedelta(days=rng.randrange(5, 90))).isoformat()
+                if rng.random() < 0.7 else None,
+                "done_ratio": rng.choice((0, 0, 10, 50, 80, 100)),
+                "created_on": _timestamp(created),
+                "updated_on": _timestamp(updated),
+            }
+            if rng.random() >= 0.1:
+                issue["assigned_to"] = self._user_refs[self.users[rng.randrange(users)]["id"]]
+            if status_id in self.closed_ids:
+                issue["closed_on"] = issue["updated_on"]
+            self.issues.append(issue)
+            self.by_id[issue_id] = issue
+        self.next_id = issues + 1
+        self.version = 0
+        self._clock = now
+        self._journal_ids = itertools.count(10_000_000)
+        self._time_entries: Optional[List[tuple]] = None
+
+    # ---- writes ------------------------------------------------------------
+    def _stamp(self) -> str:
+        """Write time: never before the seeded history and strictly increasing, like Redmine's updated_on"""
+        self._clock = max(datetime.utcnow().replace(microsecond=0), self._clock + timedelta(seconds=1))
+        return _timestamp(self._clock)
+
+    def create(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        stamp = self._stamp()
+        issue = {
+            "id": self.next_id,
+            "project": _ref(self.projects_by_key.get(str(fields.get("project_id")), self.projects[0])),
+            "tracker": self._tracker_refs[1],
+            "status": self._status_refs.get(fields.get("status_id"), self._status_refs[1]),
+            "priority": self._priority_refs.get(fields.get("priority_id"), self._priority_refs[2]),
+            "author": self._user_refs[self.users[0]["id"]],
+            "subject": fields.get("subject") or "",
+            "description": fields.get("description") or "",
+            "start_date": self.today.isoformat(),
+            "due_date": None,
+            "done_ratio": 0,
+            "created_on": stamp,
+            "updated_on": stamp,
+        }
+        if fields.get("assigned_to_id") in self._user_refs:
+            issue["assigned_to"] = self._user_refs[fields["assigned_to_id"]]
+        self.next_id += 1
+        self.issues.insert(0, issue)
+        self.by_id[issue["id"]] = issue
+        self.version += 1
+        return issue
+
+    def update(self, issue: Dict[str, Any], fields: Dict[str, Any]) -> None:
+        details = []
+        for name, refs, key in (("status_id", self._status_refs, "status"),
+                                ("priority_id", self._priority_refs, "priority"),
+                                ("assigned_to_id", self._user_refs, "assigned_to")):
+            if fields.get(name) in refs:
+                old = (issue.get(key) or {}).get("id")
+                issue[key] = refs[fields[name]]
+                details.append({"property": "attr", "name": name,
+                                "old_value": None if old is None else str(old), "new_value": str(fields[name])})
+        for name in ("subject", "description", "due_date", "done_ratio"):
+            if name in fields:
+                issue[name] = fields[name]
+        issue["updated_on"] = self._stamp()
+        if issue["status"]["id"] in self.closed_ids:
+            issue.setdefault("closed_on", issue["updated_on"])
+        if details or fields.get("notes"):
+            self.journals.setdefault(issue["id"], []).append({
+                "id": next(self._journal_ids), "user": self._user_refs[self.users[0]["id"]],
+                "notes": fields.get("notes") or "", "created_on": issue["updated_on"], "details": details,
+            })
+        self.version += 1
+
+    # ---- journals ----------------------------------------------------------
+    def issue_journals(self, issue: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Status history from creation to the current status, plus any written journals"""
+        rng = random.Random(self.seed * 1_000_003 + issue["id"])
+        path = [1]
+        target = issue["status"]["id"]
+        if target != 1:
+            path.append(2)
+            if rng.random() < 0.3:
+                path += [3, 2]
+            if target in self.closed_ids and rng.random() < 0.15:
+                # Closed once, reopened, closed again
+                path += [6, 2]
+            if target != 2:
+                path.append(target)
+        created = datetime.strptime(issue["created_on"], "%Y-%m-%dT%H:%M:%SZ")
+        updated = datetime.strptime(issue["updated_on"], "%Y-%m-%dT%H:%M:%SZ")
+        span = max((updated - created).total_seconds(), len(path))
+        journals = []
+        for step, (old, new) in enumerate(zip(path, path[1:]), 1):
+            at = created + timedelta(seconds=span * step / (len(path) - 1))
+            journals.append({
+                "id": issue["id"] * 100 + step,
+                "user": issue.get("assigned_to") or issue["author"],
+                "notes": rng.choice(("", "", _SENTENCES[step % len(_SENTENCES)])),
+                "created_on": _timestamp(at),
+                "details": [{"property": "attr", "name": "status_id", "old_value": str(old), "new_value": str(new)}],
+            })
+        return journals + self.journals.get(issue["id"], [])
+
+
+    # ---- time entries ------------------------------------------------------
+    def time_entries(self) -> List[tuple]:
+        """(id, issue id, user id, activity id, hours, spent_on) rows, newest day first; built on first use"""
+        if self._time_entries is None:
+            rng = random.Random(self.seed * 7919)
+            activity_ids = [a["id"] for a in ACTIVITIES]
+            rows = []
+            for issue in self.issues:
+                created = date.fromisoformat(issue["created_on"][:10])
+                days = (date.fromisoformat(issue["updated_on"][:10]) - created).days
+                for _ in range(rng.choice((0, 1, 1, 2, 3, 4))):
+                    rows.append((
+                        len(rows) + 1, issue["id"], self.users[rng.randrange(len(self.users))]["id"],
+                        rng.choice(activity_ids), rng.choice((0.25, 0.5, 1.0, 1.5, 2.0, 3.0, 4.0, 8.0)),
+                        (created + timedelta(days=rng.randint(0, days))).isoformat(),
+                    ))
+            rows.sort(key=lambda row: (row[5], row[0]), reverse=True)
+            self._time_entries = rows
+        return self._time_entries
+
+    def time_entry(self, row: tuple) -> Dict[str, Any]:
+        entry_id, issue_id, user_id, activity_id, hours, spent_on = row
+        stamp = f"{spent_on}T17:00:00Z"
+        return {
+            "id": entry_id, "project": self._project_ref, "issue": {"id": issue_id},
+            "user": self._user_refs[user_id], "activity": self._activity_refs[activity_id],
+            "hours": hours, "comments": "", "spent_on": spent_on, "created_on": stamp, "updated_on": stamp,
+        }
+
+
+def _date_matcher(expr: str, today: date) -> Callable[[Optional[str]], bool]:
+    """Redmine date operators: >=d, <=d, ><d1|d2, ><t-N (last N days), d"""
+    if expr.startswith("><t-"):
+        start, end = (today - timedelta(days=int(expr[4:]))).isoformat(), today.isoformat()
+    elif expr.startswith("><"):
+        start, end = expr[2:].split("|", 1)
+    elif expr.startswith(">="):
+        start, end = expr[2:], None
+    elif expr.startswith("<="):
+        start, end = None, expr[2:]
+    else:
+        start = end = expr
+
+    def match(value: Optional[str]) -> bool:
+        if not value:
+            return False
+        if start and value < start:
+            return False
+        return not end or value[:len(end)] <= end
+
+    return match
+
+
+def _id_matcher(expr: str, get: Callable[[dict], Optional[int]]) -> Callable[[dict], bool]:
+    if expr == "*":
+        return lambda issue: get(issue) is not None
+    if expr == "!*":
+        return lambda issue: get(issue) is None
+    negate = expr.startswith("!")
+    ids = {int(v) for v in expr.lstrip("!").split("|") if v.isdigit()}
+    return lambda issue: (get(issue) in ids) != negate
+
+
+_SORT_KEYS: Dict[str, Callable[[dict], Any]] = {
+    "id": lambda i: i["id"],
+    "updated_on": lambda i: i["updated_on"],
+    "created_on": lambda i: i["created_on"],
+    "due_date": lambda i: i.get("due_date") or "",
+    "priority": lambda i: i["priority"]["id"],
+    "status": lambda i: i["status"]["id"],
+    "subject": lambda i: i["subject"],
+    "assigned_to": lambda i: (i.get("assigned_to") or {}).get("name", ""),
+}
+
+
+class FakeRedmine:
+    """Request handling state: the dataset, knobs, counters and a per-query result cache"""
+
+    def __init__(self, dataset: Dataset, latency: float = 0.0, jitter: float = 0.0, max_limit: int = 100,
+                 error_rate: float = 0.0, error_status: int = 503, seed: int = 42):
+        self.dataset = dataset
+        self.latency = latency
+        self.jitter = jitter
+        self.max_limit = max_limit
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._queries: Dict[Tuple, Tuple[int, List[dict]]] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.stats = {"requests": 0, "errors_injected": 0, "bytes": 0, "by_endpoint": {}}
+
+    def count(self, method: str, path: str, size: int, injected: bool = False) -> None:
+        endpoint = re.sub(r"/\d+(?=[./])", "/:id", path)
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["bytes"] += size
+            self.stats["errors_injected"] += injected
+            key = f"{method} {endpoint}"
+            self.stats["by_endpoint"][key] = self.stats["by_endpoint"].get(key, 0) + 1
+
+    def inject_error(self) -> bool:
+        if not self.error_rate:
+            return False
+        with self._lock:
+            return self._rng.random() < self.error_rate
+
+    def delay(self) -> None:
+        pause = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0)
+        if pause > 0:
+            time.sleep(pause)
+
+    # ---- GET handlers ------------------------------------------------------
+    def get(self, path: str, query: Dict[str, str]) -> Tuple[int, Any]:
+        data = self.dataset
+        if path == "/issues.json":
+            return 200, self._issues(query)
+        if path == "/time_entries.json":
+            return 200, self._time_entries(query)
+        match = _ISSUE_PATH.match(path)
+        if match:
+            issue = data.by_id.get(int(match.group(1)))
+            if issue is None:
+                return 404, {"errors": ["Not found"]}
+            if "journals" in query.get("include", ""):
+                issue = {**issue, "journals": data.issue_journals(issue)}
+            return 200, {"issue": issue}
+        if path == "/projects.json":
+            return 200, self._page("projects", data.projects, query)
+        match = _PROJECT_PATH.match(path)
+        if match:
+            if unquote(match.group(1)) not in data.projects_by_key:
+                return 404, {"errors": ["Not found"]}
+            if match.group(2) == "issue_categories":
+                return 200, {"issue_categories": CATEGORIES, "total_count": len(CATEGORIES)}
+            member_ids = data.members.get(data.projects_by_key[unquote(match.group(1))]["id"])
+            memberships = [{"id": u["id"], "user": _ref(u), "roles": [{"id": 4, "name": "Developer"}]}
+                           for u in data.users if member_ids is None or u["id"] in member_ids]
+            return 200, self._page("memberships", memberships, query)
+        if path == "/issue_statuses.json":
+            return 200, {"issue_statuses": data.statuses}
+        if path == "/enumerations/issue_priorities.json":
+            return 200, {"issue_priorities": PRIORITIES}
+        if path == "/trackers.json":
+            return 200, {"trackers": TRACKERS}
+        return 404, {"errors": ["Not found"]}
+
+    def _page(self, key: str, items: List[Any], query: Dict[str, str]) -> Dict[str, Any]:
+        offset = max(0, int(query.get("offset") or 0))
+        limit = min(max(1, int(query.get("limit") or 25)), self.max_limit)
+        return {key: items[offset:offset + limit], "total_count": len(items), "offset": offset, "limit": limit}
+
+    def _issues(self, query: Dict[str, str]) -> Dict[str, Any]:
+        criteria = tuple(sorted((k, v) for k, v in query.items() if k not in ("limit", "offset")))
+        with self._lock:
+            cached = self._queries.get(criteria)
+        if cached is None or cached[0] != self.dataset.version:
+            cached = (self.dataset.version, self._select(query))
+            with self._lock:
+                if len(self._queries) > 256:
+                    self._queries.clear()
+                self._queries[criteria] = cached
+        return self._page("issues", cached[1], query)
+
+    def _time_entries(self, query: Dict[str, str]) -> Dict[str, Any]:
+        data = self.dataset
+        criteria = ("time_entries",) + tuple(sorted((k, v) for k, v in query.items() if k not in ("limit", "offset")))
+        with self._lock:
+            rows = self._queries.get(criteria)
+        if rows is None:
+            rows = data.time_entries()
+            project = query.get("project_id")
+            if project and (data.projects_by_key.get(project) or {}).get("id") != 1:
+                # Every synthetic issue, and so every time entry, belongs to the benchmark project
+                rows = []
+            start, end = query.get("from"), query.get("to")
+            user = query.get("user_id", "").replace("me", str(data.users[0]["id"]))
+            rows = [row for row in rows if (not start or row[5] >= start) and (not end or row[5] <= end)
+                    and (not user or str(row[2]) == user)]
+            with self._lock:
+                self._queries[criteria] = rows
+        page = self._page("time_entries", rows, query)
+        page["time_entries"] = [data.time_entry(row) for row in page["time_entries"]]
+        return page
+
+    def _select(self, query: Dict[str, str]) -> List[dict]:
+        data = self.dataset
+        tests: List[Callable[[dict], bool]] = []
+        project = query.get("project_id")
+        if project:
+            project_id = (data.projects_by_key.get(project) or {}).get("id")
+            tests.append(lambda i: i["project"]["id"] == project_id)
+
+        status = query.get("status_id", "open")
+        if status == "open":
+            tests.append(lambda i: i["status"]["id"] not in data.closed_ids)
+        elif status == "closed":
+            tests.append(lambda i: i["status"]["id"] in data.closed_ids)
+        elif status != "*":
+            tests.append(_id_matcher(status, lambda i: i["status"]["id"]))
+
+        for param, key in (("priority_id", "priority"), ("tracker_id", "tracker"), ("assigned_to_id", "assigned_to")):
+            expr = query.get(param)
+            if expr:
+                expr = expr.replace("me", str(data.users[0]["id"]))
+                tests.append(_id_matcher(expr, lambda i, key=key: (i.get(key) or {}).get("id")))
+
+        for param in ("created_on", "updated_on", "due_date"):
+            if query.get(param):
+                matcher = _date_matcher(query[param], data.today)
+                tests.append(lambda i, param=param, matcher=matcher: matcher(i.get(param)))
+
+        subject = query.get("subject", "")
+        if subject.startswith("~"):
+            needle = subject[1:].casefold()
+            tests.append(lambda i: needle in i["subject"].casefold())
+
+        issues = [i for i in data.issues if all(test(i) for test in tests)] if tests else list(data.issues)
+        sort = query.get("sort") or "id:desc"
+        for term in reversed(sort.split(",")):
+            name, _, direction = term.partition(":")
+            if name in _SORT_KEYS:
+                issues.sort(key=_SORT_KEYS[name], reverse=direction == "desc")
+        return issues
+
+    # ---- writes ------------------------------------------------------------
+    def write(self, method: str, path: str, body: Dict[str, Any]) -> Tuple[int, Any]:
+        fields = body.get("issue") or {}
+        with self._lock:
+            if method == "POST" and path == "/issues.json":
+                if not fields.get("subject"):
+                    return 422, {"errors": ["Subject cannot be blank"]}
+                return 201, {"issue": self.dataset.create(fields)}
+            match = _ISSUE_PATH.match(path)
+            if method == "PUT" and match:
+                issue = self.dataset.by_id.get(int(match.group(1)))
+                if issue is None:
+                    return 404, {"errors": ["Not found"]}
+                self.dataset.update(issue, fields)
+                return 204, None
+        return 404, {"errors": ["Not found"]}
+
+
+def make_handler(app: FakeRedmine):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately; without this every response waits on delayed ACKs
+        disable_nagle_algorithm = True
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None) -> int:
+            body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+            etag = f'"{hashlib.md5(body).hexdigest()}"' if body else None
+            if status == 200 and self.command == "GET" and etag and self.headers.get("If-None-Match") == etag:
+                status, body = 304, b""
+            self.send_response(status)
+            if etag:
+                self.send_header("ETag", etag)
+            if body:
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            return len(body)
+
+        def _handle(self, method: str) -> None:
+            url = urlsplit(self.path)
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            if url.path.startswith("/_bench/"):
+                if url.path == "/_bench/reset":
+                    app.reset()
+                with app._lock:
+                    stats = json.loads(json.dumps(app.stats))
+                self._send(200, stats)
+                return
+
+            app.delay()
+            if not self.headers.get(API_KEY_HEADER):
+                app.count(method, url.path, self._send(401, {"errors": ["Missing API key"]}))
+                return
+            if app.inject_error():
+                size = self._send(app.error_status, {"errors": ["Injected failure"]}, {"Retry-After": "0"})
+                app.count(method, url.path, size, injected=True)
+                return
+
+            if method == "GET":
+                status, payload = app.get(url.path, dict(parse_qsl(url.query)))
+            else:
+                try:
+                    status, payload = app.write(method, url.path, json.loads(body or b"{}"))
+                except ValueError:
+                    status, payload = 400, {"errors": ["Invalid JSON"]}
+            app.count(method, url.path, self._send(status, payload))
+
+        def do_GET(self):
+            self._handle("GET")
+
+        def do_POST(self):
+            self._handle("POST")
+
+        def do_PUT(self):
+            self._handle("PUT")
+
+    return Handler
+
+
+def serve(app: FakeRedmine, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    """Start serving in a daemon thread and return the server (see server_address)"""
+    server = ThreadingHTTPServer((host, port), make_handler(app))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-redmine", daemon=True).start()
+    return server
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Synthetic Redmine API for benchmarks")
+    parser.add_argument("--issues", type=int, default=1000)
+    parser.add_argument("--projects", type=int, default=50)
+    parser.add_argument("--users", type=int, default=25)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random latency, up to this many seconds")
+    parser.add_argument("--max-limit", type=int, default=100, help="largest page returned, like Redmine's limit cap")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests failed on purpose")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    app = FakeRedmine(
+        Dataset(args.issues, args.projects, args.users, args.seed),
+        latency=args.latency, jitter=args.jitter, max_limit=args.max_limit,
+        error_rate=args.error_rate, error_status=args.error_status, seed=args.seed,
+    )
+    server = serve(app, args.host, args.port)
+    # The runner reads this line to learn the port
+    print(f"listening http://{args.host}:{server.server_address[1]}", flush=True)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
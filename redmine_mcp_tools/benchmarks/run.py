@@ -0,0 +1,433 @@
+"""
+Benchmark suite for RedmineIssueTool and RedmineDashboardTool.
+
+For every dataset size a fake Redmine (fake_redmine.py) is started in a
+separate process, then every issue-tool action and the main dashboard
+variants are run through `execute()` exactly as the assistant calls them.
+Each scenario records wall time (first call and median of the repeats),
+upstream requests counted by the server, peak traced memory from one
+extra tracemalloc run, and output bytes. The soak mode drives a mix of
+calls from concurrent sessions and reports latency percentiles.
+
+Results are JSON, so runs from two commits can be compared:
+
+    bench --site <site> execute redmine_mcp_tools.benchmarks.run.execute \\
+        --kwargs "{'sizes': [1000, 10000], 'output': '/tmp/bench.json'}"
+
+    python -m redmine_mcp_tools.benchmarks.run --site <site> --sizes 1000,10000,100000 \\
+        --latency 0.02 --output after.json --baseline before.json
+
+The HTTP and report caches are disabled unless `cache` is set, so repeats
+measure the full path; in-process indexes (project catalog, subject index)
+warm up after the first call as they do in a worker.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from statistics import median
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from urllib.request import Request, urlopen
+
+import frappe
+
+from redmine_mcp_tools.benchmarks.fake_redmine import BENCH_PROJECT
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+API_KEY = "benchmark"
+
+# Metrics compared against a baseline, and how much worse counts as a regression
+COMPARED_METRICS = ("wall_median_s", "upstream_requests", "peak_memory_bytes", "output_bytes")
+DEFAULT_TOLERANCE = 0.2
+
+# Mix of calls each soak session cycles through
+SOAK_MIX = (
+    "issue.get_issue", "issue.list_issues", "issue.search_issues", "issue.update_issue",
+    "issue.get_issue_by_subject", "dashboard.compact", "issue.get_issue_statuses",
+)
+
+
+def issue_scenarios(size: int, subject: str) -> List[Tuple[str, Dict[str, Any]]]:
+    """One call per issue-tool action (plus subject resolution) against the benchmark project.
+
+    `subject` is the middle issue's full subject (see scenario_subject): writes
+    only resolve a subject that matches exactly.
+    """
+    issue_id = max(1, size // 2)
+    return [
+        ("list_projects", {"action": "list_projects"}),
+        ("search_projects", {"action": "search_projects", "query": "project 01"}),
+        ("list_issues", {"action": "list_issues", "project_id": BENCH_PROJECT, "limit": 100}),
+        ("list_issues_filtered", {"action": "list_issues", "project_id": BENCH_PROJECT, "limit": 100,
+                                  "filter": "status=all, priority=high, updated_last_days=30"}),
+        ("get_issue", {"action": "get_issue", "issue_id": issue_id}),
+        ("get_issue_by_subject", {"action": "get_issue", "issue_subject": subject, "project_id": BENCH_PROJECT}),
+        ("search_issues", {"action": "search_issues", "query": "login", "project_id": BENCH_PROJECT, "limit": 25}),
+        ("search_issues_ranked", {"action": "search_issues", "query": "invoice export", "mode": "ranked",
+                                  "project_id": BENCH_PROJECT, "limit": 25}),
+        ("create_issue", {"action": "create_issue", "project_name": "Benchmark", "subject": "Benchmark issue",
+                          "description": "Created by the benchmark suite"}),
+        ("update_issue", {"action": "update_issue", "issue_id": issue_id, "updates": {"done_ratio": 50}}),
+        ("add_note_to_issue", {"action": "add_note_to_issue", "issue_id": issue_id, "note": "Benchmark note"}),
+        ("change_issue_status", {"action": "change_issue_status", "issue_subject": subject,
+                                 "project_id": BENCH_PROJECT, "status_id": 2}),
+        ("assign_issue", {"action": "assign_issue", "issue_id": issue_id, "assigned_to_id": 101}),
+        ("get_issue_categories", {"action": "get_issue_categories", "project_id": BENCH_PROJECT}),
+        ("get_issue_priorities", {"action": "get_issue_priorities"}),
+        ("get_issue_statuses", {"action": "get_issue_statuses"}),
+        ("issue_lifecycle", {"action": "issue_lifecycle", "project_id": BENCH_PROJECT}),
+        ("time_report", {"action": "time_report", "project_id": BENCH_PROJECT}),
+        ("batch", {"action": "batch", "operations": [
+            {"action": "add_note_to_issue", "issue_id": issue_id - i, "note": "Batch note"} for i in range(20)
+        ]}),
+    ]
+
+
+def scenario_subject(issue_tool: Any, size: int) -> str:
+    """Subject of the issue the subject-resolution scenarios target"""
+    result = issue_tool.execute({"action": "get_issue", "issue_id": max(1, size // 2)})
+    if not result.get("success"):
+        raise RuntimeError(f"Could not read the scenario issue: {result.get('error')}")
+    return result["result"]["issue"]["subject"]
+
+
+def dashboard_scenarios(size: int) -> List[Tuple[str, Dict[str, Any]]]:
+    return [
+        ("standard", {"project_name": "Benchmark"}),
+        ("compact", {"project_name": "Benchmark", "render": "compact"}),
+        ("summary", {"project_name": "Benchmark", "mode": "summary"}),
+        ("filtered", {"project_name": "Benchmark", "filter": {"priority": ["High", "Urgent"]}}),
+        ("file", {"project_name": "Benchmark", "output": "file"}),
+        ("time_report", {"project_name": "Benchmark", "time_report": True}),
+    ]
+
+
+class FakeServer:
+    """fake_redmine.py running in a child process"""
+
+    def __init__(self, issues: int, latency: float = 0.0, jitter: float = 0.0, max_limit: int = 100,
+                 error_rate: float = 0.0, seed: int = 42):
+        self.args = [
+            "--issues", str(issues), "--latency", str(latency), "--jitter", str(jitter),
+            "--max-limit", str(max_limit), "--error-rate", str(error_rate), "--seed", str(seed),
+        ]
+        self.process = None
+        self.url = None
+
+    def __enter__(self) -> "FakeServer":
+        app_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [app_root, os.getenv("PYTHONPATH")]))}
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "redmine_mcp_tools.benchmarks.fake_redmine", *self.args],
+            stdout=subprocess.PIPE, env=env, text=True,
+        )
+        line = self.process.stdout.readline()
+        if not line.startswith("listening "):
+            self.process.kill()
+            raise RuntimeError(f"Fake Redmine failed to start: {line!r}")
+        self.url = line.split(" ", 1)[1].strip()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.process.terminate()
+        self.process.wait(timeout=10)
+
+    def _control(self, path: str, method: str = "GET") -> Dict[str, Any]:
+        with urlopen(Request(f"{self.url}{path}", method=method), timeout=10) as resp:
+            return json.loads(resp.read())
+
+    def stats(self) -> Dict[str, Any]:
+        return self._control("/_bench/stats")
+
+    def reset(self) -> None:
+        self._control("/_bench/reset", "POST")
+
+
+@contextlib.contextmanager
+def _environment(values: Dict[str, str]) -> Iterator[None]:
+    saved = {name: os.environ.get(name) for name in values}
+    os.environ.update(values)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def _make_tools(url: str, page_size: int) -> Tuple[Any, Any]:
+    from redmine_mcp_tools.assistant_tools.mcp_custom_tools import RedmineDashboardTool, RedmineIssueTool
+
+    issue_tool, dashboard_tool = RedmineIssueTool(), RedmineDashboardTool()
+    for tool in (issue_tool, dashboard_tool):
+        tool.REDMINE_API_URL = url
+        tool.REDMINE_API_KEY = API_KEY
+        tool.default_config.update(api_url=url, api_key=API_KEY)
+    dashboard_tool.default_config["page_size"] = page_size
+    return issue_tool, dashboard_tool
+
+
+def _output_bytes(result: Any) -> int:
+    payload = result.get("result") if isinstance(result, dict) else result
+    if isinstance(payload, str):
+        return len(payload.encode("utf-8"))
+    return len(json.dumps(payload, default=str).encode("utf-8"))
+
+
+def _succeeded(result: Any) -> bool:
+    return isinstance(result, dict) and bool(result.get("success"))
+
+
+def measure(server: FakeServer, call: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """Time `call` `repeat` times, then once more under tracemalloc for peak memory"""
+    times, requests, failures = [], [], 0
+    result = None
+    for _ in range(max(1, repeat)):
+        before = server.stats()["requests"]
+        started = time.perf_counter()
+        result = call()
+        times.append(time.perf_counter() - started)
+        requests.append(server.stats()["requests"] - before)
+        failures += not _succeeded(result)
+
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    try:
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+    record = {
+        "wall_first_s": round(times[0], 4),
+        "wall_median_s": round(median(times), 4),
+        "wall_min_s": round(min(times), 4),
+        "upstream_requests_first": requests[0],
+        "upstream_requests": int(median(requests)),
+        "peak_memory_bytes": peak,
+        "output_bytes": _output_bytes(result),
+        "runs": len(times),
+        "failures": failures,
+    }
+    if failures and isinstance(result, dict) and result.get("error"):
+        record["error"] = str(result["error"])[:200]
+    return record
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered) + 0.5)) - 1))]
+
+
+def _latency_summary(values: List[float]) -> Dict[str, Any]:
+    return {
+        "count": len(values),
+        "p50_s": round(percentile(values, 50), 4),
+        "p90_s": round(percentile(values, 90), 4),
+        "p99_s": round(percentile(values, 99), 4),
+        "max_s": round(max(values), 4) if values else 0.0,
+    }
+
+
+def soak(url: str, size: int, subject: str, sessions: int, duration: float, page_size: int) -> Dict[str, Any]:
+    """Run SOAK_MIX from `sessions` concurrent sessions for `duration` seconds"""
+    from redmine_mcp_tools.assistant_tools.async_client import bind_context
+
+    calls = {f"issue.{name}": args for name, args in issue_scenarios(size, subject)}
+    calls.update({f"dashboard.{name}": args for name, args in dashboard_scenarios(size)})
+    latencies: Dict[str, List[float]] = {name: [] for name in SOAK_MIX}
+    errors = {"count": 0}
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def session(index: int) -> None:
+        issue_tool, dashboard_tool = _make_tools(url, page_size)
+        step = index
+        while time.monotonic() < deadline:
+            name = SOAK_MIX[step % len(SOAK_MIX)]
+            step += 1
+            tool = issue_tool if name.startswith("issue.") else dashboard_tool
+            started = time.perf_counter()
+            try:
+                ok = _succeeded(tool.execute(dict(calls[name])))
+            except Exception:
+                ok = False
+            elapsed = time.perf_counter() - started
+            with lock:
+                latencies[name].append(elapsed)
+                errors["count"] += not ok
+
+    # bind_context keeps frappe.local (site, db) visible inside each session thread
+    threads = [threading.Thread(target=bind_context(session), args=(i,)) for i in range(sessions)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    every = [value for values in latencies.values() for value in values]
+    return {
+        "sessions": sessions,
+        "duration_s": round(elapsed, 2),
+        "calls": len(every),
+        "errors": errors["count"],
+        "throughput_per_s": round(len(every) / elapsed, 2) if elapsed else 0.0,
+        "latency": _latency_summary(every),
+        "by_call": {name: _latency_summary(values) for name, values in latencies.items()},
+    }
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run(sizes: Sequence[int] = DEFAULT_SIZES, repeat: int = 3, latency: float = 0.0, jitter: float = 0.0,
+        page_size: int = 100, max_limit: int = 100, error_rate: float = 0.0, cache: bool = False,
+        only: Optional[Sequence[str]] = None, soak_sessions: int = 0, soak_duration: float = 30.0,
+        seed: int = 42) -> Dict[str, Any]:
+    """Run the suite and return the results document.
+
+    `only` restricts scenarios by name ("get_issue", "dashboard.compact", ...);
+    `soak_sessions` > 0 adds a concurrent soak run at the largest size.
+    """
+    config = {
+        "sizes": list(sizes), "repeat": repeat, "latency": latency, "jitter": jitter, "page_size": page_size,
+        "max_limit": max_limit, "error_rate": error_rate, "cache": cache, "seed": seed,
+    }
+    document = {
+        "meta": {
+            "revision": _git_revision(),
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "config": config,
+        "results": [],
+    }
+    env = {} if cache else {"REDMINE_HTTP_CACHE": "0", "REDMINE_REPORT_CACHE": "0"}
+
+    with _environment(env):
+        for size in sizes:
+            with FakeServer(size, latency, jitter, max_limit, error_rate, seed) as server:
+                issue_tool, dashboard_tool = _make_tools(server.url, page_size)
+                subject = scenario_subject(issue_tool, size)
+                scenarios = [("issue", name, issue_tool, args) for name, args in issue_scenarios(size, subject)]
+                scenarios += [("dashboard", name, dashboard_tool, args) for name, args in dashboard_scenarios(size)]
+                for tool_name, name, tool, args in scenarios:
+                    if only and name not in only and f"{tool_name}.{name}" not in only:
+                        continue
+                    record = measure(server, lambda: tool.execute(dict(args)), repeat)
+                    document["results"].append({"tool": tool_name, "scenario": name, "size": size, **record})
+
+                if soak_sessions and size == max(sizes):
+                    server.reset()
+                    document["soak"] = {
+                        "size": size,
+                        **soak(server.url, size, subject, soak_sessions, soak_duration, page_size),
+                        "upstream": server.stats(),
+                    }
+    return document
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any],
+            tolerance: float = DEFAULT_TOLERANCE) -> List[Dict[str, Any]]:
+    """Metrics that got worse than the baseline by more than `tolerance` (0.2 = 20%)"""
+    key = lambda r: (r["tool"], r["scenario"], r["size"])
+    previous = {key(r): r for r in baseline.get("results", [])}
+    regressions = []
+    for record in current.get("results", []):
+        before = previous.get(key(record))
+        if not before:
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = before.get(metric), record.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            if change > tolerance:
+                regressions.append({
+                    "tool": record["tool"], "scenario": record["scenario"], "size": record["size"],
+                    "metric": metric, "baseline": old, "current": new, "change": round(change, 3),
+                })
+    return regressions
+
+
+def execute(output: Optional[str] = None, baseline: Optional[str] = None,
+            tolerance: float = DEFAULT_TOLERANCE, **kwargs) -> Dict[str, Any]:
+    """Entry point for `bench execute`: run, optionally compare and write the JSON document"""
+    document = run(**kwargs)
+    if baseline:
+        with open(baseline, encoding="utf-8") as fh:
+            document["regressions"] = compare(json.load(fh), document, tolerance)
+    if output:
+        with open(output, "w", encoding="utf-8") as fh:
+            json.dump(document, fh, indent=1)
+    return document
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the Redmine tools against a fake Redmine")
+    parser.add_argument("--site", help="Frappe site to connect to (needed for Error Log, Redis and files)")
+    parser.add_argument("--sites-path", default=".")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--max-limit", type=int, default=100)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--cache", action="store_true", help="keep the HTTP and report caches enabled")
+    parser.add_argument("--only", help="comma-separated scenario names, e.g. get_issue,dashboard.compact")
+    parser.add_argument("--soak-sessions", type=int, default=0)
+    parser.add_argument("--soak-duration", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="write the JSON document here instead of stdout")
+    parser.add_argument("--baseline", help="earlier JSON document to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    if args.site:
+        frappe.init(site=args.site, sites_path=args.sites_path)
+        frappe.connect()
+    try:
+        document = execute(
+            output=args.output, baseline=args.baseline, tolerance=args.tolerance,
+            sizes=[int(size) for size in args.sizes.split(",") if size.strip()],
+            repeat=args.repeat, latency=args.latency, jitter=args.jitter, page_size=args.page_size,
+            max_limit=args.max_limit, error_rate=args.error_rate, cache=args.cache,
+            only=[name.strip() for name in args.only.split(",")] if args.only else None,
+            soak_sessions=args.soak_sessions, soak_duration=args.soak_duration, seed=args.seed,
+        )
+    finally:
+        if args.site:
+            frappe.destroy()
+    if not args.output:
+        print(json.dumps(document, indent=1))
+    return 1 if document.get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,3 +13,8 @@ assistant_tools = [
 	"redmine_mcp_tools.assistant_tools.mcp_custom_tools.RedmineIssueTool",
 	"redmine_mcp_tools.assistant_tools.mcp_custom_tools.RedmineDashboardTool",
 ]
+
+# Optional per-worker warm-up of the Redmine connection pool and reference
+# data (enabled with REDMINE_PREWARM=1; a no-op after the first call)
+before_request = ["redmine_mcp_tools.assistant_tools.prewarm.prewarm_once"]
+before_job = ["redmine_mcp_tools.assistant_tools.prewarm.prewarm_once"]
@@ -0,0 +1,44 @@
+import asyncio
+from unittest import mock
+
+from redmine_mcp_tools.assistant_tools.async_client import AsyncRedmineClient
+from redmine_mcp_tools.tests.utils import FakeRedmineTestCase
+
+
+class TestExecutePaths(FakeRedmineTestCase):
+    def test_sync_execute_does_not_start_an_event_loop(self):
+        with mock.patch("asyncio.events.new_event_loop", side_effect=AssertionError("event loop created")):
+            result = self.issue_tool.execute({"action": "get_issue", "issue_id": 12})
+        self.assertTrue(result["success"], result)
+        self.assertEqual(result["result"]["issue"]["id"], 12)
+
+    def test_sync_execute_inside_a_running_loop(self):
+        async def call():
+            return self.issue_tool.execute({"action": "get_issue", "issue_id": 13})
+
+        self.assertEqual(asyncio.run(call())["result"]["issue"]["id"], 13)
+
+    def test_execute_async_runs_calls_concurrently(self):
+        async def calls():
+            return await asyncio.gather(*(
+                self.issue_tool.execute_async({"action": "get_issue", "issue_id": issue_id})
+                for issue_id in range(1, 11)
+            ))
+
+        results = asyncio.run(calls())
+        self.assertEqual([r["result"]["issue"]["id"] for r in results], list(range(1, 11)))
+        self.assertEqual(self.requests("GET /issues/:id.json"), 10)
+
+    def test_execute_async_validates_and_projects_like_execute(self):
+        arguments = {"action": "get_issue", "issue_id": 14, "fields": ["id", "subject"]}
+        self.assertEqual(asyncio.run(self.issue_tool.execute_async(dict(arguments))),
+                         self.issue_tool.execute(dict(arguments)))
+        self.assertFalse(asyncio.run(self.issue_tool.execute_async({"action": "nope"}))["success"])
+
+    def test_client_gather(self):
+        client = AsyncRedmineClient(self.issue_tool)
+        statuses, issue = asyncio.run(client.gather(
+            {"action": "get_issue_statuses"}, {"action": "get_issue", "issue_id": 15}
+        ))
+        self.assertTrue(statuses["result"]["issue_statuses"])
+        self.assertEqual(issue["result"]["issue"]["id"], 15)
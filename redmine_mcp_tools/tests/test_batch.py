@@ -0,0 +1,34 @@
+from redmine_mcp_tools.tests.utils import FakeRedmineTestCase
+
+
+class TestBatchValidation(FakeRedmineTestCase):
+    def batch(self, operations):
+        return self.issue_tool.execute({"action": "batch", "operations": operations})
+
+    def test_non_object_operations_fail_per_index(self):
+        result = self.batch(["bad", {"action": "add_note_to_issue", "issue_id": 9, "note": "ok"}, None, 3])
+        self.assertFalse(result["success"])
+        operations = result["result"]["operations"]
+        self.assertEqual([op["index"] for op in operations], [0, 1, 2, 3])
+        self.assertEqual([op["success"] for op in operations], [False, True, False, False])
+        self.assertIn("must be an object", operations[0]["error"])
+        self.assertEqual(self.dataset.journals[9][-1]["notes"], "ok")
+
+    def test_only_bad_operations(self):
+        result = self.batch(["bad"])
+        self.assertFalse(result["success"])
+        self.assertEqual(result["result"]["failed"], 1)
+
+    def test_odd_subject_values_do_not_break_the_batch(self):
+        result = self.batch([
+            {"action": "add_note_to_issue", "issue_subject": ["not", "a", "string"], "note": "n"},
+            {"action": "add_note_to_issue", "issue_subject": "x", "project_id": ["p"], "note": "n"},
+            {"action": ["update_issue"], "issue_id": 9},
+        ])
+        self.assertEqual(result["result"]["total"], 3)
+        self.assertFalse(any(op["success"] for op in result["result"]["operations"]))
+
+    def test_operations_must_be_a_list(self):
+        result = self.batch({"action": "add_note_to_issue"})
+        self.assertFalse(result["success"])
+        self.assertIn("must be a list", result["error"])
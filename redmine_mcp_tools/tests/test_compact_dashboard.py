@@ -0,0 +1,42 @@
+import os
+
+from redmine_mcp_tools.tests.utils import FakeRedmineTestCase
+
+SAMPLE = os.path.join(
+    os.path.dirname(__file__), "..", "..", "docs", "output_sample", "redmine_dashboard.html"
+)
+
+# The request's goal: compact output at least this many times smaller than standard
+MIN_REDUCTION = 5
+
+
+class CompactOutputTestCase(FakeRedmineTestCase):
+    def render(self, **arguments):
+        result = self.dashboard_tool.execute({"project_name": "Benchmark", **arguments})
+        self.assertTrue(result["success"], result)
+        return result["result"].encode("utf-8")
+
+
+class TestCompactSizeAgainstSample(CompactOutputTestCase):
+    # docs/output_sample/redmine_dashboard.html reports 153 issues
+    issues = 153
+
+    def test_compact_fits_the_sample_budget(self):
+        budget = os.path.getsize(SAMPLE)
+        compact = self.render(render="compact")
+        self.assertLessEqual(len(compact), budget)
+
+
+class TestCompactReduction(CompactOutputTestCase):
+    issues = 1000
+
+    def test_compact_is_much_smaller_than_standard(self):
+        standard = self.render()
+        compact = self.render(render="compact")
+        self.assertLessEqual(len(compact) * MIN_REDUCTION, len(standard))
+
+    def test_compact_carries_every_open_issue(self):
+        compact = self.render(render="compact").decode("utf-8")
+        open_ids = [i["id"] for i in self.dataset.issues if i["status"]["id"] not in self.dataset.closed_ids]
+        for issue_id in open_ids[:50]:
+            self.assertIn(f"[{issue_id},", compact)
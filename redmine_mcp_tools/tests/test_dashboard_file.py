@@ -0,0 +1,50 @@
+import os
+import re
+from unittest import mock
+
+from redmine_mcp_tools.tests.utils import FakeRedmineTestCase
+
+
+class TestDashboardFile(FakeRedmineTestCase):
+    def render_file(self):
+        result = self.dashboard_tool.execute({"project_name": "Benchmark", "output": "file"})
+        self.assertTrue(result["success"], result)
+        path = result["result"]["file_path"]
+        self.addCleanup(os.unlink, path)
+        with open(path, encoding="utf-8") as fh:
+            return result["result"], fh.read()
+
+    def open_ids(self):
+        closed = set(self.dataset.closed_ids)
+        return sorted(i["id"] for i in self.dataset.issues if i["status"]["id"] not in closed)
+
+    def assert_one_section_per_user(self, html):
+        canvases = re.findall(r'<canvas id="([^"]+)"', html)
+        self.assertEqual(len(canvases), len(set(canvases)))
+
+    def test_file_matches_the_inline_dashboard(self):
+        inline = self.dashboard_tool.execute({"project_name": "Benchmark"})["result"]
+        stats, html = self.render_file()
+        self.assertEqual(html, inline)
+        self.assertEqual(stats["issues"], len(self.open_ids()))
+
+    def test_listing_that_shifts_mid_scan(self):
+        fetch_page = self.dashboard_tool._fetch_issue_page
+        calls = []
+
+        def fetch(project_id, offset, *args, **kwargs):
+            calls.append(offset)
+            if len(calls) == 2:
+                # Reassign an issue already read and add one in front of the listing
+                read = next(i for i in self.dataset.issues if i["status"]["id"] not in self.dataset.closed_ids)
+                other = next(u for u in self.dataset.users if u["id"] != (read.get("assigned_to") or {}).get("id"))
+                self.dataset.update(read, {"assigned_to_id": other["id"]})
+                self.dataset.create({"project_id": self.project, "subject": "Created mid-scan"})
+            return fetch_page(project_id, offset, *args, **kwargs)
+
+        with mock.patch.object(self.dashboard_tool, "_fetch_issue_page", side_effect=fetch):
+            stats, html = self.render_file()
+        self.assertEqual(stats["issues"], len(self.open_ids()))
+        self.assertIn("Created mid-scan", html)
+        self.assert_one_section_per_user(html)
+        self.assertEqual(stats["sections"], len(set(re.findall(r'<canvas id="([^"]+)"', html))) // 2)
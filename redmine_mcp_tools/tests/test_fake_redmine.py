@@ -0,0 +1,63 @@
+import json
+import unittest
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from redmine_mcp_tools.benchmarks.fake_redmine import API_KEY_HEADER, BENCH_PROJECT
+from redmine_mcp_tools.benchmarks.run import compare
+from redmine_mcp_tools.tests.utils import API_KEY, FakeRedmineTestCase
+
+
+class TestFakeRedmine(FakeRedmineTestCase):
+    def get(self, path):
+        request = Request(f"{self.url}{path}", headers={API_KEY_HEADER: API_KEY})
+        with urlopen(request, timeout=10) as response:
+            return json.loads(response.read())
+
+    def test_pages_cover_every_issue_once(self):
+        seen = []
+        for offset in range(0, self.issues, 100):
+            page = self.get(f"/issues.json?project_id={BENCH_PROJECT}&status_id=*&limit=100&offset={offset}")
+            self.assertEqual(page["total_count"], self.issues)
+            seen += [issue["id"] for issue in page["issues"]]
+        self.assertEqual(sorted(seen), list(range(1, self.issues + 1)))
+
+    def test_limit_is_capped(self):
+        page = self.get("/issues.json?status_id=*&limit=1000")
+        self.assertEqual(len(page["issues"]), self.max_limit)
+
+    def test_filters_and_sort(self):
+        page = self.get("/issues.json?status_id=closed&sort=updated_on:asc&limit=100")
+        closed = {6, 7}
+        self.assertTrue(all(issue["status"]["id"] in closed for issue in page["issues"]))
+        stamps = [issue["updated_on"] for issue in page["issues"]]
+        self.assertEqual(stamps, sorted(stamps))
+
+    def test_missing_api_key_is_rejected(self):
+        with self.assertRaises(HTTPError) as raised:
+            urlopen(f"{self.url}/issues.json", timeout=10)
+        self.assertEqual(raised.exception.code, 401)
+
+    def test_writes_move_updated_on_forward(self):
+        latest = max(issue["updated_on"] for issue in self.dataset.issues)
+        created = self.issue_tool.execute({
+            "action": "create_issue", "project_name": "Benchmark", "subject": "Fake server write"
+        })
+        self.assertTrue(created["success"])
+        issue = created["result"]["issue"]
+        self.assertGreater(issue["updated_on"], latest)
+
+        noted = self.issue_tool.execute({"action": "add_note_to_issue", "issue_id": issue["id"], "note": "n"})
+        self.assertTrue(noted["success"])
+        self.assertGreater(self.dataset.by_id[issue["id"]]["updated_on"], issue["updated_on"])
+        self.assertEqual([j["notes"] for j in self.dataset.journals[issue["id"]]], ["n"])
+
+
+class TestCompare(unittest.TestCase):
+    def test_reports_only_regressions_beyond_tolerance(self):
+        record = {"tool": "issue", "scenario": "get_issue", "size": 1000}
+        baseline = {"results": [{**record, "wall_median_s": 1.0, "upstream_requests": 10}]}
+        current = {"results": [{**record, "wall_median_s": 1.1, "upstream_requests": 20}]}
+        regressions = compare(baseline, current, tolerance=0.2)
+        self.assertEqual([r["metric"] for r in regressions], ["upstream_requests"])
+        self.assertEqual(regressions[0]["change"], 1.0)
@@ -0,0 +1,67 @@
+import threading
+from unittest import mock
+
+from redmine_mcp_tools.tests.utils import API_KEY, FakeRedmineTestCase
+
+HEADERS = {"X-Redmine-API-Key": API_KEY}
+QUERY = "status_id=*"
+
+
+class TestFetchAllIssues(FakeRedmineTestCase):
+    issues = 550
+
+    def setUp(self):
+        super().setUp()
+        self.timeout = self.dashboard_tool.default_config["timeout"]
+
+    def fetch_all(self, concurrency=4):
+        return self.dashboard_tool._fetch_all_issues(1, HEADERS, self.timeout, concurrency, QUERY)
+
+    def fetch_all_changing(self, change):
+        """Fetch everything while `change` runs once, just before the first parallel page is read"""
+        fetch_page = self.dashboard_tool._fetch_issue_page
+        once = threading.Lock()
+
+        def page(project_id, offset, *args, **kwargs):
+            if offset and once.acquire(blocking=False):
+                with self.redmine._lock:
+                    change()
+            return fetch_page(project_id, offset, *args, **kwargs)
+
+        before = {issue["id"] for issue in self.dataset.issues}
+        with mock.patch.object(self.dashboard_tool, "_fetch_issue_page", page):
+            issues = self.fetch_all()
+        self.assertTrue(once.locked())
+        return before, [issue["id"] for issue in issues]
+
+    def assert_complete(self, before, ids):
+        after = {issue["id"] for issue in self.dataset.issues}
+        self.assertEqual(len(ids), len(set(ids)), "duplicate issues")
+        # Nothing that existed for the whole scan may be lost
+        self.assertLessEqual(before & after, set(ids))
+        self.assertLessEqual(set(ids), before | after)
+
+    def test_every_page_is_fetched_once_in_parallel(self):
+        ids = [issue["id"] for issue in self.fetch_all()]
+        self.assertEqual(ids, [issue["id"] for issue in self.dataset.issues])
+        self.assertEqual(self.requests("GET /issues.json"), 6)
+
+    def test_issues_created_mid_scan_cause_no_duplicates(self):
+        def create():
+            for n in range(7):
+                self.dataset.create({"project_id": 1, "subject": f"Created mid-scan {n}"})
+
+        before, ids = self.fetch_all_changing(create)
+        self.assert_complete(before, ids)
+        self.assertEqual(len(ids), len(before) + 7)
+
+    def test_issues_deleted_mid_scan_cause_no_losses(self):
+        def delete():
+            # Issues on the page already read; everything behind them moves up a page boundary
+            for issue in self.dataset.issues[10:15]:
+                del self.dataset.by_id[issue["id"]]
+            del self.dataset.issues[10:15]
+            self.dataset.version += 1
+
+        before, ids = self.fetch_all_changing(delete)
+        self.assert_complete(before, ids)
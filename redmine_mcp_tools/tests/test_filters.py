@@ -0,0 +1,65 @@
+import unittest
+from urllib.parse import parse_qs, urlsplit
+
+from redmine_mcp_tools.assistant_tools.filters import compile_filter, make_lookup
+from redmine_mcp_tools.tests.utils import FakeRedmineTestCase
+
+
+class Memberships:
+    """fetch() serving `count` project members in pages of at most 100"""
+
+    def __init__(self, count):
+        self.members = [{"user": {"id": i, "name": f"User {i}"}} for i in range(1, count + 1)]
+        self.endpoints = []
+
+    def __call__(self, endpoint):
+        self.endpoints.append(endpoint)
+        query = parse_qs(urlsplit(endpoint).query)
+        offset, limit = int(query["offset"][0]), min(int(query["limit"][0]), 100)
+        return {"memberships": self.members[offset:offset + limit], "total_count": len(self.members)}
+
+
+class TestAssigneeLookup(unittest.TestCase):
+    def test_members_beyond_the_first_page_resolve(self):
+        fetch = Memberships(250)
+        lookup = make_lookup(fetch, project_id=3)
+        self.assertEqual(lookup("assignee", "user 1"), 1)
+        self.assertEqual(lookup("assignee", "User 250"), 250)
+        self.assertEqual(len(fetch.endpoints), 3)
+        # Memoized for the rest of the call
+        self.assertEqual(lookup("assignee", "User 180"), 180)
+        self.assertEqual(len(fetch.endpoints), 3)
+
+    def test_single_page(self):
+        fetch = Memberships(5)
+        self.assertIsNone(make_lookup(fetch, project_id=3)("assignee", "Nobody"))
+        self.assertEqual(len(fetch.endpoints), 1)
+
+
+class TestCustomFieldFilter(unittest.TestCase):
+    def test_object_form(self):
+        self.assertEqual(compile_filter({"custom_fields": {"5": "A", 7: ["x", "y"]}}),
+                         [("cf_5", "A"), ("cf_7", "x|y")])
+
+    def test_string_value_is_a_clear_error(self):
+        for value in ("team=A", ["5", "A"]):
+            with self.assertRaisesRegex(ValueError, "custom_fields must be an object"):
+                compile_filter({"custom_fields": value})
+        with self.assertRaisesRegex(ValueError, "custom_fields must be an object"):
+            compile_filter("custom_fields=5")
+
+    def test_non_numeric_field_id(self):
+        with self.assertRaisesRegex(ValueError, "Custom field ids must be numeric: team"):
+            compile_filter({"custom_fields": {"team": "A"}})
+
+
+class TestCustomFieldFilterThroughTheTool(FakeRedmineTestCase):
+    issues = 10
+
+    def test_list_issues_reports_the_error(self):
+        result = self.issue_tool.execute({
+            "action": "list_issues", "project_id": self.project, "filter": {"custom_fields": "team=A"}
+        })
+        self.assertFalse(result["success"])
+        self.assertIn("custom_fields must be an object", result["error"])
+        self.assertEqual(self.requests("GET /issues.json"), 0)
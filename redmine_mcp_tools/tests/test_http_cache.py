@@ -0,0 +1,123 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from redmine_mcp_tools.assistant_tools import http_cache
+from redmine_mcp_tools.assistant_tools.http_cache import TOUCH_INTERVAL, CacheEntry, HttpCache, freshness_for
+from redmine_mcp_tools.tests.utils import FakeRedmineTestCase, make_tools
+
+
+def temp_cache(test: unittest.TestCase, max_bytes: int = 1024 * 1024) -> HttpCache:
+    directory = tempfile.mkdtemp()
+    test.addCleanup(shutil.rmtree, directory, True)
+    return HttpCache(os.path.join(directory, "http_cache.sqlite3"), max_bytes)
+
+
+class TestCachedReferenceData(FakeRedmineTestCase):
+    env = {"REDMINE_HTTP_CACHE": "1"}
+
+    def setUp(self):
+        super().setUp()
+        self.cache = temp_cache(self)
+        patcher = mock.patch.object(http_cache, "_cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def statuses(self, tool=None):
+        result = (tool or self.issue_tool).execute({"action": "get_issue_statuses"})
+        self.assertTrue(result["success"], result)
+        return result["result"]
+
+    def age_entries(self, seconds):
+        conn = self.cache._connection()
+        conn.execute("UPDATE http_cache SET stored_at = stored_at - ?", (seconds,))
+        conn.commit()
+
+    def test_fresh_entries_are_served_without_a_request(self):
+        first = self.statuses()
+        self.assertEqual(self.statuses(), first)
+        self.assertEqual(self.requests("GET /issue_statuses.json"), 1)
+
+    def test_stale_entries_are_revalidated_with_the_etag(self):
+        first = self.statuses()
+        self.age_entries(3600)
+        self.redmine.reset()
+
+        self.assertEqual(self.statuses(), first)
+        self.assertEqual(self.requests("GET /issue_statuses.json"), 1)
+        # The server answered 304 Not Modified, so no body came back
+        self.assertEqual(self.redmine.stats["bytes"], 0)
+
+    def test_a_304_makes_the_entry_fresh_again(self):
+        self.statuses()
+        self.age_entries(3600)
+        self.statuses()
+        self.redmine.reset()
+        self.statuses()
+        self.assertEqual(self.requests(), 0)
+
+    def test_uncached_endpoints_always_reach_redmine(self):
+        issue_id = self.dataset.issues[0]["id"]
+        for _ in range(2):
+            self.issue_tool.execute({"action": "get_issue", "issue_id": issue_id})
+        self.assertEqual(self.requests("GET /issues/:id.json"), 2)
+
+    def test_entries_are_kept_per_credential(self):
+        self.statuses()
+        other_tool, _ = make_tools(self.url, api_key="other-key")
+        self.statuses(other_tool)
+        self.statuses(other_tool)
+        self.assertEqual(self.requests("GET /issue_statuses.json"), 2)
+
+
+class TestHttpCacheStore(unittest.TestCase):
+    def test_freshness_rules(self):
+        self.assertEqual(freshness_for("/issue_statuses.json"), 3600)
+        self.assertEqual(freshness_for("/projects/erp/issue_categories.json"), 600)
+        self.assertEqual(freshness_for("/projects.json?limit=100&offset=0"), 300)
+        self.assertIsNone(freshness_for("/issues.json"))
+        self.assertIsNone(freshness_for("/projects/erp.json"))
+
+    def test_entry_freshness_and_validators(self):
+        entry = CacheEntry(b"{}", '"abc"', "Sat, 17 Oct 2026 10:00:00 GMT", stored_at=0, max_age=60)
+        self.assertFalse(entry.is_fresh)
+        self.assertEqual(entry.conditional_headers(), {
+            "If-None-Match": '"abc"', "If-Modified-Since": "Sat, 17 Oct 2026 10:00:00 GMT",
+        })
+        self.assertEqual(CacheEntry(b"{}", None, None, 0, 60).conditional_headers(), {})
+
+    def test_keys_differ_per_credential(self):
+        url = "http://redmine/issue_statuses.json"
+        self.assertNotEqual(HttpCache.make_key(url, "a"), HttpCache.make_key(url, "b"))
+        self.assertNotIn("secret", HttpCache.make_key(url, "secret"))
+
+    def test_least_recently_used_entries_are_evicted(self):
+        cache = temp_cache(self, max_bytes=250)
+        clock = [1000.0]
+        with mock.patch.object(http_cache.time, "time", lambda: clock[0]):
+            for key in ("a", "b"):
+                cache.put(key, b"x" * 100, None, None)
+                clock[0] += 1
+            clock[0] += TOUCH_INTERVAL
+            self.assertIsNotNone(cache.get("a", 60))
+            cache.put("c", b"x" * 100, None, None)
+
+        self.assertIsNotNone(cache.get("a", 60))
+        self.assertIsNone(cache.get("b", 60))
+        self.assertIsNotNone(cache.get("c", 60))
+
+    def test_oversized_bodies_are_not_stored(self):
+        cache = temp_cache(self, max_bytes=10)
+        cache.put("a", b"x" * 11, None, None)
+        self.assertIsNone(cache.get("a", 60))
+
+    def test_hits_touch_the_entry_at_most_once_per_interval(self):
+        cache = temp_cache(self)
+        cache.put("a", b"{}", None, None)
+        writes = []
+        cache._connection().set_trace_callback(lambda sql: writes.append(sql) if sql.startswith("UPDATE") else None)
+        for _ in range(5):
+            self.assertIsNotNone(cache.get("a", 60))
+        self.assertEqual(writes, [])
@@ -0,0 +1,23 @@
+import unittest
+
+from redmine_mcp_tools.assistant_tools.http_client import _build_retry
+from redmine_mcp_tools.tests.utils import FakeRedmineTestCase
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_only_reads_are_retried_on_status(self):
+        retry = _build_retry()
+        for status in (429, 502, 503, 504):
+            self.assertTrue(retry.is_retry("GET", status))
+            self.assertFalse(retry.is_retry("PUT", status))
+            self.assertFalse(retry.is_retry("POST", status))
+        self.assertFalse(retry.is_retry("GET", 500))
+
+
+class TestWritesAreNotReplayed(FakeRedmineTestCase):
+    error_rate = 1.0
+
+    def test_failed_note_is_sent_once(self):
+        result = self.issue_tool.execute({"action": "add_note_to_issue", "issue_id": 5, "note": "once"})
+        self.assertFalse(result["success"])
+        self.assertEqual(self.requests("PUT /issues/:id.json"), 1)
@@ -0,0 +1,52 @@
+from datetime import date, timedelta
+
+from redmine_mcp_tools.assistant_tools.issue_frame import IssueFrame
+from redmine_mcp_tools.tests.utils import API_KEY, FakeRedmineTestCase
+
+HEADERS = {"X-Redmine-API-Key": API_KEY}
+
+
+class TestColumnarRender(FakeRedmineTestCase):
+    issues = 1000
+
+    def setUp(self):
+        super().setUp()
+        timeout = self.dashboard_tool.default_config["timeout"]
+        # Closed issues too, so every status and colour is exercised
+        self.issues = self.dashboard_tool._fetch_all_issues(1, HEADERS, timeout, None, "status_id=*")
+
+    def row_based(self, issues):
+        """The dashboard sections as rendered before the frame: grouped dicts, one row at a time"""
+        tool = self.dashboard_tool
+        return [tool._generate_user_section(user, user_issues)
+                for user, user_issues in tool._group_issues_by_assignee(issues).items()]
+
+    def columnar(self, issues):
+        return list(self.dashboard_tool._iter_frame_sections(IssueFrame.from_issues(issues)))
+
+    def test_sections_are_byte_identical(self):
+        self.assertGreater(len(self.issues), 500)
+        self.assertEqual(self.columnar(self.issues), self.row_based(self.issues))
+
+    def test_edge_values_render_identically(self):
+        today = date.today()
+        edge = [
+            {"id": 9001, "subject": "Due today", "due_date": today.isoformat(),
+             "status": {"id": 1, "name": "New"}, "priority": {"id": 2, "name": "Normal"}},
+            {"id": 9002, "subject": "Due yesterday", "due_date": (today - timedelta(days=1)).isoformat(),
+             "status": {"id": 2, "name": "In Progress"}, "priority": {"id": 4, "name": "Urgent"},
+             "assigned_to": {"id": 101, "name": "User 01"}},
+            {"id": 9003, "subject": "No priority, status or assignee"},
+            {"id": 9004, "subject": "Unknown names <b>&amp;</b>", "status": {"id": 99, "name": "Parked"},
+             "priority": {"id": 99, "name": "Someday"}, "assigned_to": {"id": 999, "name": "Ex Member"}},
+        ]
+        issues = edge + self.issues[:50]
+        self.assertEqual(self.columnar(issues), self.row_based(issues))
+
+    def test_dashboard_page_matches_the_row_based_page(self):
+        result = self.dashboard_tool.execute({"project_name": "Benchmark"})
+        self.assertTrue(result["success"], result)
+        timeout = self.dashboard_tool.default_config["timeout"]
+        open_issues = self.dashboard_tool._fetch_all_issues(1, HEADERS, timeout, None, "")
+        expected = self.dashboard_tool._generate_html_template("Benchmark", self.row_based(open_issues))
+        self.assertEqual(result["result"].encode("utf-8"), expected.encode("utf-8"))
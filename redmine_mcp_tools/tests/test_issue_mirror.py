@@ -0,0 +1,126 @@
+import os
+import tempfile
+import time
+from unittest import mock
+
+from redmine_mcp_tools.assistant_tools import issue_mirror
+from redmine_mcp_tools.assistant_tools.issue_lifecycle import cache_scope
+from redmine_mcp_tools.tests.utils import API_KEY, FakeRedmineTestCase, make_tools
+
+
+class TestIssueMirror(FakeRedmineTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._dir = tempfile.TemporaryDirectory()
+        cls.env = {"REDMINE_MIRROR": "1", "REDMINE_MIRROR_PATH": os.path.join(cls._dir.name, "mirror.sqlite3")}
+        cls._mirror = mock.patch.object(issue_mirror, "_mirror", None)
+        cls._mirror.start()
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls._mirror.stop()
+        cls._dir.cleanup()
+
+    def list_issues(self, tool=None):
+        result = (tool or self.issue_tool).execute({"action": "list_issues", "project_id": self.project, "limit": 100})
+        self.assertTrue(result["success"], result)
+        return result["result"]
+
+    def wait_loaded(self, api_key=API_KEY):
+        mirror = issue_mirror.get_issue_mirror()
+        deadline = time.monotonic() + 10
+        while not mirror.is_loaded(cache_scope(self.url, api_key), 1):
+            self.assertLess(time.monotonic(), deadline, "mirror load did not finish")
+            time.sleep(0.05)
+
+    def test_first_load_runs_in_background_then_serves_locally(self):
+        first = self.list_issues()
+        self.wait_loaded()
+        self.redmine.reset()
+        second = self.list_issues()
+        self.assertEqual(self.requests("GET /issues.json"), 0)
+        self.assertEqual([i["id"] for i in first["issues"]], [i["id"] for i in second["issues"]])
+        self.assertEqual(first["total_count"], second["total_count"])
+
+    def test_writes_are_visible_on_the_next_read(self):
+        self.list_issues()
+        self.wait_loaded()
+        issue_id = self.list_issues()["issues"][0]["id"]
+        updated = self.issue_tool.execute({
+            "action": "update_issue", "issue_id": issue_id, "updates": {"subject": "Renamed through the tool"}
+        })
+        self.assertTrue(updated["success"], updated)
+        issues = {i["id"]: i for i in self.list_issues()["issues"]}
+        self.assertEqual(issues[issue_id]["subject"], "Renamed through the tool")
+
+    def test_get_issue_reads_redmine(self):
+        self.list_issues()
+        self.wait_loaded()
+        self.redmine.reset()
+        result = self.issue_tool.execute({"action": "get_issue", "issue_id": 3})
+        self.assertEqual(result["result"]["issue"]["id"], 3)
+        self.assertEqual(self.requests("GET /issues/:id.json"), 1)
+
+    def test_rows_are_scoped_by_credential(self):
+        self.list_issues()
+        self.wait_loaded()
+        other_tool, _ = make_tools(self.url, api_key="other-key")
+        mirror = issue_mirror.get_issue_mirror()
+        self.assertFalse(mirror.is_loaded(cache_scope(self.url, "other-key"), 1))
+        self.redmine.reset()
+        self.list_issues(other_tool)
+        self.assertGreater(self.requests("GET /issues.json"), 0)
+        self.wait_loaded("other-key")
+
+
+class TestMirrorConsistency(FakeRedmineTestCase):
+    def setUp(self):
+        super().setUp()
+        self._dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._dir.cleanup)
+        with mock.patch.dict(os.environ, {"REDMINE_FETCH_CONCURRENCY": "1"}):
+            self.mirror = issue_mirror.IssueMirror(os.path.join(self._dir.name, "mirror.sqlite3"))
+        self.scope = cache_scope(self.url, API_KEY)
+
+    def sync(self, fetch=None, force=False):
+        self.mirror.sync(self.scope, 1, fetch or self.issue_tool._fetch_json, set(self.dataset.closed_ids), force)
+
+    def stored(self):
+        return {issue["id"]: issue for issue in self.mirror.issues(self.scope, 1, open_only=False)}
+
+    def test_edits_during_the_first_load_are_synced(self):
+        fetch_json = self.issue_tool._fetch_json
+
+        def fetch(endpoint):
+            if "offset=100" in endpoint:
+                # Issue 250 (on the page already read) changes before issue 50 (on a page still to come)
+                self.dataset.update(self.dataset.by_id[250], {"subject": "Edited during the load"})
+                self.dataset.update(self.dataset.by_id[50], {"subject": "Edited later"})
+            return fetch_json(endpoint)
+
+        self.sync(fetch)
+        self.assertEqual(self.stored()[50]["subject"], "Edited later")
+        self.sync(force=True)
+        self.assertEqual(self.stored()[250]["subject"], "Edited during the load")
+
+    def test_issues_skipped_by_the_load_are_stored(self):
+        fetch_json = self.issue_tool._fetch_json
+
+        def fetch(endpoint):
+            data = fetch_json(endpoint)
+            if "sort=id:desc" in endpoint and "offset=100" in endpoint and not fetch.skipped:
+                # As if a deletion shifted issue 200 onto the page already read
+                fetch.skipped = True
+                data = {**data, "issues": [i for i in data["issues"] if i["id"] != 200]}
+            return data
+
+        fetch.skipped = False
+        self.sync(fetch)
+        self.assertTrue(fetch.skipped)
+        self.assertEqual(sorted(self.stored()), list(range(1, self.issues + 1)))
+        # Counts agree now, so the next reconcile stops at the probe
+        self.redmine.reset()
+        self.mirror._reconcile(self.scope, 1, fetch_json, set())
+        self.assertEqual(self.requests("GET /issues.json"), 1)
@@ -0,0 +1,54 @@
+import unittest
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from redmine_mcp_tools.assistant_tools.issue_scan import scan_updated_since
+
+
+def _stamp(n):
+    return f"2026-01-01T{n // 3600:02d}:{n // 60 % 60:02d}:{n % 60:02d}Z"
+
+
+class ListingFetch:
+    """/issues.json over a list: updated_on>= filter, updated_on/id sort, limit/offset"""
+
+    def __init__(self, issues, on_call=None):
+        self.issues = issues
+        self.on_call = on_call
+        self.calls = 0
+
+    def __call__(self, endpoint):
+        self.calls += 1
+        if self.on_call:
+            self.on_call(self.calls)
+        query = dict(parse_qsl(urlsplit(endpoint).query))
+        since = unquote(query.get("updated_on", ""))[2:]
+        rows = sorted((i for i in self.issues if i["updated_on"] >= since), key=lambda i: (i["updated_on"], i["id"]))
+        offset, limit = int(query["offset"]), int(query["limit"])
+        return {"issues": [dict(i) for i in rows[offset:offset + limit]], "total_count": len(rows)}
+
+
+class TestScanUpdatedSince(unittest.TestCase):
+    def test_issue_edited_mid_scan_does_not_hide_others(self):
+        issues = [{"id": n, "updated_on": _stamp(n)} for n in range(1, 251)]
+
+        def edit(call):
+            # After the first page: an issue from it is edited and jumps to the end
+            if call == 2:
+                issues[10]["updated_on"] = _stamp(1000)
+
+        seen = [i["id"] for page in scan_updated_since(ListingFetch(issues, edit), "status_id=*") for i in page]
+        self.assertEqual(sorted(set(seen)), list(range(1, 251)))
+        # Only the edited issue comes back, once, with its new updated_on
+        self.assertEqual(len(seen), len(set(seen)) + 1)
+        self.assertEqual(seen[-1], 11)
+
+    def test_since_and_shared_timestamps(self):
+        # 250 issues share one timestamp: paging falls back to offsets within it
+        issues = [{"id": n, "updated_on": _stamp(5)} for n in range(1, 251)]
+        issues += [{"id": 300, "updated_on": _stamp(1)}, {"id": 301, "updated_on": _stamp(9)}]
+        fetch = ListingFetch(issues)
+        seen = [i["id"] for page in scan_updated_since(fetch, "status_id=*", since=_stamp(2)) for i in page]
+        self.assertEqual(sorted(seen), list(range(1, 251)) + [301])
+
+    def test_empty(self):
+        self.assertEqual(list(scan_updated_since(ListingFetch([]), "status_id=*")), [])
@@ -0,0 +1,37 @@
+from unittest import mock
+
+from redmine_mcp_tools.tests.utils import FakeRedmineTestCase
+
+
+class TestLifecycleListing(FakeRedmineTestCase):
+    issues = 250
+
+    def lifecycle(self):
+        result = self.issue_tool.execute({"action": "issue_lifecycle", "project_id": self.project, "concurrency": 1})
+        self.assertTrue(result["success"], result)
+        return result["result"]
+
+    def in_project(self):
+        return sum(1 for issue in self.dataset.issues if issue["project"]["id"] == self.dataset.projects[0]["id"])
+
+    def test_every_issue_once(self):
+        result = self.lifecycle()
+        self.assertEqual(result["issues"], self.in_project())
+        self.assertTrue(result["complete"])
+
+    def test_issue_created_mid_listing_is_picked_up(self):
+        fetch_json = self.issue_tool._fetch_json
+        listings = []
+
+        def fetch(endpoint, *args, **kwargs):
+            if endpoint.startswith("/issues.json"):
+                listings.append(endpoint)
+                if len(listings) == 2:
+                    # Newest first: everything behind it moves down a slot
+                    self.dataset.create({"project_id": self.project, "subject": "Created while listing"})
+            return fetch_json(endpoint, *args, **kwargs)
+
+        with mock.patch.object(self.issue_tool, "_fetch_json", side_effect=fetch):
+            result = self.lifecycle()
+        self.assertEqual(result["issues"], self.in_project())
+        self.assertTrue(result["complete"])
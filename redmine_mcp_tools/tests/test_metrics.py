@@ -0,0 +1,83 @@
+import unittest
+from unittest import mock
+
+from redmine_mcp_tools.assistant_tools import metrics
+from redmine_mcp_tools.tests.utils import FakeRedmineTestCase
+
+
+class FakeRedis:
+    """The hash commands metrics.flush() and shared_registry() use"""
+
+    def __init__(self, fail=False):
+        self.hashes = {}
+        self.queued = []
+        self.fail = fail
+
+    def pipeline(self):
+        return self
+
+    def hincrbyfloat(self, key, field, value):
+        self.queued.append((key, field.encode(), value))
+
+    def execute(self):
+        queued, self.queued = self.queued, []
+        if self.fail:
+            raise ConnectionError("redis down")
+        for key, field, value in queued:
+            fields = self.hashes.setdefault(key, {})
+            fields[field] = str(float(fields.get(field, 0)) + value).encode()
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+
+class TestSharedMetrics(unittest.TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = mock.patch("frappe.cache", return_value=self.redis, create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        metrics.registry.clear()
+        self.addCleanup(metrics.registry.clear)
+
+    def record(self):
+        metrics.record_upstream("GET", "/issues.json", 200, 0.2, 1000)
+        metrics.record_render("compact", 0.01, 2048)
+
+    def test_flushes_from_several_processes_add_up(self):
+        # Two workers flushing the same series, one after the other
+        self.record()
+        self.assertTrue(metrics.flush())
+        self.assertEqual(metrics.registry.render(), "\n")
+        self.record()
+        self.assertTrue(metrics.flush())
+
+        text = metrics.shared_registry().render()
+        self.assertIn('redmine_upstream_requests_total{method="GET",endpoint="/issues.json",status="200"} 2', text)
+        self.assertIn('redmine_upstream_response_bytes_total{endpoint="/issues.json"} 2000', text)
+        self.assertIn('redmine_upstream_seconds_bucket{method="GET",endpoint="/issues.json",le="0.25"} 2', text)
+        self.assertIn('redmine_upstream_seconds_bucket{method="GET",endpoint="/issues.json",le="+Inf"} 2', text)
+        self.assertIn('redmine_dashboard_output_bytes_count{render="compact"} 2', text)
+
+    def test_failed_flush_keeps_the_series(self):
+        self.redis.fail = True
+        self.record()
+        self.assertFalse(metrics.flush())
+        self.redis.fail = False
+        self.record()
+        self.assertTrue(metrics.flush())
+        text = metrics.shared_registry().render()
+        self.assertIn('redmine_upstream_requests_total{method="GET",endpoint="/issues.json",status="200"} 2', text)
+
+
+class TestToolCallsFlush(FakeRedmineTestCase):
+    def test_tool_call_reaches_the_shared_totals(self):
+        redis = FakeRedis()
+        metrics.registry.clear()
+        with mock.patch("frappe.cache", return_value=redis, create=True):
+            result = self.issue_tool.execute({"action": "get_issue", "issue_id": 5})
+            self.assertTrue(result["success"], result)
+            text = metrics.shared_registry().render()
+        self.assertIn('redmine_tool_action_seconds_count{tool="redmine_issue_tool",action="get_issue",outcome="success"} 1',
+                      text)
+        self.assertIn('redmine_upstream_requests_total{method="GET",endpoint="/issues/:id.json",status="200"} 1', text)
@@ -0,0 +1,57 @@
+import re
+from unittest import mock
+
+from redmine_mcp_tools.tests.utils import FakeRedmineTestCase
+
+
+class TestPortfolio(FakeRedmineTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.dict(self.dataset.members, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def portfolio(self, **arguments):
+        result = self.dashboard_tool.execute({"projects": ["Benchmark", "Project 002"], **arguments})
+        self.assertTrue(result["success"], result)
+        return result["result"]
+
+    def open_issues(self, assignee=None):
+        return [i for i in self.dataset.issues if i["project"]["id"] == 1
+                and i["status"]["id"] not in self.dataset.closed_ids
+                and (assignee is None or (i.get("assigned_to") or {}).get("name") == assignee)]
+
+    def test_overview_and_project_sections(self):
+        html = self.portfolio()
+        self.assertIn("Portfolio (2 projects)", html)
+        self.assertIn(f"Benchmark ({len(self.open_issues())} issues)", html)
+        self.assertIn("Project 002 (0 issues)", html)
+        self.assertIn("Assignees Across Projects", html)
+        self.assertNotIn("Failed", html)
+
+    def test_assignee_names_resolve_per_project(self):
+        user = self.dataset.users[3]
+        others = [u["id"] for u in self.dataset.users if u["id"] != user["id"]]
+        self.dataset.members[2] = others
+        # Let the previous test's last request land before counting
+        self.requests()
+        self.redmine.reset()
+
+        html = self.portfolio(filter={"assignee": user["name"]})
+        self.assertIn(f"Benchmark ({len(self.open_issues(user['name']))} issues)", html)
+        self.assertIn(f"Failed: Unknown assignee: {user['name']}", html)
+        # Memberships were read for each project, reference tables once
+        self.assertEqual(self.requests("GET /projects/:id/memberships.json"), 2)
+
+    def test_first_project_membership_does_not_decide_for_the_others(self):
+        user = self.dataset.users[3]
+        self.dataset.members[1] = [self.dataset.users[0]["id"]]
+
+        html = self.portfolio(filter={"assignee": user["name"]})
+        self.assertIn("Project 002 (0 issues)", html)
+        self.assertEqual(len(re.findall(r"Failed: Unknown assignee", html)), 1)
+
+    def test_a_filter_no_project_accepts_is_an_error(self):
+        result = self.dashboard_tool.execute({"projects": ["Benchmark"], "filter": {"assignee": "Nobody"}})
+        self.assertFalse(result["success"])
+        self.assertIn("Unknown assignee: Nobody", result["error"])
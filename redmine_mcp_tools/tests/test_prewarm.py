@@ -0,0 +1,57 @@
+import os
+import threading
+from unittest import mock
+
+from redmine_mcp_tools.assistant_tools import prewarm
+from redmine_mcp_tools.assistant_tools.mcp_custom_tools import RedmineIssueTool
+from redmine_mcp_tools.assistant_tools.project_catalog import get_project_catalog
+from redmine_mcp_tools.tests.utils import API_KEY, FakeRedmineTestCase
+
+
+class TestPrewarm(FakeRedmineTestCase):
+    def setUp(self):
+        super().setUp()
+        # prewarm() builds its own tool, configured from the environment
+        patcher = mock.patch.dict(os.environ, {"REDMINE_API_URL": self.url, "REDMINE_API_KEY": API_KEY})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(prewarm, "_warmed_pid", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def join_prewarm(self):
+        for thread in threading.enumerate():
+            if thread.name == "redmine-prewarm":
+                thread.join(timeout=30)
+
+    def test_config_is_read_when_used(self):
+        tool = RedmineIssueTool()
+        self.assertEqual(tool.REDMINE_API_URL, self.url)
+        with mock.patch.dict(os.environ, {"REDMINE_API_URL": "http://elsewhere.invalid"}):
+            self.assertEqual(tool.REDMINE_API_URL, "http://elsewhere.invalid")
+
+    def test_prewarm_fetches_reference_data(self):
+        prewarm.prewarm()
+        self.assertEqual(self.requests("GET /issue_statuses.json"), 1)
+        self.assertEqual(self.requests("GET /enumerations/issue_priorities.json"), 1)
+        self.assertTrue(get_project_catalog(self.url, API_KEY).loaded_at)
+
+    def test_hook_warms_once_per_process(self):
+        with mock.patch.dict(os.environ, {"REDMINE_PREWARM": "1"}):
+            prewarm.prewarm_once()
+            self.join_prewarm()
+            prewarm.prewarm_once()
+            self.join_prewarm()
+        self.assertEqual(self.requests("GET /issue_statuses.json"), 1)
+
+    def test_hook_is_off_by_default(self):
+        prewarm.prewarm_once()
+        self.join_prewarm()
+        self.assertEqual(self.requests(), 0)
+
+    def test_failed_warm_up_is_ignored(self):
+        failing = mock.Mock(side_effect=ConnectionError("Redmine unreachable"))
+        with mock.patch.dict(os.environ, {"REDMINE_PREWARM": "1"}), mock.patch.object(prewarm, "prewarm", failing):
+            prewarm.prewarm_once()
+            self.join_prewarm()
+        failing.assert_called_once_with()
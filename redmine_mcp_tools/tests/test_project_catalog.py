@@ -0,0 +1,68 @@
+import threading
+import unittest
+
+from redmine_mcp_tools.assistant_tools.project_catalog import ProjectCatalog
+
+
+def _project(project_id, name, parent=None):
+    project = {"id": project_id, "identifier": f"p{project_id}", "name": name}
+    if parent:
+        project["parent"] = {"id": parent}
+    return project
+
+
+class ListedCatalog(ProjectCatalog):
+    """Catalog over an in-memory project list instead of /projects.json"""
+
+    def __init__(self, projects, **kwargs):
+        super().__init__("http://redmine.invalid", "key", **kwargs)
+        self.projects = projects
+        self.loads = 0
+
+    def _fetch_all(self):
+        self.loads += 1
+        return list(self.projects)
+
+
+class TestProjectCatalog(unittest.TestCase):
+    def test_unknown_name_reloads_once(self):
+        catalog = ListedCatalog([_project(1, "Alpha")], miss_interval=0)
+        self.assertEqual(catalog.get("Alpha")["id"], 1)
+        catalog.projects.append(_project(2, "Beta"))
+        self.assertEqual(catalog.get("beta")["id"], 2)
+        self.assertEqual(catalog.loads, 2)
+        self.assertIsNone(catalog.get("Gamma"))
+        self.assertEqual(catalog.loads, 3)
+
+    def test_misses_within_the_interval_do_not_reload(self):
+        catalog = ListedCatalog([_project(1, "Alpha")], miss_interval=60)
+        for _attempt in range(3):
+            self.assertIsNone(catalog.get("Missing"))
+        self.assertEqual(catalog.loads, 1)
+
+    def test_lookups_read_one_snapshot_during_reloads(self):
+        small = [_project(1, "Alpha"), _project(2, "Alpha child", parent=1)]
+        large = small + [_project(i, f"Alpha {i}", parent=1) for i in range(3, 200)]
+        catalog = ListedCatalog(small)
+        catalog.get("Alpha")
+        stop = threading.Event()
+        errors = []
+
+        def reload():
+            try:
+                while not stop.is_set():
+                    catalog.projects = large if catalog.projects is small else small
+                    catalog.refresh()
+            except Exception as e:
+                errors.append(e)
+
+        worker = threading.Thread(target=reload)
+        worker.start()
+        try:
+            for _attempt in range(300):
+                self.assertIn(len(catalog.search("alpha")), (2, 199))
+                self.assertIn(len(catalog.subprojects(1)), (1, 198))
+        finally:
+            stop.set()
+            worker.join()
+        self.assertEqual(errors, [])
@@ -0,0 +1,96 @@
+import unittest
+
+from redmine_mcp_tools.assistant_tools.projection import (
+    ISSUE_PRESETS, PROJECT_PRESETS, flatten, resolve_fields, shape_result
+)
+
+ISSUES = [
+    {"id": 2, "subject": "Login fails", "status": {"id": 1, "name": "New", "is_closed": False},
+     "priority": {"id": 2, "name": "Normal"}, "assigned_to": {"id": 100, "name": "User 00"},
+     "due_date": None, "description": "Steps...", "custom_fields": [{"id": 5, "name": "Team", "value": "A"}]},
+    {"id": 1, "subject": "Add export", "status": {"id": 5, "name": "Closed", "is_closed": True},
+     "priority": {"id": 3, "name": "High"}, "due_date": "2026-10-20"},
+]
+
+
+def ok(payload):
+    return {"success": True, "result": payload}
+
+
+class TestFlatten(unittest.TestCase):
+    def test_references_collapse_to_their_name(self):
+        self.assertEqual(flatten({"id": 1, "name": "New"}), "New")
+        self.assertEqual(flatten({"id": 5, "name": "Closed", "is_closed": True}), "Closed")
+        self.assertEqual(flatten({"id": 7}), 7)
+        self.assertEqual(flatten([{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]), ["a", "b"])
+
+    def test_richer_objects_are_kept(self):
+        custom_field = {"id": 5, "name": "Team", "value": "A"}
+        self.assertEqual(flatten(custom_field), custom_field)
+        self.assertEqual(flatten("text"), "text")
+        self.assertIsNone(flatten(None))
+
+
+class TestResolveFields(unittest.TestCase):
+    def test_presets_strings_and_lists(self):
+        self.assertEqual(resolve_fields("minimal", ISSUE_PRESETS), ISSUE_PRESETS["minimal"])
+        self.assertEqual(resolve_fields("detail", PROJECT_PRESETS), PROJECT_PRESETS["detail"])
+        self.assertEqual(resolve_fields("id, subject,", ISSUE_PRESETS), ("id", "subject"))
+        self.assertEqual(resolve_fields(["id", "status"], ISSUE_PRESETS), ("id", "status"))
+        self.assertIsNone(resolve_fields(None, ISSUE_PRESETS))
+        self.assertIsNone(resolve_fields("", ISSUE_PRESETS))
+
+
+class TestShapeResult(unittest.TestCase):
+    def shape(self, fields=None, fmt=None, payload=None):
+        payload = payload or {"issues": ISSUES, "total_count": 2, "offset": 0, "limit": 25}
+        return shape_result(ok(payload), "issues", fields, fmt, ISSUE_PRESETS)
+
+    def test_untouched_without_fields_or_format(self):
+        result = ok({"issues": ISSUES})
+        self.assertIs(shape_result(result, "issues", None, None, ISSUE_PRESETS), result)
+        self.assertIs(shape_result(result, "issues", None, "full", ISSUE_PRESETS), result)
+
+    def test_minimal_records(self):
+        shaped = self.shape("minimal", "records")["result"]
+        self.assertEqual(shaped["total_count"], 2)
+        self.assertEqual(shaped["issues"][0], {
+            "id": 2, "subject": "Login fails", "status": "New", "assigned_to": "User 00",
+            "priority": "Normal", "due_date": None,
+        })
+        # Requested fields are always present, missing ones as None
+        self.assertIsNone(shaped["issues"][1]["assigned_to"])
+
+    def test_records_without_fields_flatten_every_key(self):
+        issue = self.shape(fmt="records")["result"]["issues"][0]
+        self.assertEqual(set(issue), set(ISSUES[0]))
+        self.assertEqual(issue["status"], "New")
+        self.assertEqual(issue["custom_fields"], ISSUES[0]["custom_fields"])
+
+    def test_columnar(self):
+        table = self.shape("id,status,due_date", "columnar")["result"]["issues"]
+        self.assertEqual(table, {
+            "columns": ["id", "status", "due_date"],
+            "rows": [[2, "New", None], [1, "Closed", "2026-10-20"]],
+        })
+
+    def test_columnar_without_fields_uses_the_union_of_keys(self):
+        table = self.shape(fmt="columnar")["result"]["issues"]
+        self.assertEqual(table["columns"], list(ISSUES[0]))
+        self.assertEqual(len(table["rows"]), 2)
+        self.assertTrue(all(len(row) == len(table["columns"]) for row in table["rows"]))
+
+    def test_single_object(self):
+        result = shape_result(ok({"issue": ISSUES[0]}), "issue", "id,status", "records", ISSUE_PRESETS)
+        self.assertEqual(result["result"], {"issue": {"id": 2, "status": "New"}})
+
+    def test_errors_pass_through_and_unknown_formats_fail(self):
+        failure = {"success": False, "error": "HTTP Error 404"}
+        self.assertIs(shape_result(failure, "issues", "minimal", "columnar", ISSUE_PRESETS), failure)
+        result = self.shape("minimal", "csv")
+        self.assertFalse(result["success"])
+        self.assertIn("csv", result["error"])
+
+    def test_original_payload_is_not_modified(self):
+        self.shape("minimal", "columnar")
+        self.assertEqual(ISSUES[0]["status"], {"id": 1, "name": "New", "is_closed": False})
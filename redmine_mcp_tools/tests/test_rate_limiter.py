@@ -0,0 +1,133 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from redmine_mcp_tools.assistant_tools.rate_limiter import KEY_PREFIX, AdaptiveLimiter, retry_after_seconds
+
+HOST = "redmine.test"
+
+
+class FakeCache:
+    """The value and counter commands the limiter uses, in memory (expiry is ignored)"""
+
+    def __init__(self):
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def get_value(self, key):
+        return self.values.get(key)
+
+    def set_value(self, key, value, expires_in_sec=None):
+        self.values[key] = value
+
+    def incr(self, key):
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + 1
+            return self.values[key]
+
+    def expire(self, key, seconds):
+        pass
+
+
+def respond(limiter, status, latency=0.0):
+    started = limiter.acquire(HOST)
+    limiter.release(started - latency, status)
+
+
+class TestAimd(unittest.TestCase):
+    def test_errors_halve_the_limit_once_per_window(self):
+        limiter = AdaptiveLimiter(max_concurrency=16)
+        respond(limiter, 503)
+        self.assertEqual(limiter.limit, 8)
+        # A burst of failures from the same window counts once
+        respond(limiter, 500)
+        respond(limiter, None)
+        self.assertEqual(limiter.limit, 8)
+
+    def test_limit_never_drops_below_the_minimum(self):
+        limiter = AdaptiveLimiter(max_concurrency=4, min_concurrency=2)
+        for _ in range(3):
+            limiter._last_decrease = 0.0
+            respond(limiter, 429)
+        self.assertEqual(limiter.limit, 2)
+
+    def test_healthy_responses_grow_the_limit_by_one_per_window(self):
+        limiter = AdaptiveLimiter(max_concurrency=16)
+        limiter.limit = 4.0
+        for _ in range(4):
+            respond(limiter, 200)
+        self.assertAlmostEqual(limiter.limit, 5, delta=0.2)
+        for _ in range(200):
+            respond(limiter, 200)
+        self.assertEqual(limiter.limit, 16)
+
+    def test_slow_responses_count_as_congestion(self):
+        limiter = AdaptiveLimiter(max_concurrency=16, target_latency=0.5)
+        respond(limiter, 200, latency=1.0)
+        self.assertEqual(limiter.limit, 8)
+
+    def test_in_flight_requests_are_capped_by_the_limit(self):
+        limiter = AdaptiveLimiter(max_concurrency=2)
+        started = [limiter.acquire(HOST), limiter.acquire(HOST)]
+        admitted = threading.Event()
+        worker = threading.Thread(target=lambda: (limiter.acquire(HOST), admitted.set()))
+        worker.start()
+        self.assertFalse(admitted.wait(0.2))
+        limiter.release(started.pop(), 200)
+        self.assertTrue(admitted.wait(1))
+        worker.join()
+
+
+class TestRetryAfter(unittest.TestCase):
+    def test_header_values(self):
+        self.assertEqual(retry_after_seconds("3"), 3.0)
+        self.assertEqual(retry_after_seconds("-1"), 0.0)
+        self.assertIsNone(retry_after_seconds(None))
+        self.assertIsNone(retry_after_seconds("soon"))
+        self.assertEqual(retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+
+    def test_pause_holds_back_the_next_request(self):
+        limiter = AdaptiveLimiter(max_concurrency=4)
+        limiter.throttled(HOST, 0.3)
+        started = time.monotonic()
+        limiter.acquire(HOST)
+        self.assertGreaterEqual(time.monotonic() - started, 0.25)
+
+    def test_pause_is_capped_by_max_wait(self):
+        limiter = AdaptiveLimiter(max_concurrency=4, max_wait=0.2)
+        limiter.throttled(HOST, 3600)
+        started = time.monotonic()
+        limiter.acquire(HOST)
+        self.assertLess(time.monotonic() - started, 1)
+
+    def test_pause_is_shared_with_other_workers(self):
+        cache = FakeCache()
+        with mock.patch("frappe.cache", return_value=cache, create=True):
+            AdaptiveLimiter(max_concurrency=4).throttled(HOST, 0.3)
+            self.assertIn(f"{KEY_PREFIX}|pause|{HOST}", cache.values)
+            # A limiter in another worker never saw the 429 itself
+            started = time.monotonic()
+            AdaptiveLimiter(max_concurrency=4).acquire(HOST)
+        self.assertGreaterEqual(time.monotonic() - started, 0.25)
+
+
+class TestSharedRate(unittest.TestCase):
+    def test_workers_share_one_per_second_budget(self):
+        cache = FakeCache()
+        workers = [AdaptiveLimiter(max_concurrency=4, rate=2) for _ in range(2)]
+        with mock.patch("frappe.cache", return_value=cache, create=True):
+            for limiter in (workers[0], workers[1], workers[0]):
+                respond(limiter, 200)
+        counters = {key: count for key, count in cache.values.items() if key.startswith(f"{KEY_PREFIX}|rate|")}
+        # Three admissions at two per second need at least two one-second windows
+        self.assertGreaterEqual(len(counters), 2)
+        self.assertEqual(sum(min(count, 2) for count in counters.values()), 3)
+
+    def test_local_bucket_without_redis(self):
+        limiter = AdaptiveLimiter(max_concurrency=4, rate=5)
+        started = time.monotonic()
+        for _ in range(7):
+            respond(limiter, 200)
+        # Five tokens up front, then about one every 0.2 s
+        self.assertGreaterEqual(time.monotonic() - started, 0.3)
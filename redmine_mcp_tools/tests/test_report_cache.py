@@ -0,0 +1,126 @@
+import unittest
+from datetime import date, timedelta
+from unittest import mock
+
+import frappe
+
+from redmine_mcp_tools.assistant_tools import report_cache
+from redmine_mcp_tools.assistant_tools.mcp_custom_tools import RedmineDashboardTool
+from redmine_mcp_tools.assistant_tools.report_cache import ReportCache
+from redmine_mcp_tools.tests.utils import FakeRedmineTestCase
+
+
+class FakeCache:
+    """The value commands ReportCache uses, in memory (expiry is ignored)"""
+
+    def __init__(self):
+        self.values = {}
+
+    def get_value(self, key):
+        return self.values.get(key)
+
+    def set_value(self, key, value, expires_in_sec=None):
+        self.values[key] = value
+
+
+class Tomorrow(date):
+    @classmethod
+    def today(cls):
+        return date.today() + timedelta(days=1)
+
+
+class TestDashboardReportCache(FakeRedmineTestCase):
+    env = {"REDMINE_REPORT_CACHE": "1"}
+
+    def setUp(self):
+        super().setUp()
+        self.cache = FakeCache()
+        for patcher in (
+            mock.patch("frappe.cache", return_value=self.cache, create=True),
+            mock.patch.object(frappe.local, "site", "test.local", create=True),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def render(self):
+        result = self.dashboard_tool.execute({"project_name": "Benchmark"})
+        self.assertTrue(result["success"], result)
+        return result["result"]
+
+    def render_uncached(self):
+        with mock.patch.dict("os.environ", {"REDMINE_REPORT_CACHE": "0"}):
+            return self.render()
+
+    def render_counting_reuse(self):
+        """Render and return the page with the number of reused sections"""
+        reused = []
+        original = RedmineDashboardTool._iter_frame_sections
+
+        def spy(tool, frame, reuse=None):
+            reused.append(len(reuse or {}))
+            return original(tool, frame, reuse)
+
+        with mock.patch.object(RedmineDashboardTool, "_iter_frame_sections", spy):
+            html = self.render()
+        return html, reused
+
+    def update_one_open_issue(self):
+        issue = next(i for i in self.dataset.issues
+                     if i.get("assigned_to") and i["status"]["id"] not in self.dataset.closed_ids)
+        with self.redmine._lock:
+            self.dataset.update(issue, {"subject": issue["subject"] + " (edited)"})
+        return issue
+
+    def test_unchanged_fingerprint_serves_the_stored_page(self):
+        first = self.render()
+        self.redmine.reset()
+        self.assertEqual(self.render(), first)
+        # Only the limit=1 fingerprint probe reached Redmine
+        self.assertEqual(self.requests("GET /issues.json"), 1)
+
+    def test_only_the_changed_assignees_section_is_rendered_again(self):
+        _, reused = self.render_counting_reuse()
+        self.assertEqual(reused, [0])
+        sections = len(next(iter(self.cache.values.values()))["sections"])
+        self.assertGreater(sections, 2)
+
+        self.update_one_open_issue()
+        html, reused = self.render_counting_reuse()
+        self.assertEqual(reused, [sections - 1])
+        self.assertEqual(html, self.render_uncached())
+
+    def test_date_rollover_renders_everything_again(self):
+        self.render()
+        with mock.patch.object(report_cache, "date", Tomorrow):
+            _, reused = self.render_counting_reuse()
+        # Overdue labels depend on the day, so no stored section is trusted
+        self.assertEqual(reused, [0])
+
+
+class TestReportCacheStore(unittest.TestCase):
+    def setUp(self):
+        self.cache = FakeCache()
+        patcher = mock.patch("frappe.cache", return_value=self.cache, create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_page_and_sections_are_stored_when_they_fit(self):
+        ReportCache(ttl=60, max_bytes=100).put("k", [1], "x" * 40, {"sig": "y" * 40})
+        self.assertEqual(self.cache.get_value("k")["sections"], {"sig": "y" * 40})
+
+    def test_sections_are_dropped_when_page_and_sections_do_not_fit(self):
+        ReportCache(ttl=60, max_bytes=100).put("k", [1], "x" * 60, {"sig": "y" * 60})
+        stored = self.cache.get_value("k")
+        self.assertEqual(stored["html"], "x" * 60)
+        self.assertEqual(stored["sections"], {})
+
+    def test_oversized_pages_are_not_stored(self):
+        ReportCache(ttl=60, max_bytes=100).put("k", [1], "x" * 101, {})
+        self.assertIsNone(self.cache.get_value("k"))
+
+    def test_fingerprint_includes_the_date(self):
+        probe = {"total_count": 3, "issues": [{"updated_on": "2026-10-18T10:00:00Z"}]}
+        today = report_cache.issue_fingerprint(probe)
+        with mock.patch.object(report_cache, "date", Tomorrow):
+            self.assertNotEqual(report_cache.issue_fingerprint(probe), today)
+        self.assertEqual(today[:2], [3, "2026-10-18T10:00:00Z"])
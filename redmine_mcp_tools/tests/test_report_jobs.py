@@ -0,0 +1,77 @@
+import unittest
+from unittest import mock
+
+import frappe
+
+from redmine_mcp_tools.assistant_tools import report_jobs
+
+URL, KEY = "http://redmine.invalid", "key"
+
+
+class FakeCache:
+    """The string commands report_jobs uses, in memory"""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.values:
+            return False
+        self.values[key] = value.encode() if isinstance(value, str) else value
+        return True
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+
+class TestReportJobOwner(unittest.TestCase):
+    def setUp(self):
+        self.cache = FakeCache()
+        self.enqueue = mock.Mock()
+        for patcher in (
+            mock.patch("frappe.cache", return_value=self.cache, create=True),
+            mock.patch("frappe.enqueue", self.enqueue, create=True),
+            mock.patch.object(frappe.local, "site", "test.local", create=True),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.as_user("alice@example.com")
+
+    def as_user(self, user):
+        patcher = mock.patch.object(frappe, "session", mock.Mock(user=user), create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def submit(self):
+        result = report_jobs.submit_report_job(URL, KEY, {"project_name": "Alpha", "background": True})
+        self.assertTrue(result["success"], result)
+        return result["result"]
+
+    def test_owner_reads_the_job(self):
+        job = self.submit()
+        result = report_jobs.get_report(job["job_id"], URL, KEY)
+        self.assertTrue(result["success"])
+        self.assertEqual(result["result"]["status"], "queued")
+
+    def test_other_user_with_the_same_credentials_cannot(self):
+        job = self.submit()
+        self.as_user("mallory@example.com")
+        result = report_jobs.get_report(job["job_id"], URL, KEY)
+        self.assertFalse(result["success"])
+        self.assertIn("not found", result["error"])
+
+    def test_other_credentials_cannot(self):
+        job = self.submit()
+        self.assertFalse(report_jobs.get_report(job["job_id"], URL, "other-key")["success"])
+
+    def test_identical_requests_attach_per_user(self):
+        first = self.submit()
+        self.assertTrue(self.submit()["attached"])
+        self.as_user("bob@example.com")
+        second = self.submit()
+        self.assertFalse(second["attached"])
+        self.assertNotEqual(first["job_id"], second["job_id"])
+        self.assertEqual(self.enqueue.call_count, 2)
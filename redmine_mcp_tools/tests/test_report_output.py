@@ -0,0 +1,25 @@
+import os
+import tempfile
+import unittest
+
+from redmine_mcp_tools.assistant_tools.report_output import report_file_name, write_report
+
+
+class TestWriteReport(unittest.TestCase):
+    def test_writes_chunks(self):
+        result = write_report(iter(["<html>", "é", "</html>"]), report_file_name("Write test"))
+        self.addCleanup(os.unlink, result["file_path"])
+        with open(result["file_path"], encoding="utf-8") as fh:
+            self.assertEqual(fh.read(), "<html>é</html>")
+        self.assertEqual(result["bytes"], len("<html>é</html>".encode("utf-8")))
+
+    def test_failed_render_leaves_no_partial_file(self):
+        file_name = report_file_name("Failing render")
+
+        def chunks():
+            yield "<html>"
+            raise RuntimeError("render failed")
+
+        with self.assertRaises(RuntimeError):
+            write_report(chunks(), file_name)
+        self.assertFalse(os.path.exists(os.path.join(tempfile.gettempdir(), file_name)))
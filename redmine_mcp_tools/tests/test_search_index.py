@@ -0,0 +1,105 @@
+import os
+import sys
+import threading
+from unittest import mock
+
+from redmine_mcp_tools.assistant_tools.search_index import SearchIndex, get_search_index
+from redmine_mcp_tools.tests.utils import API_KEY, FakeRedmineTestCase
+
+
+class TestRankedSearch(FakeRedmineTestCase):
+    env = {"REDMINE_SEARCH_INDEX_TTL": "0", "REDMINE_SEARCH_INDEX_RECONCILE_INTERVAL": "0"}
+
+    def search(self, query):
+        result = self.issue_tool.execute({
+            "action": "search_issues", "query": query, "mode": "ranked", "project_id": self.project
+        })
+        self.assertTrue(result["success"], result)
+        return result["result"]["issues"]
+
+    def test_updates_are_picked_up_incrementally(self):
+        created = self.issue_tool.execute({
+            "action": "create_issue", "project_name": "Benchmark", "subject": "Quokka migration plan"
+        })
+        issue_id = created["result"]["issue"]["id"]
+        self.assertEqual(self.search("quokka")[0]["id"], issue_id)
+
+        self.issue_tool.execute({"action": "update_issue", "issue_id": issue_id,
+                                 "updates": {"subject": "Wombat migration plan"}})
+        self.redmine.reset()
+        self.assertEqual(self.search("wombat")[0]["id"], issue_id)
+        self.assertEqual(self.search("quokka"), [])
+        # Each refresh asked only for issues updated since the watermark, plus the reconcile count probe
+        self.assertLessEqual(self.requests("GET /issues.json"), 4)
+
+    def test_notes_flag_accepts_true(self):
+        with mock.patch.dict(os.environ, {"REDMINE_SEARCH_INDEX_NOTES": "true"}):
+            index = get_search_index(self.url, API_KEY, "notes-flag-project")
+        self.assertTrue(index.index_notes)
+
+    def test_notes_are_indexed_by_default(self):
+        with mock.patch.dict(os.environ):
+            os.environ.pop("REDMINE_SEARCH_INDEX_NOTES", None)
+            index = get_search_index(self.url, API_KEY, "notes-default-project")
+        self.assertTrue(index.index_notes)
+
+    def test_deleted_issues_drop_out_of_the_index(self):
+        created = self.issue_tool.execute({
+            "action": "create_issue", "project_name": "Benchmark", "subject": "Quokka retirement plan"
+        })
+        issue_id = created["result"]["issue"]["id"]
+        self.assertEqual(self.search("quokka")[0]["id"], issue_id)
+
+        with self.redmine._lock:
+            self.dataset.issues.remove(self.dataset.by_id.pop(issue_id))
+            self.dataset.version += 1
+        self.assertEqual(self.search("quokka"), [])
+
+    def test_reconcile_lists_ids_only_when_counts_disagree(self):
+        self.search("quokka")
+        self.redmine.reset()
+        self.search("quokka")
+        # Delta scan plus the limit=1 count probe; no id listing
+        self.assertEqual(self.requests("GET /issues.json"), 2)
+
+    def test_filters_are_rejected_instead_of_ignored(self):
+        for extra in ({"filter": {"status": "closed"}}, {"status_id": "closed"}):
+            result = self.issue_tool.execute({
+                "action": "search_issues", "query": "login", "mode": "ranked", "project_id": self.project, **extra
+            })
+            self.assertFalse(result["success"])
+            self.assertIn(next(iter(extra)), result["error"])
+
+
+class TestSearchDuringCompaction(FakeRedmineTestCase):
+    def test_search_is_consistent_while_compacting(self):
+        index = SearchIndex(None, ttl=0, index_notes=False)
+        for issue in self.dataset.issues:
+            index._add(issue, [])
+        errors = []
+        stop = threading.Event()
+
+        def churn():
+            try:
+                while not stop.is_set():
+                    with index._lock:
+                        for issue in self.dataset.issues[:50]:
+                            index._add(issue, [])
+                        index._compact()
+            except Exception as e:
+                errors.append(e)
+
+        worker = threading.Thread(target=churn)
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        worker.start()
+        try:
+            for _ in range(200):
+                result = index.search("login page", limit=10)
+                for row in result["issues"]:
+                    self.assertEqual(row["subject"], self.dataset.by_id[row["id"]]["subject"])
+        finally:
+            stop.set()
+            worker.join()
+            sys.setswitchinterval(interval)
+        self.assertEqual(errors, [])
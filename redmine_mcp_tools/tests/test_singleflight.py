@@ -0,0 +1,142 @@
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+from redmine_mcp_tools.assistant_tools import singleflight
+from redmine_mcp_tools.assistant_tools.singleflight import KEY_PREFIX, SingleFlight
+from redmine_mcp_tools.tests.utils import FakeRedmineTestCase
+
+
+class FakeRedis:
+    """The string commands the shared lock and result slot use (expiry is ignored)"""
+
+    def __init__(self):
+        self.values = {}
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and key in self.values:
+            return False
+        self.values[key] = str(value).encode()
+        return True
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def exists(self, key):
+        return int(key in self.values)
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+
+class TestInProcessCoalescing(unittest.TestCase):
+    def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls, results = [], []
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            return {"success": True, "result": {"id": 1}}
+
+        threads = [threading.Thread(target=lambda: results.append(flight.do("k", fetch))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_followers_receive_the_leaders_exception(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        errors = []
+
+        def fetch():
+            release.wait(5)
+            raise ConnectionError("down")
+
+        def call():
+            try:
+                flight.do("k", fetch)
+            except ConnectionError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(errors), 4)
+
+    def test_later_calls_are_not_coalesced(self):
+        flight = SingleFlight()
+        calls = []
+        for _ in range(3):
+            flight.do("k", lambda: calls.append(1))
+        self.assertEqual(len(calls), 3)
+
+
+class TestSharedSlot(unittest.TestCase):
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = mock.patch("frappe.cache", return_value=self.redis, create=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_successful_results_are_stored(self):
+        SingleFlight(shared=True).do("k", lambda: {"success": True, "result": 1})
+        self.assertIn(f"{KEY_PREFIX}|result|k", self.redis.values)
+        self.assertNotIn(f"{KEY_PREFIX}|lock|k", self.redis.values)
+
+    def test_failures_are_not_stored(self):
+        SingleFlight(shared=True).do("k", lambda: {"success": False, "error": "HTTP 503"})
+        self.assertNotIn(f"{KEY_PREFIX}|result|k", self.redis.values)
+
+    def test_waiter_in_another_worker_reads_the_slot(self):
+        # Another worker holds the lock and has already published its result
+        self.redis.set(f"{KEY_PREFIX}|lock|k", 1)
+        self.redis.set(f"{KEY_PREFIX}|result|k", '{"success": true, "result": 7}')
+        calls = []
+        result = SingleFlight(shared=True, wait=1).do("k", lambda: calls.append(1))
+        self.assertEqual(result, {"success": True, "result": 7})
+        self.assertEqual(calls, [])
+
+    def test_waiter_fetches_itself_when_the_other_worker_failed(self):
+        # The lock is gone and no result was published
+        result = SingleFlight(shared=True, wait=1).do("k", lambda: {"success": True, "result": 2})
+        self.assertEqual(result["result"], 2)
+
+
+class TestSharedFailuresThroughTheTool(FakeRedmineTestCase):
+    def setUp(self):
+        super().setUp()
+        self.redis = FakeRedis()
+        for patcher in (mock.patch("frappe.cache", return_value=self.redis, create=True),
+                        mock.patch.object(singleflight, "_flight", SingleFlight(shared=True, wait=1)),
+                        mock.patch.object(singleflight, "_flight_pid", os.getpid())):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_an_error_response_is_not_replayed(self):
+        first = self.issue_tool.execute({"action": "get_issue", "issue_id": 999999})
+        second = self.issue_tool.execute({"action": "get_issue", "issue_id": 999999})
+        self.assertFalse(first["success"])
+        self.assertFalse(second["success"])
+        # Both calls reached Redmine; the 404 was not served from the result slot
+        self.assertEqual(self.requests(), 2)
+        self.assertFalse(any("|result|" in key for key in self.redis.values))
+
+    def test_a_successful_response_is_published(self):
+        issue_id = self.dataset.issues[0]["id"]
+        self.assertTrue(self.issue_tool.execute({"action": "get_issue", "issue_id": issue_id})["success"])
+        self.assertTrue(any("|result|" in key for key in self.redis.values))
@@ -0,0 +1,89 @@
+import unittest
+
+from redmine_mcp_tools.assistant_tools.subject_index import SubjectMatch, get_subject_index, is_confident, rank
+from redmine_mcp_tools.tests.utils import API_KEY, FakeRedmineTestCase
+
+
+def _best(query, subjects):
+    return rank(query, [{"id": i, "subject": s} for i, s in enumerate(subjects, 1)])
+
+
+class TestIsConfident(unittest.TestCase):
+    def test_look_alike_subjects_are_not_confident(self):
+        for query, subject in (
+            ("Login page crash", "Login page cache"),
+            ("Add export to PDF", "Add export to CSV"),
+            ("Fix login timeout", "Fix login timeout on SSO pages"),
+        ):
+            matches = _best(query, [subject])
+            self.assertFalse(is_confident(matches, for_write=True), (query, subject))
+            self.assertFalse(is_confident(matches), (query, subject))
+
+    def test_exact_normalized_match_is_confident(self):
+        matches = _best("  login PAGE   crash ", ["Login page crash", "Login page cache"])
+        self.assertTrue(is_confident(matches, for_write=True))
+
+    def test_duplicate_exact_subjects_are_ambiguous(self):
+        matches = _best("Login page crash", ["Login page crash", "Login page crash"])
+        self.assertFalse(is_confident(matches, for_write=True))
+
+    def test_no_candidates(self):
+        self.assertFalse(is_confident([]))
+        self.assertFalse(is_confident([SubjectMatch(1, "x", 0.5)]))
+
+
+class TestSubjectResolution(FakeRedmineTestCase):
+    def create(self, subject):
+        result = self.issue_tool.execute({"action": "create_issue", "project_name": "Benchmark", "subject": subject})
+        self.assertTrue(result["success"], result)
+        return result["result"]["issue"]["id"]
+
+    def test_exact_subject_resolves(self):
+        issue = self.dataset.by_id[42]
+        result = self.issue_tool.execute({
+            "action": "get_issue", "issue_subject": issue["subject"].upper(), "project_id": self.project
+        })
+        self.assertTrue(result["success"], result)
+        self.assertEqual(result["result"]["issue"]["id"], 42)
+
+    def test_unrelated_subject_does_not_resolve(self):
+        result = self.issue_tool.execute({
+            "action": "get_issue", "issue_subject": "Completely unrelated words xyz", "project_id": self.project
+        })
+        self.assertFalse(result["success"])
+        self.assertIn("Could not resolve issue identifier", result["error"])
+
+    def test_fuzzy_write_fails_with_candidates(self):
+        issue_id = self.create("Add export to CSV")
+        result = self.issue_tool.execute({
+            "action": "add_note_to_issue", "issue_subject": "Add export to PDF",
+            "project_id": self.project, "note": "Should not be posted"
+        })
+        self.assertFalse(result["success"])
+        self.assertIn(issue_id, [c["issue_id"] for c in result["candidates"]])
+        self.assertNotIn(issue_id, self.dataset.journals)
+
+    def test_new_issue_resolves_before_the_index_ttl(self):
+        # Build the project's index, then create an issue it has not seen
+        self.issue_tool.execute({"action": "get_issue", "issue_subject": "warm up", "project_id": self.project})
+        issue_id = self.create("Refund request for customer Acme")
+        result = self.issue_tool.execute({
+            "action": "add_note_to_issue", "issue_subject": "Refund request for customer Acme",
+            "project_id": self.project, "note": "Refund approved"
+        })
+        self.assertTrue(result["success"], result)
+        self.assertIn(issue_id, get_subject_index(self.url, API_KEY, self.project, None).subjects)
+        journals = self.dataset.journals[issue_id]
+        self.assertEqual(journals[-1]["notes"], "Refund approved")
+
+    def test_batch_reports_candidates_per_operation(self):
+        self.create("Invoice totals wrong for EUR")
+        result = self.issue_tool.execute({"action": "batch", "operations": [
+            {"action": "add_note_to_issue", "issue_subject": "Invoice totals wrong for USD",
+             "project_id": self.project, "note": "n"},
+            {"action": "add_note_to_issue", "issue_id": 7, "note": "n"},
+        ]})
+        first, second = result["result"]["operations"]
+        self.assertFalse(first["success"])
+        self.assertTrue(first["candidates"])
+        self.assertTrue(second["success"])
@@ -0,0 +1,77 @@
+import re
+from unittest import mock
+
+from redmine_mcp_tools.tests.utils import API_KEY, FakeRedmineTestCase
+
+HEADERS = {"X-Redmine-API-Key": API_KEY}
+
+
+class TestSummaryCounts(FakeRedmineTestCase):
+    issues = 500
+
+    def setUp(self):
+        super().setUp()
+        self.timeout = self.dashboard_tool.default_config["timeout"]
+
+    def expected_counts(self, query=""):
+        """The summary's per-assignee counts, computed from a full fetch"""
+        issues = self.dashboard_tool._fetch_all_issues(1, HEADERS, self.timeout, None, query)
+        users = {}
+        for issue in issues:
+            name = (issue.get("assigned_to") or {}).get("name") or "Unassigned"
+            counts = users.setdefault(name, {"total": 0, "priority": {}, "status": {}})
+            counts["total"] += 1
+            for dimension in ("priority", "status"):
+                label = issue[dimension]["name"]
+                counts[dimension][label] = counts[dimension].get(label, 0) + 1
+        return len(issues), users
+
+    def spy_issue_requests(self, endpoints):
+        """Patch _get_json to record every /issues.json endpoint into `endpoints`"""
+        get_json = self.dashboard_tool._get_json
+
+        def spy(endpoint, headers, timeout):
+            if endpoint.startswith("/issues.json"):
+                endpoints.append(endpoint)
+            return get_json(endpoint, headers, timeout)
+
+        return mock.patch.object(self.dashboard_tool, "_get_json", spy)
+
+    def summary(self, base_query=""):
+        """Summary counts and every /issues.json endpoint they requested"""
+        endpoints = []
+        with self.spy_issue_requests(endpoints):
+            summary = self.dashboard_tool._summary_counts(1, HEADERS, self.timeout, base_query=base_query)
+        return summary, endpoints
+
+    def assert_only_probes(self, endpoints):
+        self.assertTrue(endpoints)
+        for endpoint in endpoints:
+            self.assertRegex(endpoint, r"[?&]limit=1(&|$)")
+
+    def test_counts_match_a_full_fetch(self):
+        open_total, users = self.expected_counts()
+        summary, endpoints = self.summary()
+        self.assertEqual(summary["open_total"], open_total)
+        self.assertEqual(summary["unattributed"], 0)
+        self.assertEqual(summary["users"], users)
+        self.assert_only_probes(endpoints)
+
+    def test_filtered_counts_match_a_filtered_fetch(self):
+        open_total, users = self.expected_counts("tracker_id=1")
+        summary, endpoints = self.summary("tracker_id=1")
+        self.assertEqual(summary["open_total"], open_total)
+        self.assertEqual(summary["users"], users)
+        self.assert_only_probes(endpoints)
+        self.assertTrue(all("tracker_id=1" in endpoint for endpoint in endpoints))
+
+    def test_summary_dashboard_downloads_no_issue_pages(self):
+        endpoints = []
+        with self.spy_issue_requests(endpoints):
+            result = self.dashboard_tool.execute({"project_name": "Benchmark", "mode": "summary"})
+        self.assertTrue(result["success"], result)
+        self.assert_only_probes(endpoints)
+        open_total, users = self.expected_counts()
+        for name, counts in users.items():
+            self.assertIn(f"{name} ({counts['total']} open)", result["result"])
+        self.assertEqual(len(re.findall(r"open\)</h2>", result["result"])), len(users))
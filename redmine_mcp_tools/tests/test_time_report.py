@@ -0,0 +1,110 @@
+import unittest
+from collections import deque
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+from redmine_mcp_tools.assistant_tools import time_report
+from redmine_mcp_tools.assistant_tools.time_report import aggregate_time_entries
+from redmine_mcp_tools.tests.utils import FakeRedmineTestCase
+
+
+def _entry(entry_id):
+    return {"id": entry_id, "hours": 1.0, "spent_on": "2024-03-01",
+            "user": {"name": "Ann"}, "activity": {"name": "Dev"}, "issue": {"id": 1}}
+
+
+class ShiftingListing:
+    """Newest-first time entries; `on_request(n, entries)` edits the listing before request n is served"""
+
+    def __init__(self, count, on_request=None):
+        self.entries = [_entry(i) for i in range(count, 0, -1)]
+        self.on_request = on_request
+        self.served = 0
+
+    def __call__(self, endpoint):
+        self.served += 1
+        if self.on_request:
+            self.on_request(self.served, self.entries)
+        query = parse_qs(urlsplit(endpoint).query)
+        offset, limit = int(query["offset"][0]), int(query["limit"][0])
+        return {"time_entries": self.entries[offset:offset + limit], "total_count": len(self.entries)}
+
+
+class TestAggregateTimeEntries(unittest.TestCase):
+    def test_stable_listing_is_read_once(self):
+        fetch = ShiftingListing(250)
+        totals = aggregate_time_entries(fetch, "project_id=1", concurrency=1)
+        self.assertEqual((totals.entries, totals.hours, totals.complete), (250, 250.0, True))
+        self.assertEqual(fetch.served, 3)
+
+    def test_entry_logged_mid_scan_is_not_double_counted(self):
+        def log_one(served, entries):
+            if served == 2:
+                entries.insert(0, _entry(1000))
+
+        totals = aggregate_time_entries(ShiftingListing(250, log_one), "project_id=1", concurrency=1)
+        # Page two repeats the last entry of page one; the new entry is picked up on the re-read
+        self.assertEqual(totals.entries, 251)
+        self.assertEqual(totals.hours, 251.0)
+        self.assertTrue(totals.complete)
+
+    def test_entry_deleted_mid_scan_does_not_hide_its_neighbour(self):
+        def delete_one(served, entries):
+            if served == 2:
+                del entries[0]
+
+        totals = aggregate_time_entries(ShiftingListing(250, delete_one), "project_id=1", concurrency=1)
+        # Entry 150 moved onto page one after it was read; the re-read from scratch finds it
+        # and no longer counts the deleted entry
+        self.assertEqual(totals.entries, 249)
+        self.assertTrue(totals.complete)
+
+    def test_shift_with_an_unchanged_total_is_not_double_counted(self):
+        def log_one_delete_one(served, entries):
+            if served == 3:
+                entries.insert(0, _entry(1000))
+                entries.pop()
+
+        fetch = ShiftingListing(450, log_one_delete_one)
+        for entry in fetch.entries:
+            entry["hours"] = float(entry["id"])
+        totals = aggregate_time_entries(fetch, "project_id=1", concurrency=1)
+        # Page three repeats the last entry of page two; dropping it leaves the scan one
+        # short of total_count, so the listing is read again instead of trusting the sum
+        self.assertEqual(totals.entries, 450)
+        self.assertEqual(totals.hours, sum(entry["hours"] for entry in fetch.entries))
+        self.assertTrue(totals.complete)
+        self.assertEqual(fetch.served, 10)
+
+    def test_dedupe_memory_is_bounded_by_the_page_window(self):
+        windows = []
+        original = deque
+
+        def spy(*args, **kwargs):
+            window = original(*args, **kwargs)
+            windows.append(window)
+            return window
+
+        with mock.patch.object(time_report, "deque", spy):
+            aggregate_time_entries(ShiftingListing(2000), "project_id=1", concurrency=2)
+        # One window for the page prefetch, one for the dedupe ids; the latter keeps three pages
+        self.assertEqual([w.maxlen for w in windows if w.maxlen], [3])
+        self.assertLessEqual(sum(len(ids) for w in windows if w.maxlen for ids in w), 300)
+
+    def test_listing_that_keeps_changing_is_flagged(self):
+        def log_every_time(served, entries):
+            entries.insert(0, _entry(1000 + served))
+
+        totals = aggregate_time_entries(ShiftingListing(250, log_every_time), "project_id=1", concurrency=1)
+        self.assertFalse(totals.complete)
+        self.assertFalse(totals.tables()["complete"])
+
+
+class TestTimeReportAction(FakeRedmineTestCase):
+    def test_totals_match_the_dataset(self):
+        result = self.issue_tool.execute({"action": "time_report", "project_id": self.project, "concurrency": 3})
+        self.assertTrue(result["success"], result)
+        rows = self.dataset.time_entries()
+        self.assertEqual(result["result"]["entries"], len(rows))
+        self.assertAlmostEqual(result["result"]["total_hours"], round(sum(row[4] for row in rows), 2))
+        self.assertTrue(result["result"]["complete"])
@@ -0,0 +1,30 @@
+import asyncio
+
+from redmine_mcp_tools.tests.utils import FakeRedmineTestCase
+
+
+def _profiled_calls(result, name):
+    """ncalls of `name` in the cpu profile (0 when it is not listed)"""
+    for line in result["trace"]["profile"]["top"]:
+        if line.endswith(f"({name})"):
+            return int(line.split()[0].split("/")[-1])
+    return 0
+
+
+class TestCpuProfile(FakeRedmineTestCase):
+    issues = 150
+
+    def test_execute_async_is_profiled_on_the_worker(self):
+        result = asyncio.run(self.issue_tool.execute_async({"action": "get_issue", "issue_id": 3, "profile": "cpu"}))
+        self.assertTrue(result["success"], result)
+        self.assertTrue(_profiled_calls(result, "_make_request"))
+
+    def test_pool_workers_are_merged_into_the_profile(self):
+        # issue_lifecycle fetches one journal per issue on a thread pool
+        result = self.issue_tool.execute({"action": "issue_lifecycle", "project_id": self.project, "profile": "cpu"})
+        self.assertTrue(result["success"], result)
+        self.assertGreaterEqual(_profiled_calls(result, "_fetch_json"), self.issues)
+
+    def test_without_profile_the_result_keeps_its_shape(self):
+        result = asyncio.run(self.issue_tool.execute_async({"action": "get_issue", "issue_id": 3}))
+        self.assertNotIn("trace", result)
@@ -0,0 +1,79 @@
+"""
+Shared fixtures: the benchmark suite's fake Redmine served in-process and
+tool instances pointed at it.
+
+Caches that outlive a call (HTTP, report, journal, mirror) are switched off
+while a test case runs so each test sees the server's current data; a
+case can switch one back on through `env`.
+"""
+
+import os
+import time
+import unittest
+from typing import Any, Dict, Tuple
+from unittest import mock
+
+from redmine_mcp_tools.benchmarks.fake_redmine import BENCH_PROJECT, Dataset, FakeRedmine, serve
+
+API_KEY = "test-key"
+
+DEFAULT_ENV = {
+    "REDMINE_HTTP_CACHE": "0",
+    "REDMINE_REPORT_CACHE": "0",
+    "REDMINE_JOURNAL_CACHE": "0",
+    "REDMINE_MIRROR": "0",
+}
+
+
+def make_tools(url: str, api_key: str = API_KEY, page_size: int = 100) -> Tuple[Any, Any]:
+    """(RedmineIssueTool, RedmineDashboardTool) using the given Redmine instead of the .env one"""
+    from redmine_mcp_tools.assistant_tools.mcp_custom_tools import RedmineDashboardTool, RedmineIssueTool
+
+    issue_tool, dashboard_tool = RedmineIssueTool(), RedmineDashboardTool()
+    for tool in (issue_tool, dashboard_tool):
+        tool.REDMINE_API_URL = url
+        tool.REDMINE_API_KEY = api_key
+        tool.default_config.update(api_url=url, api_key=api_key)
+    dashboard_tool.default_config["page_size"] = page_size
+    return issue_tool, dashboard_tool
+
+
+class FakeRedmineTestCase(unittest.TestCase):
+    """Serves a seeded dataset for the whole class; request counters are reset before each test"""
+
+    issues = 300
+    max_limit = 100
+    error_rate = 0.0
+    env: Dict[str, str] = {}
+    project = BENCH_PROJECT
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._env = mock.patch.dict(os.environ, {**DEFAULT_ENV, **cls.env})
+        cls._env.start()
+        cls.dataset = Dataset(issues=cls.issues, projects=10, users=8)
+        cls.redmine = FakeRedmine(cls.dataset, max_limit=cls.max_limit, error_rate=cls.error_rate)
+        cls.server = serve(cls.redmine)
+        host, port = cls.server.server_address[:2]
+        cls.url = f"http://{host}:{port}"
+        cls.issue_tool, cls.dashboard_tool = make_tools(cls.url)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls._env.stop()
+        super().tearDownClass()
+
+    def setUp(self):
+        super().setUp()
+        self.redmine.reset()
+
+    def requests(self, endpoint: str = None) -> int:
+        """Upstream requests since the test started, optionally for one "METHOD /path" key"""
+        # The server counts a request after writing its response; let the last one land
+        time.sleep(0.05)
+        if endpoint is None:
+            return self.redmine.stats["requests"]
+        return self.redmine.stats["by_endpoint"].get(endpoint, 0)